@@ -0,0 +1,55 @@
+"""Number of micro-batches checked per second, with and without compiling the checks.
+
+Run with `python benchmarks/bench_compiled_validator.py`.
+"""
+
+import time
+from functools import partial
+
+import polars as pl
+
+import pelage as plg
+
+N_ROWS = 500
+DURATION = 2.0
+
+CHECKS = [
+    partial(plg.accepted_range, items={"price": (0, 1_000), "quantity": (1, 100)}),
+    partial(plg.accepted_values, items={"currency": ["EUR", "USD", "GBP"]}),
+    partial(plg.has_no_nulls, columns=["price", "currency"]),
+    partial(plg.has_no_infs, columns="price"),
+    partial(plg.custom_check, expression=pl.col("quantity") > 0),
+]
+
+
+def make_batch(n_rows: int) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "price": [float(i % 900) for i in range(n_rows)],
+            "quantity": [1 + i % 50 for i in range(n_rows)],
+            "currency": [("EUR", "USD", "GBP")[i % 3] for i in range(n_rows)],
+        }
+    )
+
+
+def calls_per_second(validate, batch: pl.DataFrame) -> float:
+    n_calls = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < DURATION:
+        validate(batch)
+        n_calls += 1
+    return n_calls / elapsed
+
+
+def run_each_check(batch: pl.DataFrame) -> pl.DataFrame:
+    for check in CHECKS:
+        check(batch)
+    return batch
+
+
+if __name__ == "__main__":
+    batch = make_batch(N_ROWS)
+    compiled = plg.compile_checks(CHECKS)
+
+    for name, validate in [("checks", run_each_check), ("compiled", compiled)]:
+        print(f"{name:>10}: {calls_per_second(validate, batch):>8.0f} calls/s")
@@ -0,0 +1,14 @@
+import pytest
+
+from pelage.deferred import _MIN_POLARS_VERSION
+from pelage.utils import _has_sufficient_polars_version
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # The example of `defer` raises NotImplementedError on older polars versions
+    if _has_sufficient_polars_version(_MIN_POLARS_VERSION):
+        return
+    skip = pytest.mark.skip(reason=f"defer needs polars >= {_MIN_POLARS_VERSION}")
+    for item in items:
+        if item.name == "pelage.deferred.defer":
+            item.add_marker(skip)
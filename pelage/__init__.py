@@ -3,21 +3,40 @@ import importlib.metadata
 
 __version__ = importlib.metadata.version("pelage")
 
+from pelage import aio as aio
+from pelage.batch import validate_concatenated as validate_concatenated
+from pelage.batch import validate_many as validate_many
+from pelage.caching import VerdictCache as VerdictCache
+from pelage.caching import fingerprint as fingerprint
+from pelage.caching import materialize as materialize
+from pelage.caching import spill as spill
 from pelage.checks.accepted_range import accepted_range as accepted_range
 from pelage.checks.accepted_values import accepted_values as accepted_values
 from pelage.checks.at_least_one import at_least_one as at_least_one
+from pelage.checks.column_is_within_iqr import (
+    column_is_within_iqr as column_is_within_iqr,
+)
 from pelage.checks.column_is_within_n_std import (
     column_is_within_n_std as column_is_within_n_std,
 )
 from pelage.checks.custom_check import custom_check as custom_check
+from pelage.checks.has_approx_cardinality import (
+    has_approx_cardinality as has_approx_cardinality,
+)
 from pelage.checks.has_columns import has_columns as has_columns
 from pelage.checks.has_dtypes import has_dtypes as has_dtypes
+from pelage.checks.has_join_cardinality import (
+    has_join_cardinality as has_join_cardinality,
+)
 from pelage.checks.has_mandatory_values import (
     has_mandatory_values as has_mandatory_values,
 )
 from pelage.checks.has_no_infs import has_no_infs as has_no_infs
 from pelage.checks.has_no_nulls import has_no_nulls as has_no_nulls
 from pelage.checks.has_shape import has_shape as has_shape
+from pelage.checks.has_valid_foreign_keys import (
+    has_valid_foreign_keys as has_valid_foreign_keys,
+)
 from pelage.checks.is_monotonic import is_monotonic as is_monotonic
 from pelage.checks.maintains_relationships import (
     maintains_relationships as maintains_relationships,
@@ -36,4 +55,25 @@ from pelage.checks.unique import unique as unique
 from pelage.checks.unique_combination_of_columns import (
     unique_combination_of_columns as unique_combination_of_columns,
 )
+from pelage.compiled import CompiledValidator as CompiledValidator
+from pelage.compiled import compile_checks as compile_checks
+from pelage.deferred import defer as defer
+from pelage.hive import validate_partitioned as validate_partitioned
+from pelage.incremental import ValidationState as ValidationState
+from pelage.incremental import validate_incremental as validate_incremental
+from pelage.partials import PartialResult as PartialResult
+from pelage.partials import summarize_check as summarize_check
+from pelage.partials import validate_dataset as validate_dataset
+from pelage.runner import CheckResult as CheckResult
+from pelage.runner import RuntimeHistory as RuntimeHistory
+from pelage.runner import run_checks as run_checks
+from pelage.runner import validate_with_budget as validate_with_budget
+from pelage.sketches import QuantileSketch as QuantileSketch
+from pelage.streaming import StreamingIsMonotonic as StreamingIsMonotonic
+from pelage.streaming import (
+    StreamingMutuallyExclusiveRanges as StreamingMutuallyExclusiveRanges,
+)
+from pelage.streaming import validate_stream as validate_stream
 from pelage.types import PolarsAssertError as PolarsAssertError
+from pelage.violations import flag_violations as flag_violations
+from pelage.violations import validate_and_write as validate_and_write
@@ -0,0 +1,166 @@
+"""Asynchronous versions of the pelage checks, for use within an event loop.
+
+Each check of pelage has an awaitable counterpart with the same arguments:
+
+```python
+from pelage import aio
+
+async def upload(df):
+    await aio.has_no_nulls(df)
+    await aio.accepted_range(df, {"price": (0, 1_000)})
+```
+
+The checks run in a worker thread, their queries being collected in the background:
+the event loop keeps serving other requests in the meantime. Cancelling the awaiting
+task, e.g. because the client disconnected, cancels the running query of the check.
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+from collections.abc import Awaitable, Callable
+
+from pelage.checks.accepted_range import accepted_range as _accepted_range
+from pelage.checks.accepted_values import accepted_values as _accepted_values
+from pelage.checks.at_least_one import at_least_one as _at_least_one
+from pelage.checks.column_is_within_iqr import (
+    column_is_within_iqr as _column_is_within_iqr,
+)
+from pelage.checks.column_is_within_n_std import (
+    column_is_within_n_std as _column_is_within_n_std,
+)
+from pelage.checks.custom_check import custom_check as _custom_check
+from pelage.checks.has_approx_cardinality import (
+    has_approx_cardinality as _has_approx_cardinality,
+)
+from pelage.checks.has_columns import has_columns as _has_columns
+from pelage.checks.has_dtypes import has_dtypes as _has_dtypes
+from pelage.checks.has_join_cardinality import (
+    has_join_cardinality as _has_join_cardinality,
+)
+from pelage.checks.has_mandatory_values import (
+    has_mandatory_values as _has_mandatory_values,
+)
+from pelage.checks.has_no_infs import has_no_infs as _has_no_infs
+from pelage.checks.has_no_nulls import has_no_nulls as _has_no_nulls
+from pelage.checks.has_shape import has_shape as _has_shape
+from pelage.checks.has_valid_foreign_keys import (
+    has_valid_foreign_keys as _has_valid_foreign_keys,
+)
+from pelage.checks.is_monotonic import is_monotonic as _is_monotonic
+from pelage.checks.maintains_relationships import (
+    maintains_relationships as _maintains_relationships,
+)
+from pelage.checks.mutually_exclusive_ranges import (
+    mutually_exclusive_ranges as _mutually_exclusive_ranges,
+)
+from pelage.checks.not_accepted_values import (
+    not_accepted_values as _not_accepted_values,
+)
+from pelage.checks.not_constant import not_constant as _not_constant
+from pelage.checks.not_null_proportion import (
+    not_null_proportion as _not_null_proportion,
+)
+from pelage.checks.unique import unique as _unique
+from pelage.checks.unique_combination_of_columns import (
+    unique_combination_of_columns as _unique_combination_of_columns,
+)
+from pelage.runner import _cancellable
+from pelage.types import PolarsLazyOrDataFrame
+from pelage.utils import _to_polars
+
+_ASYNC_DOCSTRING = """{summary}
+
+Awaitable version of `pelage.{name}`, run in a worker thread. Cancelling the
+awaiting task cancels the query of the check.
+
+Parameters
+----------
+{parameters}
+
+Returns
+-------
+Awaitable[PolarsLazyOrDataFrame]
+    Resolves to the original data when the check passes, raises a
+    `PolarsAssertError` otherwise
+
+Examples
+--------
+```python
+import polars as pl
+from pelage import aio
+
+async def handle(df):
+    df = await aio.{name}(df, {arguments})
+```
+"""
+
+
+def _async_docstring(check: Callable, arguments: str) -> str:
+    docstring = inspect.getdoc(check) or ""
+    summary = docstring.split("\n\n", 1)[0]
+    parameters = (
+        docstring.split("Parameters\n----------\n", 1)[-1]
+        .split("Returns\n-------\n", 1)[0]
+        .strip()
+    )
+    return _ASYNC_DOCSTRING.format(
+        summary=summary,
+        name=check.__name__,
+        parameters=parameters,
+        arguments=arguments,
+    )
+
+
+def _make_async(
+    check: Callable[..., PolarsLazyOrDataFrame], arguments: str
+) -> Callable[..., Awaitable[PolarsLazyOrDataFrame]]:
+    @functools.wraps(check)
+    async def async_check(
+        data: PolarsLazyOrDataFrame, *args, **kwargs
+    ) -> PolarsLazyOrDataFrame:
+        cancelled = threading.Event()
+        cancellable = _cancellable(_to_polars(data), check, cancelled)
+        try:
+            await asyncio.to_thread(check, cancellable, *args, **kwargs)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return data
+
+    async_check.__doc__ = _async_docstring(check, arguments)
+    return async_check
+
+
+accepted_range = _make_async(_accepted_range, '{"price": (0, 1_000)}')
+accepted_values = _make_async(_accepted_values, '{"status": ["paid", "refunded"]}')
+at_least_one = _make_async(_at_least_one, '"price"')
+column_is_within_iqr = _make_async(_column_is_within_iqr, '("price", 1.5)')
+column_is_within_n_std = _make_async(_column_is_within_n_std, '("price", 3)')
+custom_check = _make_async(_custom_check, 'pl.col("price") >= 0')
+has_approx_cardinality = _make_async(
+    _has_approx_cardinality, '{"customer": (100, None)}'
+)
+has_columns = _make_async(_has_columns, '["customer", "price"]')
+has_dtypes = _make_async(_has_dtypes, '{"price": pl.Float64}')
+has_join_cardinality = _make_async(
+    _has_join_cardinality, 'customers, "customer", "m:1"'
+)
+has_mandatory_values = _make_async(_has_mandatory_values, '{"status": ["paid"]}')
+has_no_infs = _make_async(_has_no_infs, '"price"')
+has_no_nulls = _make_async(_has_no_nulls, '"customer"')
+has_shape = _make_async(_has_shape, "(None, 3)")
+has_valid_foreign_keys = _make_async(_has_valid_foreign_keys, '{"customer": customers}')
+is_monotonic = _make_async(_is_monotonic, '"created_at"')
+maintains_relationships = _make_async(_maintains_relationships, 'customers, "customer"')
+mutually_exclusive_ranges = _make_async(
+    _mutually_exclusive_ranges, 'low_bound="start", high_bound="end"'
+)
+not_accepted_values = _make_async(_not_accepted_values, '{"status": ["unknown"]}')
+not_constant = _make_async(_not_constant, '"price"')
+not_null_proportion = _make_async(_not_null_proportion, '{"price": 0.9}')
+unique = _make_async(_unique, '"order_id"')
+unique_combination_of_columns = _make_async(
+    _unique_combination_of_columns, '["customer", "created_at"]'
+)
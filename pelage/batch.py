@@ -0,0 +1,294 @@
+"""Run the same checks over many independent frames."""
+
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import polars as pl
+
+from pelage.checks.has_shape import _check_shape, has_shape
+from pelage.runner import (
+    _CHECK_COSTS,
+    Check,
+    CheckResult,
+    _bind_check,
+    _check_arguments,
+    _check_function,
+    _check_name,
+    _run_check,
+    run_checks,
+)
+from pelage.types import PolarsAssertError, PolarsLazyOrDataFrame
+from pelage.violations import _MAX_RULES, _VIOLATION_MASKS, _violation_bits
+
+_DEFAULT_MAX_WORKERS = 8
+
+
+def _as_mapping(
+    frames: Mapping[Hashable, PolarsLazyOrDataFrame] | Sequence[PolarsLazyOrDataFrame],
+) -> Mapping[Hashable, PolarsLazyOrDataFrame]:
+    return frames if isinstance(frames, Mapping) else dict(enumerate(frames))
+
+
+def validate_many(
+    frames: Mapping[Hashable, PolarsLazyOrDataFrame] | Sequence[PolarsLazyOrDataFrame],
+    checks: Sequence[Check],
+    max_workers: int = _DEFAULT_MAX_WORKERS,
+    fail_fast: bool = False,
+) -> dict[Hashable, list[CheckResult]]:
+    """Run the same checks over many frames concurrently.
+
+    Polars releases the GIL while running queries, so frames are validated in a pool
+    of threads, at most `max_workers` at a time to bound the memory used. The checks
+    of each frame are run with `run_checks`, from the cheapest to the most expensive.
+
+    Parameters
+    ----------
+    frames : Union[Mapping[Hashable, PolarsLazyOrDataFrame], Sequence[...]]
+        The frames to check, by identifier. When given as a sequence, frames are
+        identified by their position.
+    checks : Sequence[Callable]
+        Checks taking the data as only argument, e.g. built with `functools.partial`.
+    max_workers : int, optional
+        Maximum number of frames validated at the same time, by default 8
+    fail_fast : bool, optional
+        Stop checking a frame at its first failing check, by default False
+
+    Returns
+    -------
+    Dict[Hashable, List[CheckResult]]
+        The results of the checks of each frame, in the order of `frames` and `checks`.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> frames = {
+    ...     "customer_1": pl.DataFrame({"a": [1, 2]}),
+    ...     "customer_2": pl.DataFrame({"a": [1, 1]}),
+    ... }
+    >>> results = plg.validate_many(frames, [partial(plg.unique, columns="a")])
+    >>> {key: [result.status for result in res] for key, res in results.items()}
+    {'customer_1': ['passed'], 'customer_2': ['failed']}
+    """
+    frames = _as_mapping(frames)
+    validate = partial(run_checks, checks=checks, fail_fast=fail_fast)
+
+    with ThreadPoolExecutor(max_workers, thread_name_prefix="pelage") as executor:
+        results = executor.map(validate, frames.values())
+        return dict(zip(frames.keys(), results, strict=True))
+
+
+def _run_row_level_checks(
+    combined: pl.DataFrame,
+    checks: dict[int, Check],
+    source_column: str,
+) -> dict[tuple[int, int], PolarsAssertError]:
+    """Errors per source and check, with all the row-level checks run in one pass"""
+    bit_column = f"{source_column}_violations__"
+    flagged = combined.with_columns(
+        _violation_bits(list(checks.values())).alias(bit_column)
+    ).filter(pl.col(bit_column) != 0)
+
+    errors = {}
+    for bit, (position, check) in enumerate(checks.items()):
+        bad_rows = flagged.filter(pl.col(bit_column) & (1 << bit) != 0)
+        for (source,), rows in bad_rows.group_by(source_column):
+            errors[source, position] = PolarsAssertError(  # type: ignore
+                rows.drop(source_column, bit_column),
+                f"Some rows fail the check {_check_name(check)}",
+            )
+    return errors
+
+
+def _run_grouped_check(
+    combined: pl.DataFrame,
+    check: Check,
+    source_column: str,
+) -> dict[int, PolarsAssertError] | None:
+    """Errors per source of a check run once, grouped by the source column.
+
+    Returns None when the errors cannot be mapped back to their source, the check
+    must then run frame by frame.
+    """
+    bound = _bind_check(check, combined)
+    group_by = bound.arguments.get("group_by")  # type: ignore
+    if isinstance(group_by, str):
+        group_by = [group_by]
+    bound.arguments["group_by"] = [source_column, *(group_by or [])]  # type: ignore
+    if (
+        "columns" in bound.signature.parameters  # type: ignore
+        and bound.arguments.get("columns") is None  # type: ignore
+    ):
+        # All the columns of the frames, the source column repeats within its groups
+        bound.arguments["columns"] = pl.exclude(source_column)  # type: ignore
+
+    try:
+        _check_function(check)(*bound.args, **bound.kwargs)  # type: ignore
+    except PolarsAssertError as error:
+        if source_column not in error.df.columns:
+            return None
+        return {
+            source: PolarsAssertError(rows.drop(source_column), error.supp_message)
+            for (source,), rows in error.df.group_by(source_column)
+        }  # type: ignore
+    return {}
+
+
+def _run_frame_by_frame(
+    frames: Mapping[Hashable, PolarsLazyOrDataFrame],
+    check: Check,
+    sources: Iterable[int] | None = None,
+) -> dict[int, PolarsAssertError]:
+    """Errors per source of a check run on each frame, or on the given sources only"""
+    frame_list = list(frames.values())
+    errors = {}
+    for source in range(len(frame_list)) if sources is None else sources:
+        result = _run_check(check, frame_list[source])
+        if result.error is not None:
+            errors[source] = result.error
+    return errors
+
+
+def _check_frame_shapes(
+    combined: pl.DataFrame, check: Check, source_column: str, n_sources: int
+) -> dict[int, PolarsAssertError]:
+    """Errors per source of `has_shape`, from the row count of each source"""
+    shape = _check_arguments(check)["shape"]
+    lengths = dict(combined.group_by(source_column).agg(pl.len()).iter_rows())
+    errors = {}
+    for source in range(n_sources):
+        try:
+            _check_shape((lengths.get(source, 0), combined.width - 1), shape)
+        except PolarsAssertError as error:
+            errors[source] = error
+    return errors
+
+
+def validate_concatenated(
+    frames: Mapping[Hashable, PolarsLazyOrDataFrame] | Sequence[PolarsLazyOrDataFrame],
+    checks: Sequence[Check],
+    source_column: str = "source_id",
+) -> dict[Hashable, list[CheckResult]]:
+    """Run the same checks over many small frames, as if they were a single one.
+
+    For frames of a few hundred rows, building and running one query per check and
+    per frame costs more than the checks themselves. Instead, the frames are
+    concatenated without rechunking, under a column holding their position, and each
+    check runs once on the whole:
+
+    - checks with a `group_by` argument are grouped by the source column, empty
+      frames being checked on their own,
+    - `has_shape` compares the row count of each source to the expected shape,
+    - row-level checks (`accepted_values`, `has_no_nulls`, ...) are evaluated together
+      in a single pass, as in `flag_violations`,
+    - schema checks (`has_columns`, `has_dtypes`) run once, all frames sharing the
+      same schema,
+    - the other checks, e.g. `maintains_relationships`, still run frame by frame.
+
+    Failures are then mapped back to the frame they come from. All frames must have
+    the same schema.
+
+    Parameters
+    ----------
+    frames : Union[Mapping[Hashable, PolarsLazyOrDataFrame], Sequence[...]]
+        The frames to check, by identifier. When given as a sequence, frames are
+        identified by their position.
+    checks : Sequence[Callable]
+        Checks taking the data as only argument, e.g. built with `functools.partial`.
+    source_column : str, optional
+        Name of the column holding the position of each frame, it must not exist in
+        the frames, by default "source_id"
+
+    Returns
+    -------
+    Dict[Hashable, List[CheckResult]]
+        The results of the checks of each frame, in the order of `frames` and `checks`.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> frames = {
+    ...     "customer_1": pl.DataFrame({"a": [1, 2]}),
+    ...     "customer_2": pl.DataFrame({"a": [1, 1]}),
+    ...     "customer_3": pl.DataFrame({"a": [3, None]}),
+    ... }
+    >>> results = plg.validate_concatenated(
+    ...     frames, [partial(plg.unique, columns="a"), partial(plg.has_no_nulls)]
+    ... )
+    >>> {key: [result.status for result in res] for key, res in results.items()}
+    {'customer_1': ['passed', 'passed'], 'customer_2': ['failed', 'passed'], \
+'customer_3': ['passed', 'failed']}
+    """
+    frames = _as_mapping(frames)
+    combined = pl.concat(
+        [
+            frame.lazy().with_columns(pl.lit(source, pl.UInt32).alias(source_column))
+            for source, frame in enumerate(frames.values())
+        ],
+        rechunk=False,
+    ).collect()
+
+    present_sources = set(combined.get_column(source_column).unique())
+    empty_sources = [
+        source for source in range(len(frames)) if source not in present_sources
+    ]
+
+    errors: dict[tuple[int, int], PolarsAssertError] = {}
+    row_level_checks = {}
+    for position, check in enumerate(checks):
+        function = _check_function(check)
+        bound = _bind_check(check)
+        if function in _VIOLATION_MASKS:
+            row_level_checks[position] = check
+        elif function is has_shape and _check_arguments(check).get("group_by") is None:
+            # Grouped, has_shape only compares the number of rows of each group
+            errors |= {
+                (source, position): error
+                for source, error in _check_frame_shapes(
+                    combined, check, source_column, len(frames)
+                ).items()
+            }
+        elif bound is not None and "group_by" in bound.signature.parameters:
+            grouped_errors = _run_grouped_check(combined, check, source_column)
+            if grouped_errors is None:
+                grouped_errors = _run_frame_by_frame(frames, check)
+            else:
+                # Empty frames have no group, they are checked on their own
+                grouped_errors |= _run_frame_by_frame(frames, check, empty_sources)
+            errors |= {
+                (source, position): error for source, error in grouped_errors.items()
+            }
+        elif _CHECK_COSTS.get(function) == 0:
+            result = _run_check(check, combined.drop(source_column))
+            if result.error is not None:
+                errors |= {
+                    (source, position): result.error for source in range(len(frames))
+                }
+        else:
+            errors |= {
+                (source, position): error
+                for source, error in _run_frame_by_frame(frames, check).items()
+            }
+
+    # The violations of up to 64 checks fit in the same bitmask
+    row_level_items = list(row_level_checks.items())
+    for start in range(0, len(row_level_items), _MAX_RULES):
+        errors |= _run_row_level_checks(
+            combined, dict(row_level_items[start : start + _MAX_RULES]), source_column
+        )
+
+    return {
+        key: [
+            CheckResult(
+                _check_name(check),
+                "failed" if (source, position) in errors else "passed",
+                errors.get((source, position)),
+            )
+            for position, check in enumerate(checks)
+        ]
+        for source, key in enumerate(frames.keys())
+    }
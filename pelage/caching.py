@@ -0,0 +1,299 @@
+"""Reuse the result of an expensive LazyFrame, or of checks, across several runs."""
+
+import hashlib
+import os
+import tempfile
+import warnings
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+
+import polars as pl
+
+from pelage.runner import Check, _check_key
+from pelage.types import PolarsAssertError, PolarsLazyOrDataFrame
+from pelage.utils import _has_sufficient_polars_version
+
+# Largest in-memory result kept by `materialize`, in bytes
+_DEFAULT_MAX_CACHE_BYTES = 1024**3
+
+_DEFAULT_MAX_VERDICTS = 1024
+
+# Polars < 2 only accepts None for uncompressed IPC files
+_IPC_UNCOMPRESSED = "uncompressed" if _has_sufficient_polars_version("2.0.0") else None
+
+# Seeds of the hashes of the values and of their positions
+_VALUE_SEED = 0
+_POSITION_SEED = 1
+
+
+def materialize(
+    data: PolarsLazyOrDataFrame,
+    max_bytes: int = _DEFAULT_MAX_CACHE_BYTES,
+    directory: str | Path | None = None,
+) -> PolarsLazyOrDataFrame:
+    """Collect a LazyFrame once, so that the following checks reuse the result.
+
+    Checks return their input unchanged: when chained on a LazyFrame, each of them
+    runs the whole upstream plan again (scans, joins, window functions), and so does
+    the final `collect`. Materializing the LazyFrame first runs that plan only once,
+    and returns a LazyFrame reading from the in-memory result instead.
+
+    When the result is larger than `max_bytes`, it is written to an uncompressed Arrow
+    IPC file and released from memory, and the returned LazyFrame scans that file, as
+    with `spill`. The file is removed once the returned LazyFrame is garbage
+    collected, or at the latest when Python exits: keep a reference to it while
+    frames derived from it are used. DataFrames are already in memory and are
+    returned unchanged.
+
+    Parameters
+    ----------
+    data : PolarsLazyOrDataFrame
+        The polars DataFrame or LazyFrame to materialize.
+    max_bytes : int, optional
+        Maximum estimated size of the collected result to keep in memory,
+        by default 1 GiB
+    directory : Optional[Union[str, Path]], optional
+        Directory of the file holding results larger than `max_bytes`, by default the
+        system temporary directory
+
+    Returns
+    -------
+    PolarsLazyOrDataFrame
+        A LazyFrame backed by the collected data, or the original data.
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> lf = pl.LazyFrame({"a": [1, 2, 3]}).with_columns(b=pl.col("a").cum_sum())
+    >>> (
+    ...     lf.pipe(plg.materialize)
+    ...     .pipe(plg.has_no_nulls)
+    ...     .pipe(plg.unique, "b")
+    ...     .collect()
+    ... )
+    shape: (3, 2)
+    ┌─────┬─────┐
+    │ a   ┆ b   │
+    │ --- ┆ --- │
+    │ i64 ┆ i64 │
+    ╞═════╪═════╡
+    │ 1   ┆ 1   │
+    │ 2   ┆ 3   │
+    │ 3   ┆ 6   │
+    └─────┴─────┘
+    """
+    if isinstance(data, pl.DataFrame):
+        return data
+
+    collected = data.collect()
+    if collected.estimated_size() <= max_bytes:
+        return collected.lazy()
+
+    # The plan already ran: its result is moved to disk rather than computed again
+    file_descriptor, path = tempfile.mkstemp(
+        suffix=".arrow", prefix="pelage_", dir=directory
+    )
+    os.close(file_descriptor)
+    collected.write_ipc(path, compression="uncompressed")
+    del collected
+    spilled = pl.scan_ipc(path)
+    weakref.finalize(spilled, Path(path).unlink, missing_ok=True)
+    return spilled
+
+
+@contextmanager
+def spill(
+    data: PolarsLazyOrDataFrame,
+    directory: str | Path | None = None,
+) -> Iterator[pl.LazyFrame]:
+    """Write a LazyFrame once to a temporary Arrow IPC file, and scan it instead.
+
+    Alternative to `materialize` for results that do not fit in memory: the plan is
+    run once with the streaming engine and sunk to an uncompressed IPC file, that
+    polars memory maps when scanning it. The following checks then read the file
+    through the page cache instead of running the upstream plan again. Plans that
+    polars 1 cannot sink are collected in memory before being written, with a
+    warning, as their result may not fit in memory. The file is
+    deleted when leaving the `with` block, after which the LazyFrame cannot be used.
+
+    Parameters
+    ----------
+    data : PolarsLazyOrDataFrame
+        The polars DataFrame or LazyFrame to spill to disk.
+    directory : Optional[Union[str, Path]], optional
+        Directory of the temporary file, by default the system temporary directory
+
+    Yields
+    ------
+    pl.LazyFrame
+        A LazyFrame scanning the temporary file.
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> lf = pl.LazyFrame({"a": [1, 2, 3]}).with_columns(b=pl.col("a").cum_sum())
+    >>> with plg.spill(lf) as spilled:
+    ...     result = spilled.pipe(plg.has_no_nulls).pipe(plg.unique, "b").collect()
+    >>> result.shape
+    (3, 2)
+    """
+    with tempfile.TemporaryDirectory(
+        prefix="pelage_", dir=directory, ignore_cleanup_errors=True
+    ) as temporary_directory:
+        path = Path(temporary_directory) / "spill.arrow"
+        try:
+            data.lazy().sink_ipc(path, compression=_IPC_UNCOMPRESSED)
+        except pl.exceptions.InvalidOperationError as error:
+            # Plans that the engine of polars 1 cannot sink, e.g. with Python functions
+            warnings.warn(
+                f"The plan cannot be sunk to disk ({error}), its whole result is "
+                + "collected in memory before being spilled",
+                stacklevel=3,
+            )
+            data.lazy().collect().write_ipc(path, compression="uncompressed")
+        yield pl.scan_ipc(path)
+
+
+def fingerprint(data: PolarsLazyOrDataFrame) -> str:
+    """Content fingerprint of a DataFrame, or of the result of a LazyFrame.
+
+    Each value is hashed along with its position, and hashes are summed per column,
+    all the columns being aggregated in a single parallel pass. The fingerprint also
+    covers the names and types of the columns, and the number of rows: frames with
+    the same fingerprint hold the same data, up to hash collisions.
+
+    Polars hashes may change from one version of polars to the next: fingerprints
+    should not be persisted across upgrades.
+
+    Parameters
+    ----------
+    data : PolarsLazyOrDataFrame
+        The polars DataFrame or LazyFrame to fingerprint.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the content of the data.
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> df = pl.DataFrame({"a": [1, 2]})
+    >>> plg.fingerprint(df) == plg.fingerprint(pl.DataFrame({"a": [1, 2]}))
+    True
+    >>> plg.fingerprint(df) == plg.fingerprint(pl.DataFrame({"a": [2, 1]}))
+    False
+    """
+    data = data.lazy()
+    schema = data.collect_schema()
+    position = pl.int_range(pl.len(), dtype=pl.UInt64).hash(_POSITION_SEED)
+    aggregates = data.select(
+        pl.len(),
+        *(
+            (pl.col(col).hash(_VALUE_SEED) ^ position).hash(_VALUE_SEED).sum()
+            for col in schema.names()
+        ),
+    ).collect()
+
+    digest = hashlib.blake2b(repr(list(schema.items())).encode())
+    digest.update(repr(aggregates.row(0)).encode())
+    return digest.hexdigest()
+
+
+def _content_key(check: Check) -> str | None:
+    """Identify a check by its arguments, including the content of reference frames.
+
+    None when an argument cannot be identified by its content, e.g. an arbitrary
+    Python object, the verdicts of the check must then not be reused.
+    """
+    try:
+        return _check_key(check, frame_key=fingerprint)
+    except TypeError:
+        return None
+
+
+class VerdictCache:
+    """Verdicts of checks, indexed by the fingerprint of the data and the arguments.
+
+    Calling the cache with a check and its arguments returns a function to `pipe` the
+    data to, as with `defer`. When the same check already ran on data with the same
+    `fingerprint`, its verdict is returned without running it again: the data is
+    returned unchanged, or the stored `PolarsAssertError` is raised again. The least
+    recently used verdicts are dropped beyond `maxsize`.
+
+    Arguments are identified by their content: frames, Series and arrays are
+    fingerprinted as well. Checks taking arguments that cannot be, e.g. expressions
+    calling Python functions, are run every time without being cached.
+
+    Computing the fingerprint reads all the data once, which is worth it for checks
+    more expensive than hashing, e.g. `unique`, `has_join_cardinality` or checks on
+    a costly LazyFrame.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of verdicts kept, by default 1024
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> cache = plg.VerdictCache()
+    >>> df = pl.DataFrame({"a": [1, 2]})
+    >>> df.pipe(cache(plg.unique, columns="a")).shape
+    (2, 1)
+    >>> len(cache)
+    1
+    """
+
+    def __init__(self, maxsize: int = _DEFAULT_MAX_VERDICTS) -> None:
+        self.maxsize = maxsize
+        self._verdicts: OrderedDict[tuple[str, str], PolarsAssertError | None] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._verdicts)
+
+    def clear(self) -> None:
+        self._verdicts.clear()
+
+    def __call__(
+        self, check: Callable[..., PolarsLazyOrDataFrame], *args, **kwargs
+    ) -> Callable[[PolarsLazyOrDataFrame], PolarsLazyOrDataFrame]:
+        bound_check = partial(check, *args, **kwargs) if args or kwargs else check
+
+        def run_cached(data: PolarsLazyOrDataFrame) -> PolarsLazyOrDataFrame:
+            check_key = _content_key(bound_check)
+            if check_key is None:
+                return check(data, *args, **kwargs)
+
+            key = (fingerprint(data), check_key)
+            if key in self._verdicts:
+                self._verdicts.move_to_end(key)
+                error = self._verdicts[key]
+                if error is not None:
+                    raise PolarsAssertError(error.df, error.supp_message)
+                return data
+
+            try:
+                check(data, *args, **kwargs)
+            except PolarsAssertError as error:
+                self._store(key, error)
+                raise
+            self._store(key, None)
+            return data
+
+        return run_cached
+
+    def _store(self, key: tuple[str, str], error: PolarsAssertError | None) -> None:
+        self._verdicts[key] = error
+        if len(self._verdicts) > self.maxsize:
+            self._verdicts.popitem(last=False)
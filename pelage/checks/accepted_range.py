@@ -1,14 +1,20 @@
 import polars as pl
 
+from pelage.sampling import _check_sample
 from pelage.types import (
     PolarsAssertError,
     PolarsColumnBounds,
     PolarsLazyOrDataFrame,
 )
+from pelage.utils import _accept_arrow_inputs
 
 
+@_accept_arrow_inputs
 def accepted_range(
-    data: PolarsLazyOrDataFrame, items: dict[str, PolarsColumnBounds]
+    data: PolarsLazyOrDataFrame,
+    items: dict[str, PolarsColumnBounds],
+    sample: float | None = None,
+    stratify_by: str | list[str] | None = None,
 ) -> PolarsLazyOrDataFrame:
     """Check that all the values from specifed columns in the dict `items` are within
         the indicated range.
@@ -30,6 +36,14 @@ def accepted_range(
         "col_c", (low_c, high_c, "none"),
         }
         ```
+    sample : Optional[float], optional
+        Fraction of the rows to check, between 0 and 1. The sampled rows are selected
+        from a hash of their position, so that the same rows are checked from one run
+        to the other. On failure, the rate of violations in the whole data is estimated
+        with a 95% confidence interval. By default None, all the rows are checked.
+    stratify_by : Optional[Union[str, List[str]]], optional
+        When sampling, draw the same fraction of rows in each group of these columns,
+        with at least one row per group, by default None
 
     Returns
     -------
@@ -91,17 +105,31 @@ def accepted_range(
     │ c   │
     └─────┘
     """
-    closed_boundaries = {
-        k: (v if len(v) == 3 else (*v, "both")) for k, v in items.items()
-    }
-    forbidden_ranges = [
-        pl.col(k).is_between(*v).not_()  # type: ignore
-        for k, v in closed_boundaries.items()
-    ]
-    out_of_range = data.lazy().filter(pl.Expr.or_(*forbidden_ranges)).collect()
+    if sample is not None:
+        _check_sample(
+            data,
+            _out_of_range(items),
+            sample,
+            stratify_by,
+            "Some values are beyond the acceptable ranges defined",
+        )
+        return data
+
+    out_of_range = data.lazy().filter(_out_of_range(items)).collect()
 
     if not out_of_range.is_empty():
         raise PolarsAssertError(
             out_of_range, "Some values are beyond the acceptable ranges defined"
         )
     return data
+
+
+def _out_of_range(items: dict[str, PolarsColumnBounds]) -> pl.Expr:
+    """Rows containing values beyond the acceptable ranges"""
+    closed_boundaries = {
+        k: (v if len(v) == 3 else (*v, "both")) for k, v in items.items()
+    }
+    return pl.any_horizontal(
+        pl.col(k).is_between(*v).not_()  # type: ignore
+        for k, v in closed_boundaries.items()
+    ).fill_null(False)
@@ -1,10 +1,16 @@
 import polars as pl
 
+from pelage.sampling import _check_sample
 from pelage.types import PolarsAssertError, PolarsLazyOrDataFrame
+from pelage.utils import _accept_arrow_inputs
 
 
+@_accept_arrow_inputs
 def accepted_values(
-    data: PolarsLazyOrDataFrame, items: dict[str, list]
+    data: PolarsLazyOrDataFrame,
+    items: dict[str, list],
+    sample: float | None = None,
+    stratify_by: str | list[str] | None = None,
 ) -> PolarsLazyOrDataFrame:
     """Raises error if columns contains values not specified in `items`
 
@@ -16,6 +22,14 @@ def accepted_values(
         A dictionnary where keys are a string compatible with a pl.Expr, to be used with
         pl.col(). The value for each key is a List of all authorized values in the
         dataframe.
+    sample : Optional[float], optional
+        Fraction of the rows to check, between 0 and 1. The sampled rows are selected
+        from a hash of their position, so that the same rows are checked from one run
+        to the other. On failure, the rate of violations in the whole data is estimated
+        with a 95% confidence interval. By default None, all the rows are checked.
+    stratify_by : Optional[Union[str, List[str]]], optional
+        When sampling, draw the same fraction of rows in each group of these columns,
+        with at least one row per group, by default None
 
     Returns
     -------
@@ -58,6 +72,16 @@ def accepted_values(
     --> It contains values that have not been white-Listed in `items`.
     Showing problematic columns only.
     """
+    if sample is not None:
+        _check_sample(
+            data,
+            _improper_values(items),
+            sample,
+            stratify_by,
+            "It contains values that have not been white-Listed in `items`.",
+        )
+        return data
+
     mask_for_improper_values = [
         ~pl.col(col).is_in(values) for col, values in items.items()
     ]
@@ -75,3 +99,10 @@ def accepted_values(
             + "\nShowing problematic columns only.",
         )
     return data
+
+
+def _improper_values(items: dict[str, list]) -> pl.Expr:
+    """Rows containing values that are not white-listed"""
+    return pl.any_horizontal(
+        ~pl.col(col).is_in(values) for col, values in items.items()
+    ).fill_null(False)
@@ -6,9 +6,10 @@ from pelage.types import (
     PolarsLazyOrDataFrame,
     PolarsOverClauseInput,
 )
-from pelage.utils import _sanitize_column_inputs
+from pelage.utils import _accept_arrow_inputs, _sanitize_column_inputs
 
 
+@_accept_arrow_inputs
 def at_least_one(
     data: PolarsLazyOrDataFrame,
     columns: PolarsColumnType | None = None,
@@ -0,0 +1,152 @@
+import polars as pl
+
+from pelage.sketches import QuantileSketch, sketch_columns
+from pelage.types import (
+    PolarsAssertError,
+    PolarsColumnType,
+    PolarsLazyOrDataFrame,
+)
+from pelage.utils import _accept_arrow_inputs, _sanitize_column_inputs
+
+
+@_accept_arrow_inputs
+def column_is_within_iqr(
+    data: PolarsLazyOrDataFrame,
+    items: tuple[PolarsColumnType, float],
+    *args: tuple[PolarsColumnType, float],
+    sketches: dict[str, QuantileSketch] | None = None,
+    relative_accuracy: float = 0.01,
+) -> PolarsLazyOrDataFrame:
+    """Function asserting values are within the Tukey fences of their column, i.e.
+    `[Q1 - k * IQR, Q3 + k * IQR]` where IQR is the interquartile range `Q3 - Q1`.
+
+    Contrary to `column_is_within_n_std`, the quartiles are not skewed by the outliers
+    they are looking for. They are estimated with a `QuantileSketch`, which uses a
+    bounded amount of memory whatever the number of rows. Sketches can also be built
+    separately on several batches or files, merged, and passed to the check.
+
+    Parameters
+    ----------
+    data : PolarsLazyOrDataFrame
+        Polars DataFrame or LazyFrame containing data to check.
+    items : Tuple[PolarsColumnType, float]
+        A column name / column type with the number of IQR authorized beyond the
+        quartiles. Must be of the following form: `(col_name, k)`, where `k` is usually
+        1.5 for outliers and 3 for extreme outliers.
+    sketches : Optional[Dict[str, QuantileSketch]], optional
+        Precomputed sketches, for instance merged from several files, used instead of
+        the data to estimate the quartiles of the corresponding columns,
+        by default None
+    relative_accuracy : float, optional
+        Relative accuracy of the quartiles estimated from the data, by default 0.01
+
+    Returns
+    -------
+    PolarsLazyOrDataFrame
+        The original polars DataFrame or LazyFrame when the check passes
+
+    Examples
+    --------
+
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> df = pl.DataFrame(
+    ...     {
+    ...         "a": list(range(0, 11)),
+    ...         "b": list(range(0, 10)) + [5000],
+    ...     }
+    ... )
+    >>> df.pipe(plg.column_is_within_iqr, ("a", 1.5))
+    shape: (11, 2)
+    ┌─────┬──────┐
+    │ a   ┆ b    │
+    │ --- ┆ ---  │
+    │ i64 ┆ i64  │
+    ╞═════╪══════╡
+    │ 0   ┆ 0    │
+    │ 1   ┆ 1    │
+    │ 2   ┆ 2    │
+    │ 3   ┆ 3    │
+    │ 4   ┆ 4    │
+    │ …   ┆ …    │
+    │ 6   ┆ 6    │
+    │ 7   ┆ 7    │
+    │ 8   ┆ 8    │
+    │ 9   ┆ 9    │
+    │ 10  ┆ 5000 │
+    └─────┴──────┘
+
+    >>> df.pipe(plg.column_is_within_iqr, ("a", 1.5), ("b", 1.5))
+    Traceback (most recent call last):
+    ...
+    pelage.types.PolarsAssertError: Details
+    shape: (1, 1)
+    ┌──────┐
+    │ b    │
+    │ ---  │
+    │ i64  │
+    ╞══════╡
+    │ 5000 │
+    └──────┘
+    Error with the DataFrame passed to the check function:
+    --> There are some outliers outside the specified interquartile range fences
+    Impacted columns: ['b']
+    """
+    check_items = [items, *args]
+
+    k_per_column = {
+        column: k
+        for col, k in check_items
+        for column in data.lazy()
+        .select(_sanitize_column_inputs(col))
+        .collect_schema()
+        .names()
+    }
+
+    sketches = dict(sketches or {})
+    missing_columns = [col for col in k_per_column if col not in sketches]
+    if missing_columns:
+        sketches |= sketch_columns(data, missing_columns, relative_accuracy)
+
+    keep_outlier_nullify_others = []
+    for column, k in k_per_column.items():
+        first_quartile = sketches[column].quantile(0.25)
+        third_quartile = sketches[column].quantile(0.75)
+        # Columns without values cannot contain outliers
+        if first_quartile is None or third_quartile is None:
+            continue
+        iqr = third_quartile - first_quartile
+        keep_outlier_nullify_others.append(
+            pl.when(
+                pl.col(column)
+                .is_between(first_quartile - k * iqr, third_quartile + k * iqr)
+                .not_()
+            )
+            .then(pl.col(column))
+            .otherwise(None)
+            .alias(column)
+        )
+
+    if not keep_outlier_nullify_others:
+        return data
+
+    tagged_outliers = (
+        data.lazy()
+        .select(*keep_outlier_nullify_others)
+        .filter(pl.any_horizontal(pl.all().is_not_null()))
+        .collect()
+    )
+
+    columns_with_null = [col.name for col in tagged_outliers if col.is_not_null().any()]
+
+    if columns_with_null:
+        raise PolarsAssertError(
+            df=tagged_outliers.select(columns_with_null),
+            supp_message=(
+                "There are some outliers outside the specified interquartile range "
+                + "fences\n"
+                + f"Impacted columns: {columns_with_null}"
+            ),
+        )
+
+    return data
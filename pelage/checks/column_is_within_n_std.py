@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import polars as pl
 
 from pelage.types import (
@@ -6,18 +8,29 @@ from pelage.types import (
     PolarsLazyOrDataFrame,
 )
 from pelage.utils import (
+    _accept_arrow_inputs,
+    _format_group_columns,
+    _has_sufficient_polars_version,
     _sanitize_column_inputs,
 )
 
 
+@_accept_arrow_inputs
 def column_is_within_n_std(
     data: PolarsLazyOrDataFrame,
     items: tuple[PolarsColumnType, int],
     *args: tuple[PolarsColumnType, int],
+    group_by: str | list[str] | None = None,
+    load_baseline: str | Path | pl.DataFrame | None = None,
+    save_baseline: str | Path | None = None,
 ) -> PolarsLazyOrDataFrame:
     """Function asserting values are within a given STD range, thus ensuring the absence
     of outliers.
 
+    The mean and standard deviation of all the columns are computed at once in a single
+    aggregation. They can also be saved to or loaded from a baseline file, so that new
+    batches of data are compared to stable statistics, without computing them again.
+
     Parameters
     ----------
     data : PolarsLazyOrDataFrame
@@ -25,6 +38,19 @@ def column_is_within_n_std(
     items : Tuple[PolarsColumnType, int]
         A column name / column type with the number of STD authorized for the values
         within. Must be of the following form: `(col_name, n_std)`
+    group_by : Optional[Union[str, List[str]]], optional
+        When specified, the mean and std are estimated for each group independently.
+        The statistics are computed in a single group-level aggregation, then joined
+        back to the rows, by default None
+    load_baseline : Optional[Union[str, Path, pl.DataFrame]], optional
+        Path to a parquet file, previously written with `save_baseline`, containing the
+        mean and std of the columns to check, or the same statistics as a DataFrame.
+        Columns missing from the baseline have their statistics computed from `data`.
+        When using `group_by`, groups absent from the baseline are not checked,
+        by default None
+    save_baseline : Optional[Union[str, Path]], optional
+        Path of a parquet file where the statistics used for the check are written,
+        by default None
 
     Returns
     -------
@@ -78,39 +104,109 @@ def column_is_within_n_std(
     Error with the DataFrame passed to the check function:
     --> There are some outliers outside the specified mean±std range
     Impacted columns: ['c']
+
+    The folloing example details how to perform this checks for groups:
+    >>> group_df = pl.DataFrame(
+    ...     {
+    ...         "a": [1, 2, 1, 2, 1, 100, 101, 100, 101, 500],
+    ...         "group": ["A"] * 5 + ["B"] * 5,
+    ...     }
+    ... )
+    >>> group_df.pipe(plg.column_is_within_n_std, ("a", 1.5), group_by="group")
+    Traceback (most recent call last):
+    ...
+    pelage.types.PolarsAssertError: Details
+    shape: (1, 2)
+    ┌───────┬─────┐
+    │ group ┆ a   │
+    │ ---   ┆ --- │
+    │ str   ┆ i64 │
+    ╞═══════╪═════╡
+    │ B     ┆ 500 │
+    └───────┴─────┘
+    Error with the DataFrame passed to the check function:
+    --> There are some outliers outside the specified mean±std range
+    Impacted columns: ['a']
+
+    Statistics can be computed once on reference data and reused afterwards:
+    >>> df.pipe(
+    ...     plg.column_is_within_n_std, ("a", 2), save_baseline="stats.parquet"
+    ... ) # doctest: +SKIP
+    >>> new_df.pipe(
+    ...     plg.column_is_within_n_std, ("a", 2), load_baseline="stats.parquet"
+    ... ) # doctest: +SKIP
     """
     check_items = [items, *args]
+    group_columns = _format_group_columns(group_by)
+
+    # Selectors such as dtypes may match the group columns, which are not checked
+    n_std_per_column = {
+        column: n_std
+        for col, n_std in check_items
+        for column in data.lazy()
+        .select(_sanitize_column_inputs(col))
+        .collect_schema()
+        .names()
+        if column not in group_columns
+    }
+    columns = list(n_std_per_column)
+    if not columns:
+        return data
+
+    statistics = _get_statistics(data, columns, group_columns, load_baseline)
+
+    if save_baseline is not None:
+        _to_baseline(statistics, columns, group_columns).write_parquet(save_baseline)
 
-    pairs_to_check = [
-        (_sanitize_column_inputs(col), n_std) for col, n_std in check_items
+    # Columns without statistics, e.g. only nulls, cannot contain outliers
+    columns = [
+        col
+        for col in columns
+        if statistics.select(pl.col(f"{col}_std__").is_not_null().any()).item()
     ]
+    if not columns:
+        return data
 
     keep_outlier_nullify_others = [
         pl.when(
-            col.is_between(
-                col.mean() - n_std * col.std(),
-                col.mean() + n_std * col.std(),
-            ).not_()
+            pl.col(col)
+            .is_between(
+                pl.col(f"{col}_mean__")
+                - n_std_per_column[col] * pl.col(f"{col}_std__"),
+                pl.col(f"{col}_mean__")
+                + n_std_per_column[col] * pl.col(f"{col}_std__"),
+            )
+            .not_()
         )
-        .then(col)  # Then `col` must come first to propagate column name for suffix
+        .then(pl.col(col))
         .otherwise(None)
-        .name.suffix("_out__")
-        for col, n_std in pairs_to_check
+        .alias(col)
+        for col in columns
     ]
 
+    if group_columns:
+        # Aggregate-then-join: one row of statistics per group instead of a window
+        data_with_statistics = data.lazy().join(
+            statistics.lazy(), on=group_columns, how="left", **_JOIN_NULLS
+        )
+    else:
+        data_with_statistics = data.lazy().with_columns(
+            pl.lit(value, dtype=pl.Float64).alias(name)
+            for name, value in statistics.row(0, named=True).items()
+        )
+
     tagged_outliers = (
-        data.lazy()
-        .select(*keep_outlier_nullify_others)
-        .filter(pl.any_horizontal(pl.all().is_not_null()))
+        data_with_statistics.select(*group_columns, *keep_outlier_nullify_others)
+        .filter(pl.any_horizontal(pl.col(columns).is_not_null()))
         .collect()
     )
 
-    tagged_outliers = tagged_outliers.rename(lambda col: col.replace("_out__", ""))
-
-    columns_with_null = [col.name for col in tagged_outliers if col.is_not_null().any()]
+    columns_with_null = [
+        col for col in columns if tagged_outliers.get_column(col).is_not_null().any()
+    ]
 
     if columns_with_null:
-        bad_examples = tagged_outliers.select(columns_with_null)
+        bad_examples = tagged_outliers.select(*group_columns, *columns_with_null)
         raise PolarsAssertError(
             df=bad_examples,
             supp_message=(
@@ -121,3 +217,98 @@ def column_is_within_n_std(
         )
 
     return data
+
+
+_JOIN_NULLS = (
+    {"nulls_equal": True}
+    if _has_sufficient_polars_version("1.24.0")
+    else {"join_nulls": True}
+)
+
+
+def _get_statistics(
+    data: PolarsLazyOrDataFrame,
+    columns: list[str],
+    group_columns: list[str],
+    load_baseline: str | Path | pl.DataFrame | None = None,
+) -> pl.DataFrame:
+    """Mean and std of the columns, in a wide format with one row per group:
+    `*group_columns, {col}_mean__, {col}_std__, ...`"""
+    statistics = None
+    missing_columns = columns
+
+    if load_baseline is not None:
+        baseline = (
+            load_baseline
+            if isinstance(load_baseline, pl.DataFrame)
+            else pl.read_parquet(load_baseline)
+        )
+        loaded_columns = [col for col in columns if col in baseline["column"]]
+        missing_columns = [col for col in columns if col not in loaded_columns]
+        if loaded_columns:
+            statistics = _from_baseline(baseline, loaded_columns, group_columns)
+
+    if missing_columns:
+        # A single aggregation computes the statistics of every column in one pass
+        aggregations = [
+            *[pl.col(col).mean().alias(f"{col}_mean__") for col in missing_columns],
+            *[pl.col(col).std().alias(f"{col}_std__") for col in missing_columns],
+        ]
+        if group_columns:
+            computed = data.lazy().group_by(group_columns).agg(aggregations).collect()
+        else:
+            computed = data.lazy().select(aggregations).collect()
+        statistics = _merge_statistics(statistics, computed, group_columns)
+
+    assert statistics is not None
+    return statistics.select(
+        *group_columns,
+        *[
+            pl.col(f"{col}_{stat}__").cast(pl.Float64)
+            for col in columns
+            for stat in ("mean", "std")
+        ],
+    )
+
+
+def _merge_statistics(
+    left: pl.DataFrame | None, right: pl.DataFrame, group_columns: list[str]
+) -> pl.DataFrame:
+    if left is None:
+        return right
+    if not group_columns:
+        return pl.concat([left, right], how="horizontal")
+    return left.join(right, on=group_columns, how="full", coalesce=True, **_JOIN_NULLS)
+
+
+def _from_baseline(
+    baseline: pl.DataFrame, columns: list[str], group_columns: list[str]
+) -> pl.DataFrame:
+    """Convert a baseline `*group_columns, column, mean, std` to the wide format"""
+    statistics = None
+    for col in columns:
+        column_statistics = baseline.filter(pl.col("column") == col).select(
+            *group_columns,
+            pl.col("mean").alias(f"{col}_mean__"),
+            pl.col("std").alias(f"{col}_std__"),
+        )
+        statistics = _merge_statistics(statistics, column_statistics, group_columns)
+    assert statistics is not None
+    return statistics
+
+
+def _to_baseline(
+    statistics: pl.DataFrame, columns: list[str], group_columns: list[str]
+) -> pl.DataFrame:
+    """Convert wide statistics to a baseline `*group_columns, column, mean, std`"""
+    return pl.concat(
+        [
+            statistics.select(
+                *group_columns,
+                pl.lit(col).alias("column"),
+                pl.col(f"{col}_mean__").alias("mean"),
+                pl.col(f"{col}_std__").alias("std"),
+            )
+            for col in columns
+        ]
+    )
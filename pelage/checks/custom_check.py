@@ -1,10 +1,16 @@
 import polars as pl
 
+from pelage.sampling import _check_sample
 from pelage.types import PolarsAssertError, PolarsLazyOrDataFrame
+from pelage.utils import _accept_arrow_inputs
 
 
+@_accept_arrow_inputs
 def custom_check(
-    data: PolarsLazyOrDataFrame, expression: pl.Expr
+    data: PolarsLazyOrDataFrame,
+    expression: pl.Expr,
+    sample: float | None = None,
+    stratify_by: str | list[str] | None = None,
 ) -> PolarsLazyOrDataFrame:
     """Use custom Polars expression to check the DataFrame, based on `.filter()`.
 
@@ -24,6 +30,14 @@ def custom_check(
         Polar Expression that can be passed to the `.filter()` method. As describe
         above, use an expression that should keep forbidden values when passed to the
         filter
+    sample : Optional[float], optional
+        Fraction of the rows to check, between 0 and 1. The sampled rows are selected
+        from a hash of their position, so that the same rows are checked from one run
+        to the other. On failure, the rate of violations in the whole data is estimated
+        with a 95% confidence interval. By default None, all the rows are checked.
+    stratify_by : Optional[Union[str, List[str]]], optional
+        When sampling, draw the same fraction of rows in each group of these columns,
+        with at least one row per group, by default None
 
     Returns
     -------
@@ -63,6 +77,16 @@ def custom_check(
     Error with the DataFrame passed to the check function:
     --> Unexpected data in `Custom Check`: [(col("a")) != (dyn int: 3)]
     """
+    if sample is not None:
+        _check_sample(
+            data,
+            _unexpected_rows(expression),
+            sample,
+            stratify_by,
+            f"Unexpected data in `Custom Check`: {str(expression)}",
+        )
+        return data
+
     columns_in_expr = set(expression.meta.root_names())
     bad_data = data.lazy().select(columns_in_expr).filter(expression.not_()).collect()
 
@@ -72,3 +96,8 @@ def custom_check(
             supp_message=f"Unexpected data in `Custom Check`: {str(expression)}",
         )
     return data
+
+
+def _unexpected_rows(expression: pl.Expr) -> pl.Expr:
+    """Rows that are not kept by the custom check expression"""
+    return expression.not_().fill_null(False)
@@ -0,0 +1,115 @@
+import polars as pl
+
+from pelage.types import IntOrNone, PolarsAssertError, PolarsLazyOrDataFrame
+from pelage.utils import _accept_arrow_inputs
+
+
+@_accept_arrow_inputs
+def has_approx_cardinality(
+    data: PolarsLazyOrDataFrame,
+    items: dict[str, tuple[IntOrNone, IntOrNone]],
+) -> PolarsLazyOrDataFrame:
+    """Check that the number of distinct values of columns is within bounds.
+
+    The distinct counts are estimated with the HyperLogLog algorithm of the Polars
+    `approx_n_unique` expression, which uses a small constant amount of memory instead
+    of hashing every value. Estimates are usually within 1% of the exact count, hence
+    this check is meant for bounds with some slack. Nulls count as one distinct value.
+
+    Parameters
+    ----------
+    data : PolarsLazyOrDataFrame
+        The polars DataFrame or LazyFrame to test.
+    items : Dict[str, Tuple[IntOrNone, IntOrNone]]
+        A dictionnary of column names with the minimal and maximal number of distinct
+        values expected in the column. Use `None` to leave one side unbounded:
+        ```
+        {
+            "country": (150, 260),
+            "user_id": (1_000_000, None),
+            ...
+        }
+        ```
+
+    Returns
+    -------
+    PolarsLazyOrDataFrame
+        The original polars DataFrame or LazyFrame when the check passes
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> df = pl.DataFrame({"a": [1, 2, 3, 3], "b": ["x", "x", "x", "y"]})
+    >>> df.pipe(plg.has_approx_cardinality, {"a": (2, 5), "b": (None, 2)})
+    shape: (4, 2)
+    ┌─────┬─────┐
+    │ a   ┆ b   │
+    │ --- ┆ --- │
+    │ i64 ┆ str │
+    ╞═════╪═════╡
+    │ 1   ┆ x   │
+    │ 2   ┆ x   │
+    │ 3   ┆ x   │
+    │ 3   ┆ y   │
+    └─────┴─────┘
+
+    >>> df.pipe(plg.has_approx_cardinality, {"a": (2, 5), "b": (3, None)})
+    Traceback (most recent call last):
+    ...
+    pelage.types.PolarsAssertError: Details
+    shape: (1, 4)
+    ┌────────┬─────────────────┬────────────────┬────────────────┐
+    │ column ┆ approx_n_unique ┆ min_n_distinct ┆ max_n_distinct │
+    │ ---    ┆ ---             ┆ ---            ┆ ---            │
+    │ str    ┆ i64             ┆ i64            ┆ i64            │
+    ╞════════╪═════════════════╪════════════════╪════════════════╡
+    │ b      ┆ 2               ┆ 3              ┆ null           │
+    └────────┴─────────────────┴────────────────┴────────────────┘
+    Error with the DataFrame passed to the check function:
+    --> Some columns have an estimated number of distinct values beyond the bounds
+    """
+    for low, high in items.values():
+        if low is None and high is None:
+            raise ValueError("Both bounds of a cardinality cannot be set to None")
+
+    estimates = (
+        data.lazy()
+        .select(pl.col(items.keys()).approx_n_unique().cast(pl.Int64))
+        .unpivot(variable_name="column", value_name="approx_n_unique")
+    )
+    _check_cardinalities(estimates, items)
+    return data
+
+
+def _check_cardinalities(
+    estimates: pl.LazyFrame, items: dict[str, tuple[IntOrNone, IntOrNone]]
+) -> None:
+    """Raise when the estimates `column, approx_n_unique` are beyond the bounds"""
+    bounds = pl.DataFrame(
+        [(column, low, high) for column, (low, high) in items.items()],
+        schema={
+            "column": pl.String,
+            "min_n_distinct": pl.Int64,
+            "max_n_distinct": pl.Int64,
+        },
+        orient="row",
+    )
+
+    out_of_bounds = (
+        estimates.join(bounds.lazy(), on="column", how="inner")
+        .filter(
+            (pl.col("approx_n_unique") < pl.col("min_n_distinct"))
+            | (pl.col("approx_n_unique") > pl.col("max_n_distinct"))
+        )
+        .collect()
+    )
+
+    if not out_of_bounds.is_empty():
+        raise PolarsAssertError(
+            df=out_of_bounds,
+            supp_message=(
+                "Some columns have an estimated number of distinct values beyond the "
+                + "bounds"
+            ),
+        )
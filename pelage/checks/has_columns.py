@@ -1,6 +1,8 @@
 from pelage.types import PolarsAssertError, PolarsLazyOrDataFrame
+from pelage.utils import _accept_arrow_inputs
 
 
+@_accept_arrow_inputs
 def has_columns(
     data: PolarsLazyOrDataFrame, names: str | list[str]
 ) -> PolarsLazyOrDataFrame:
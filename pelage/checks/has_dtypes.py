@@ -3,8 +3,10 @@ from pelage.types import (
     PolarsDataType,
     PolarsLazyOrDataFrame,
 )
+from pelage.utils import _accept_arrow_inputs
 
 
+@_accept_arrow_inputs
 def has_dtypes(
     data: PolarsLazyOrDataFrame,
     items: dict[str, PolarsDataType],  # type: ignore
@@ -0,0 +1,160 @@
+from typing import Literal
+
+import polars as pl
+
+from pelage.types import PolarsAssertError, PolarsLazyOrDataFrame
+from pelage.utils import _accept_arrow_inputs
+
+JoinRelationship = Literal["1:1", "1:m", "m:1"]
+
+
+@_accept_arrow_inputs
+def has_join_cardinality(
+    data: PolarsLazyOrDataFrame,
+    other_df: pl.DataFrame | pl.LazyFrame,
+    on: str | list[str],
+    relationship: JoinRelationship = "m:1",
+    top_n: int = 5,
+) -> PolarsLazyOrDataFrame:
+    """Ensure that joining two DataFrames on the given keys would respect the
+        expected cardinality, without actually performing the join.
+
+    The keys multiplicity is computed on both sides with a `group_by` count, only the
+    (much smaller) tables of counts are then joined together. This allows to detect
+    unexpected row explosions before running a large join. The relationships follow
+    the `validate` argument of the Polars `join` method, where `data` is the left side.
+    Null keys are ignored as they never match in a join.
+
+    Parameters
+    ----------
+    data : PolarsLazyOrDataFrame
+        The polars DataFrame or LazyFrame to test, left side of the future join.
+    other_df : Union[pl.DataFrame, pl.LazyFrame]
+        Right side of the future join.
+    on : Union[str, List[str]]
+        Key column(s), present in both DataFrames.
+    relationship : str, optional
+        One of "1:1", "1:m" or "m:1", by default "m:1"
+
+        - "1:1": keys are unique in both DataFrames
+        - "1:m": keys are unique in `data`
+        - "m:1": keys are unique in `other_df`
+    top_n : int, optional
+        Number of keys with the largest fan-out reported on failure, by default 5
+
+    Returns
+    -------
+    PolarsLazyOrDataFrame
+        The original polars DataFrame or LazyFrame when the check passes
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> orders = pl.DataFrame({"customer": [1, 1, 2], "amount": [10, 20, 30]})
+    >>> customers = pl.DataFrame({"customer": [1, 2], "name": ["Ann", "Bob"]})
+    >>> orders.pipe(plg.has_join_cardinality, customers, "customer", "m:1")
+    shape: (3, 2)
+    ┌──────────┬────────┐
+    │ customer ┆ amount │
+    │ ---      ┆ ---    │
+    │ i64      ┆ i64    │
+    ╞══════════╪════════╡
+    │ 1        ┆ 10     │
+    │ 1        ┆ 20     │
+    │ 2        ┆ 30     │
+    └──────────┴────────┘
+
+    >>> duplicated_customers = pl.DataFrame({"customer": [1, 1, 2]})
+    >>> orders.pipe(plg.has_join_cardinality, duplicated_customers, "customer")
+    Traceback (most recent call last):
+    ...
+    pelage.types.PolarsAssertError: Details
+    shape: (1, 4)
+    ┌──────────┬────────────┬─────────────┬─────────┐
+    │ customer ┆ left_count ┆ right_count ┆ fan_out │
+    │ ---      ┆ ---        ┆ ---         ┆ ---     │
+    │ i64      ┆ u64        ┆ u64         ┆ u64     │
+    ╞══════════╪════════════╪═════════════╪═════════╡
+    │ 1        ┆ 2          ┆ 2           ┆ 4       │
+    └──────────┴────────────┴─────────────┴─────────┘
+    Error with the DataFrame passed to the check function:
+    --> Join keys ['customer'] are not m:1, maximum fan-out: 4
+    Estimated inner join size: 5 rows, from 3 rows on the left side
+    """
+    if relationship not in ("1:1", "1:m", "m:1"):
+        raise ValueError(
+            f"relationship should be one of '1:1', '1:m', 'm:1': {relationship}"
+        )
+
+    keys = [on] if isinstance(on, str) else on
+
+    _check_key_counts(
+        _count_keys(data, keys, "left_count"), other_df, keys, relationship, top_n
+    )
+    return data
+
+
+def _check_key_counts(
+    left_counts: pl.DataFrame | pl.LazyFrame,
+    other_df: pl.DataFrame | pl.LazyFrame,
+    keys: list[str],
+    relationship: JoinRelationship,
+    top_n: int,
+) -> None:
+    """Raise when the number of rows per key, from `_count_keys`, does not match the
+    relationship with the keys of `other_df`"""
+    key_counts = left_counts.lazy().join(
+        _count_keys(other_df, keys, "right_count"),
+        on=keys,
+        how="full",
+        coalesce=True,
+    )
+    key_counts = key_counts.with_columns(
+        pl.col("left_count", "right_count").fill_null(0)
+    ).with_columns(fan_out=pl.col("left_count") * pl.col("right_count"))
+
+    match relationship:
+        case "1:1":
+            is_violation = (pl.col("left_count") > 1) | (pl.col("right_count") > 1)
+        case "1:m":
+            is_violation = pl.col("left_count") > 1
+        case _:  # "m:1"
+            is_violation = pl.col("right_count") > 1
+
+    worst_keys, join_estimates = pl.collect_all(
+        [
+            key_counts.filter(is_violation)
+            .sort("fan_out", "left_count", "right_count", descending=True)
+            .head(top_n),
+            key_counts.select(
+                pl.col("fan_out").max().alias("max_fan_out"),
+                pl.col("fan_out").sum().alias("estimated_rows"),
+                pl.col("left_count").sum().alias("left_rows"),
+            ),
+        ]
+    )
+
+    if not worst_keys.is_empty():
+        max_fan_out, estimated_rows, left_rows = join_estimates.row(0)
+        raise PolarsAssertError(
+            df=worst_keys,
+            supp_message=(
+                f"Join keys {keys} are not {relationship}, "
+                + f"maximum fan-out: {max_fan_out}\n"
+                + f"Estimated inner join size: {estimated_rows} rows, "
+                + f"from {left_rows} rows on the left side"
+            ),
+        )
+
+
+def _count_keys(
+    data: pl.DataFrame | pl.LazyFrame, keys: list[str], count_name: str
+) -> pl.LazyFrame:
+    return (
+        data.lazy()
+        .select(keys)
+        .filter(pl.all_horizontal(pl.all().is_not_null()))
+        .group_by(keys)
+        .agg(pl.len().cast(pl.UInt64).alias(count_name))
+    )
@@ -5,6 +5,7 @@ from pelage.types import (
     PolarsLazyOrDataFrame,
     PolarsOverClauseInput,
 )
+from pelage.utils import _accept_arrow_inputs
 
 
 def _format_missing_elements(selected_data: pl.DataFrame, items: dict):
@@ -18,6 +19,7 @@ def _format_missing_elements(selected_data: pl.DataFrame, items: dict):
     return missing
 
 
+@_accept_arrow_inputs
 def has_mandatory_values(
     data: PolarsLazyOrDataFrame,
     items: dict[str, list],
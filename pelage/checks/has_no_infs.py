@@ -1,16 +1,20 @@
 import polars as pl
 
+from pelage.sampling import _check_sample
 from pelage.types import (
     PolarsAssertError,
     PolarsColumnType,
     PolarsLazyOrDataFrame,
 )
-from pelage.utils import _sanitize_column_inputs
+from pelage.utils import _accept_arrow_inputs, _sanitize_column_inputs
 
 
+@_accept_arrow_inputs
 def has_no_infs(
     data: PolarsLazyOrDataFrame,
     columns: PolarsColumnType | None = None,
+    sample: float | None = None,
+    stratify_by: str | list[str] | None = None,
 ) -> PolarsLazyOrDataFrame:
     """Check if a DataFrame has any infinite (inf) values.
 
@@ -20,6 +24,14 @@ def has_no_infs(
         The input DataFrame to check for null values.
     columns : Optional[PolarsColumnType] , optional
         Columns to consider for null value check. By default, all columns are checked.
+    sample : Optional[float], optional
+        Fraction of the rows to check, between 0 and 1. The sampled rows are selected
+        from a hash of their position, so that the same rows are checked from one run
+        to the other. On failure, the rate of violations in the whole data is estimated
+        with a 95% confidence interval. By default None, all the rows are checked.
+    stratify_by : Optional[Union[str, List[str]]], optional
+        When sampling, draw the same fraction of rows in each group of these columns,
+        with at least one row per group, by default None
 
     Returns
     -------
@@ -63,13 +75,25 @@ def has_no_infs(
     │ 2   ┆ inf │
     └─────┴─────┘
     """
-    selected_columns = _sanitize_column_inputs(columns)
-    inf_values = (
-        data.lazy().filter(pl.any_horizontal(selected_columns.is_infinite())).collect()
-    )
+    if sample is not None:
+        _check_sample(
+            data,
+            _rows_with_infs(columns),
+            sample,
+            stratify_by,
+            "The were unexpeted infinites in the dataframe. See above.",
+        )
+        return data
+
+    inf_values = data.lazy().filter(_rows_with_infs(columns)).collect()
 
     if not inf_values.is_empty():
         raise PolarsAssertError(
             inf_values, "The were unexpeted infinites in the dataframe. See above."
         )
     return data
+
+
+def _rows_with_infs(columns: PolarsColumnType | None = None) -> pl.Expr:
+    """Rows with at least one infinite value in the selected columns"""
+    return pl.any_horizontal(_sanitize_column_inputs(columns).is_infinite())
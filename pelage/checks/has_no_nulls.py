@@ -1,18 +1,23 @@
 import polars as pl
 
+from pelage.sampling import _check_sample
 from pelage.types import (
     PolarsAssertError,
     PolarsColumnType,
     PolarsLazyOrDataFrame,
 )
 from pelage.utils import (
+    _accept_arrow_inputs,
     _sanitize_column_inputs,
 )
 
 
+@_accept_arrow_inputs
 def has_no_nulls(
     data: PolarsLazyOrDataFrame,
     columns: PolarsColumnType | None = None,
+    sample: float | None = None,
+    stratify_by: str | list[str] | None = None,
 ) -> PolarsLazyOrDataFrame:
     """Check if a DataFrame has any null (missing) values.
 
@@ -22,6 +27,14 @@ def has_no_nulls(
         The input DataFrame to check for null values.
     columns : Optional[PolarsColumnType] , optional
         Columns to consider for null value check. By default, all columns are checked.
+    sample : Optional[float], optional
+        Fraction of the rows to check, between 0 and 1. The sampled rows are selected
+        from a hash of their position, so that the same rows are checked from one run
+        to the other. On failure, the rate of violations in the whole data is estimated
+        with a 95% confidence interval. By default None, all the rows are checked.
+    stratify_by : Optional[Union[str, List[str]]], optional
+        When sampling, draw the same fraction of rows in each group of these columns,
+        with at least one row per group, by default None
 
     Returns
     -------
@@ -62,6 +75,16 @@ def has_no_nulls(
     Error with the DataFrame passed to the check function:
     --> There were unexpected nulls in the columns above
     """
+    if sample is not None:
+        _check_sample(
+            data,
+            _rows_with_nulls(columns),
+            sample,
+            stratify_by,
+            "There were unexpected nulls in the rows above",
+        )
+        return data
+
     selected_columns = _sanitize_column_inputs(columns)
     null_count = (
         data.lazy()
@@ -76,3 +99,8 @@ def has_no_nulls(
             null_count, "There were unexpected nulls in the columns above"
         )
     return data
+
+
+def _rows_with_nulls(columns: PolarsColumnType | None = None) -> pl.Expr:
+    """Rows with at least one null in the selected columns"""
+    return pl.any_horizontal(_sanitize_column_inputs(columns).is_null())
@@ -6,8 +6,10 @@ from pelage.types import (
     PolarsLazyOrDataFrame,
     PolarsOverClauseInput,
 )
+from pelage.utils import _accept_arrow_inputs
 
 
+@_accept_arrow_inputs
 def has_shape(
     data: PolarsLazyOrDataFrame,
     shape: tuple[IntOrNone, IntOrNone],
@@ -102,34 +104,44 @@ def has_shape(
         )
 
     if group_by is not None:
-        non_matching_row_count = (
-            data.lazy()
-            .group_by(group_by)
-            .agg(pl.len())
-            .filter(pl.col("len") != shape[0])
-            .collect()
+        _check_group_sizes(
+            data.lazy().group_by(group_by).agg(pl.len()).collect(), shape
         )
-
-        if len(non_matching_row_count) > 0:
-            raise PolarsAssertError(
-                df=non_matching_row_count,
-                supp_message=f"The number of rows per group does not match the specified value: {shape[0]}",  # noqa: E501
-            )
         return data
 
-    actual_shape = _get_frame_shape(data)
+    _check_shape(_get_frame_shape(data), shape)
+    return data
+
+
+def _check_group_sizes(
+    group_sizes: pl.DataFrame, shape: tuple[IntOrNone, IntOrNone]
+) -> None:
+    """Raise when the `len` of some groups does not match the expected row count"""
+    non_matching_row_count = group_sizes.filter(pl.col("len") != shape[0])
+
+    if len(non_matching_row_count) > 0:
+        raise PolarsAssertError(
+            df=non_matching_row_count,
+            supp_message=f"The number of rows per group does not match the specified value: {shape[0]}",  # noqa: E501
+        )
+
+
+def _check_shape(
+    actual_shape: tuple[int, int], shape: tuple[IntOrNone, IntOrNone]
+) -> None:
+    """Raise when the shape of the data does not match, `None` matching any size"""
+    compared_shape: tuple[IntOrNone, IntOrNone] = actual_shape
 
     if shape[1] is None:
-        actual_shape = actual_shape[0], None
+        compared_shape = compared_shape[0], None
 
     if shape[0] is None:
-        actual_shape = None, actual_shape[1]
+        compared_shape = None, compared_shape[1]
 
-    if actual_shape != shape:
+    if compared_shape != shape:
         raise PolarsAssertError(
             supp_message=f"The data has not the expected shape: {shape}"
         )
-    return data
 
 
 def _get_frame_shape(data: PolarsLazyOrDataFrame) -> tuple[int, int]:
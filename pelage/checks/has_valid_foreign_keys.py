@@ -0,0 +1,152 @@
+import polars as pl
+
+from pelage.types import PolarsAssertError, PolarsLazyOrDataFrame
+from pelage.utils import _accept_arrow_inputs
+
+ReferenceFrame = pl.DataFrame | pl.LazyFrame
+
+
+@_accept_arrow_inputs
+def has_valid_foreign_keys(
+    data: PolarsLazyOrDataFrame,
+    references: dict[str, ReferenceFrame | tuple[ReferenceFrame, str]],
+    sample_size: int = 5,
+) -> PolarsLazyOrDataFrame:
+    """Ensure that every foreign key of a fact table exists in its dimension table.
+
+    The foreign key columns of the fact table are read once, whatever the number of
+    dimensions to check, and reduced to their distinct values: only these are
+    anti-joined to the dimensions, in a single query plan. Null keys are ignored, as
+    in dbt `relationships` tests, and orphan keys are sampled in sorted order.
+
+    Contrary to `maintains_relationships`, the check is one-directional: dimension
+    values that are absent from the fact table are allowed.
+
+    Parameters
+    ----------
+    data : PolarsLazyOrDataFrame
+        The polars DataFrame or LazyFrame to test, usually the fact table.
+    references : Dict[str, Union[PolarsFrame, Tuple[PolarsFrame, str]]]
+        A dictionnary where the keys are the foreign key columns of `data` and the
+        values are the dimension frames containing the referenced keys. When the key
+        column has another name in the dimension, use a `(dimension, column)` tuple:
+        ```
+        {
+            "store_id": stores_df,
+            "product_id": (products_df, "id"),
+            ...
+        }
+        ```
+    sample_size : int, optional
+        Maximum number of orphan keys reported for each foreign key, by default 5
+
+    Returns
+    -------
+    PolarsLazyOrDataFrame
+        The original polars DataFrame or LazyFrame when the check passes
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> facts = pl.DataFrame({"store": [1, 2, 2, 3], "product": ["a", "b", "c", "d"]})
+    >>> stores = pl.DataFrame({"store": [1, 2, 3]})
+    >>> products = pl.DataFrame({"id": ["a", "b"]})
+    >>> facts.pipe(plg.has_valid_foreign_keys, {"store": stores})
+    shape: (4, 2)
+    ┌───────┬─────────┐
+    │ store ┆ product │
+    │ ---   ┆ ---     │
+    │ i64   ┆ str     │
+    ╞═══════╪═════════╡
+    │ 1     ┆ a       │
+    │ 2     ┆ b       │
+    │ 2     ┆ c       │
+    │ 3     ┆ d       │
+    └───────┴─────────┘
+
+    >>> facts.pipe(
+    ...     plg.has_valid_foreign_keys,
+    ...     {"store": stores, "product": (products, "id")},
+    ... )
+    Traceback (most recent call last):
+    ...
+    pelage.types.PolarsAssertError: Details
+    shape: (1, 3)
+    ┌─────────┬──────────────┬───────────────┐
+    │ column  ┆ orphan_count ┆ orphan_sample │
+    │ ---     ┆ ---          ┆ ---           │
+    │ str     ┆ u32          ┆ list[str]     │
+    ╞═════════╪══════════════╪═══════════════╡
+    │ product ┆ 2            ┆ ["c", "d"]    │
+    └─────────┴──────────────┴───────────────┘
+    Error with the DataFrame passed to the check function:
+    --> Some foreign keys are missing from their reference tables: ['product']
+    """
+    if not references:
+        return data
+
+    # The fact table is read once and reduced to the distinct values of each key,
+    # with their number of rows: memory is bounded by the cardinality of the keys
+    key_counts = (
+        data.lazy()
+        .select(
+            pl.col(column).drop_nulls().value_counts().implode()
+            for column in references
+        )
+        .collect()
+    )
+
+    orphans_per_key = [
+        _count_orphan_keys(key_counts, column, reference, sample_size)
+        for column, reference in references.items()
+    ]
+
+    orphan_summary = (
+        pl.concat(orphans_per_key, how="vertical")
+        .filter(pl.col("orphan_count") > 0)
+        .collect()
+    )
+
+    if not orphan_summary.is_empty():
+        bad_columns = orphan_summary.get_column("column").to_list()
+        raise PolarsAssertError(
+            df=orphan_summary,
+            supp_message=(
+                "Some foreign keys are missing from their reference tables: "
+                + f"{bad_columns}"
+            ),
+        )
+    return data
+
+
+def _count_orphan_keys(
+    key_counts: pl.DataFrame,
+    column: str,
+    reference: ReferenceFrame | tuple[ReferenceFrame, str],
+    sample_size: int,
+) -> pl.LazyFrame:
+    reference_df, reference_column = (
+        reference if isinstance(reference, tuple) else (reference, column)
+    )
+    reference_keys = (
+        reference_df.lazy().select(pl.col(reference_column).alias(column)).unique()
+    )
+    return (
+        key_counts.lazy()
+        .select(pl.col(column).explode())
+        .unnest(column)
+        # A key without any value explodes to a single null row
+        .filter(pl.col(column).is_not_null())
+        .join(reference_keys, on=column, how="anti")
+        .sort(column)
+        .select(
+            pl.lit(column).alias("column"),
+            pl.col("count").sum().cast(pl.UInt32).alias("orphan_count"),
+            pl.col(column)
+            .head(sample_size)
+            .cast(pl.String)
+            .implode()
+            .alias("orphan_sample"),
+        )
+    )
@@ -5,8 +5,10 @@ from pelage.types import (
     PolarsLazyOrDataFrame,
     PolarsOverClauseInput,
 )
+from pelage.utils import _accept_arrow_inputs
 
 
+@_accept_arrow_inputs
 def is_monotonic(
     data: PolarsLazyOrDataFrame,
     column: str,
@@ -1,8 +1,10 @@
 import polars as pl
 
 from pelage.types import PolarsAssertError, PolarsLazyOrDataFrame
+from pelage.utils import _accept_arrow_inputs
 
 
+@_accept_arrow_inputs
 def maintains_relationships(
     data: PolarsLazyOrDataFrame,
     other_df: pl.DataFrame | pl.LazyFrame,
@@ -5,9 +5,13 @@ from pelage.types import (
     PolarsLazyOrDataFrame,
     PolarsOverClauseInput,
 )
-from pelage.utils import _has_sufficient_polars_version
+from pelage.utils import _accept_arrow_inputs, _has_sufficient_polars_version
 
+# `is_in` expects an imploded list to look for values of another expression
+_IMPLODE_IS_IN = _has_sufficient_polars_version("1.30.0")
 
+
+@_accept_arrow_inputs
 def mutually_exclusive_ranges(
     data: PolarsLazyOrDataFrame,
     low_bound: str,
@@ -104,7 +108,7 @@ def mutually_exclusive_ranges(
         .filter(
             pl.col("index").is_in(indexes_of_overlaps.implode())
             | pl.col("index").is_in((indexes_of_overlaps - 1).implode())
-            if _has_sufficient_polars_version("1.30.0")
+            if _IMPLODE_IS_IN
             else pl.col("index").is_in(indexes_of_overlaps)
             | pl.col("index").is_in(indexes_of_overlaps - 1)
         )
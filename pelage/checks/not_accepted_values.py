@@ -1,8 +1,10 @@
 import polars as pl
 
 from pelage.types import PolarsAssertError, PolarsLazyOrDataFrame
+from pelage.utils import _accept_arrow_inputs
 
 
+@_accept_arrow_inputs
 def not_accepted_values(
     data: PolarsLazyOrDataFrame, items: dict[str, list]
 ) -> PolarsLazyOrDataFrame:
@@ -77,3 +79,10 @@ def not_accepted_values(
             "This DataFrame contains values marked as forbidden",
         )
     return data
+
+
+def _forbidden_values(items: dict[str, list]) -> pl.Expr:
+    """Rows containing values marked as forbidden"""
+    return pl.any_horizontal(
+        pl.col(col).is_in(values) for col, values in items.items()
+    ).fill_null(False)
@@ -6,10 +6,12 @@ from pelage.types import (
     PolarsLazyOrDataFrame,
 )
 from pelage.utils import (
+    _accept_arrow_inputs,
     _sanitize_column_inputs,
 )
 
 
+@_accept_arrow_inputs
 def not_constant(
     data: PolarsLazyOrDataFrame,
     columns: PolarsColumnType | None = None,
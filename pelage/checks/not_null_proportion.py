@@ -5,8 +5,10 @@ from pelage.types import (
     PolarsLazyOrDataFrame,
     PolarsOverClauseInput,
 )
+from pelage.utils import _accept_arrow_inputs
 
 
+@_accept_arrow_inputs
 def not_null_proportion(
     data: PolarsLazyOrDataFrame,
     items: dict[str, float | tuple[float, float]],
@@ -118,34 +120,59 @@ def not_null_proportion(
     --> Some columns contains a proportion of nulls beyond specified limits
     """
 
-    pl_ranges = _format_ranges_by_columns(items)
+    _check_null_proportions(_null_counts(data, group_by).collect(), items)
+    return data
+
+
+def _null_counts(
+    data: PolarsLazyOrDataFrame,
+    group_by: PolarsOverClauseInput | None = None,
+) -> pl.LazyFrame:
+    """Number of nulls and of rows of each column: `*group_by, column, null_count, len`
 
+    The counts of several parts of the data can be summed, to get those of the whole.
+    """
     # Trick with to have the same implementation between group_by and direct version
     # Also simplifies LazyFrame logic which does not have the len() except in group_by
     if group_by is None:
-        formatted_data = data.with_columns(constant__=0)
+        formatted_data = data.lazy().with_columns(constant__=0)
         group_by = "constant__"
     else:
-        formatted_data = data
-
-    null_proportions = (
-        formatted_data.lazy()
-        .group_by(group_by)
-        .agg(pl.all().null_count() / pl.len())
-        .unpivot(
-            index=group_by,  # type: ignore
-            variable_name="column",
-            value_name="null_proportion",
-        )
-        .with_columns(not_null_fraction=1 - pl.col("null_proportion"))
-        .collect()
-    )
+        formatted_data = data.lazy()
 
-    if "constant__" in null_proportions.columns:
-        null_proportions = null_proportions.drop("constant__")
+    counts = formatted_data.group_by(group_by).agg(
+        pl.len().alias("len__"), pl.all().null_count()
+    )
+    # The group columns come first, whatever the form of `group_by`
+    names = counts.collect_schema().names()
+    group_columns = names[: names.index("len__")]
+    null_counts = counts.unpivot(
+        index=[*group_columns, "len__"],
+        variable_name="column",
+        value_name="null_count",
+    ).rename({"len__": "len"})
+
+    if "constant__" in group_columns:
+        null_counts = null_counts.drop("constant__")
+    return null_counts
+
+
+def _check_null_proportions(
+    null_counts: pl.DataFrame, items: dict[str, float | tuple[float, float]]
+) -> None:
+    """Raise when the proportions of non-null values computed from `_null_counts` are
+    beyond the ranges of `items`"""
+    null_proportions = null_counts.with_columns(
+        null_proportion=pl.col("null_count") / pl.col("len")
+    ).select(
+        pl.exclude("null_count", "len"),
+        not_null_fraction=1 - pl.col("null_proportion"),
+    )
 
     out_of_range_null_proportions = (
-        null_proportions.join(pl_ranges, on="column", how="inner")
+        null_proportions.join(
+            _format_ranges_by_columns(items), on="column", how="inner"
+        )
         .filter(
             ~pl.col("not_null_fraction").is_between(
                 pl.col("min_prop"), pl.col("max_prop")
@@ -158,7 +185,6 @@ def not_null_proportion(
             out_of_range_null_proportions,
             "Some columns contains a proportion of nulls beyond specified limits",
         )
-    return data
 
 
 def _format_ranges_by_columns(
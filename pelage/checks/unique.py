@@ -6,13 +6,19 @@ from pelage.types import (
     PolarsLazyOrDataFrame,
     PolarsOverClauseInput,
 )
-from pelage.utils import _sanitize_column_inputs
+from pelage.utils import (
+    _accept_arrow_inputs,
+    _approx_duplicated_columns,
+    _sanitize_column_inputs,
+)
 
 
+@_accept_arrow_inputs
 def unique(
     data: PolarsLazyOrDataFrame,
     columns: PolarsColumnType | None = None,
     group_by: PolarsOverClauseInput | None = None,
+    approx_precheck: bool = False,
 ) -> PolarsLazyOrDataFrame:
     """Check if there are no duplicated values in each one of the selected columns.
 
@@ -28,6 +34,11 @@ def unique(
     group_by : Optional[PolarsOverClauseInput], optional
         Use this option to ensure uniqueness with data segmented by group.
         by default None
+    approx_precheck : bool, optional
+        Start by estimating the number of distinct values of each column with
+        `approx_n_unique`, which is much cheaper than the exact hashing of values. When
+        the estimate is clearly below the number of rows, the check fails immediately.
+        Only used without `group_by`, by default False
 
     Returns
     -------
@@ -114,6 +125,16 @@ def unique(
     --> Somes values are duplicated within the specified columns
     """
     selected_cols = _sanitize_column_inputs(columns)
+
+    if approx_precheck and group_by is None:
+        duplicated_columns = _approx_duplicated_columns(data, selected_cols)
+        if not duplicated_columns.is_empty():
+            raise PolarsAssertError(
+                df=duplicated_columns,
+                supp_message="Somes values are duplicated within the specified columns"
+                + " (estimated with approx_n_unique)",
+            )
+
     highlight_columns_with_duplication = (
         selected_cols.is_duplicated()
         if group_by is None
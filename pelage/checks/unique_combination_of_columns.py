@@ -6,13 +6,17 @@ from pelage.types import (
     PolarsLazyOrDataFrame,
 )
 from pelage.utils import (
+    _accept_arrow_inputs,
+    _approx_duplicated_columns,
     _sanitize_column_inputs,
 )
 
 
+@_accept_arrow_inputs
 def unique_combination_of_columns(
     data: PolarsLazyOrDataFrame,
     columns: PolarsColumnType | None = None,
+    approx_precheck: bool = False,
 ) -> PolarsLazyOrDataFrame:
     """Ensure that the selected column have a unique combination per row.
 
@@ -25,6 +29,11 @@ def unique_combination_of_columns(
         The polars DataFrame or LazyFrame to test.
     columns : Optional[PolarsColumnType] , optional
         Columns to consider for row unicity. By default, all columns are checked.
+    approx_precheck : bool, optional
+        Start by estimating the number of distinct combinations with
+        `approx_n_unique`, which is much cheaper than the exact `group_by`. When the
+        estimate is clearly below the number of rows, the check fails immediately,
+        by default False
 
     Returns
     -------
@@ -65,6 +74,18 @@ def unique_combination_of_columns(
     --> Some combinations of columns are not unique. See above, selected: col("a")
     """
     cols = _sanitize_column_inputs(columns)
+
+    if approx_precheck:
+        # approx_n_unique does not support structs, hashing is enough to count them
+        combinations = pl.struct(cols).hash().alias(str(cols))
+        duplicated_combinations = _approx_duplicated_columns(data, combinations)
+        if not duplicated_combinations.is_empty():
+            raise PolarsAssertError(
+                duplicated_combinations,
+                "Some combinations of columns are not unique (estimated with "
+                + f"approx_n_unique), selected: {cols}",
+            )
+
     non_unique_combinations = (
         data.lazy().group_by(cols).agg(pl.len()).filter(pl.col("len") > 1).collect()
     )
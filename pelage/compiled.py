@@ -0,0 +1,120 @@
+"""Validators built once, to check many small batches with little overhead."""
+
+from collections.abc import Sequence
+from functools import partial
+
+import polars as pl
+
+from pelage.runner import Check, _check_arguments, _check_function
+from pelage.types import PolarsLazyOrDataFrame
+from pelage.violations import _VIOLATION_MASKS, _violation_mask
+
+# Arguments of the row-level checks ignored by compiled validators
+_SAMPLING_ARGUMENTS = ("sample", "stratify_by")
+
+
+class CompiledValidator:
+    """Checks prepared once, and run together on each batch of data.
+
+    Built with `compile_checks`. The expressions of the row-level checks are built
+    once and evaluated in a single `select` per batch, returning one boolean per check.
+    Only when one of them fails, the corresponding check runs again to raise its usual
+    error. The other checks are run as they are.
+
+    Parameters
+    ----------
+    checks : Sequence[Callable]
+        Checks taking the data as only argument, e.g. built with `functools.partial`.
+    """
+
+    def __init__(self, checks: Sequence[Check]) -> None:
+        self.checks = list(checks)
+        self._row_level_checks: list[Check] = []
+        self._other_checks: list[Check] = []
+        violation_flags = []
+
+        for check in self.checks:
+            function = _check_function(check)
+            if function not in _VIOLATION_MASKS:
+                self._other_checks.append(check)
+                continue
+            # Every row is checked, the check is only run again to report failures
+            arguments = {
+                name: value
+                for name, value in _check_arguments(check).items()
+                if name not in _SAMPLING_ARGUMENTS
+            }
+            self._row_level_checks.append(partial(function, **arguments))
+            violation_flags.append(
+                _violation_mask(check).any().alias(str(len(violation_flags)))
+            )
+
+        self._violation_flags = violation_flags
+
+    def __call__(self, data: PolarsLazyOrDataFrame) -> PolarsLazyOrDataFrame:
+        """Run the checks on the data, and raise the error of the first failing one."""
+        if self._violation_flags:
+            flags = (
+                data.select(self._violation_flags)
+                if isinstance(data, pl.DataFrame)
+                else data.select(self._violation_flags).collect()
+            ).row(0)
+            for check, failed in zip(self._row_level_checks, flags, strict=True):
+                if failed:
+                    check(data)
+
+        for check in self._other_checks:
+            check(data)
+        return data
+
+
+def compile_checks(checks: Sequence[Check]) -> CompiledValidator:
+    """Prepare checks once, to run them on many small batches of data.
+
+    Each call of a check rebuilds its expressions and query, which dominates the cost
+    for batches of a few hundred rows. The returned validator builds the expressions
+    of the row-level checks (`accepted_values`, `not_accepted_values`, `accepted_range`,
+    `has_no_nulls`, `has_no_infs` and `custom_check`) once, and evaluates them all in
+    a single query per batch. Their sampling arguments are ignored, every row is
+    checked. The other checks run as usual.
+
+    Parameters
+    ----------
+    checks : Sequence[Callable]
+        Checks taking the data as only argument, e.g. built with `functools.partial`.
+
+    Returns
+    -------
+    CompiledValidator
+        A function taking a batch of data, returning it unchanged when all the checks
+        pass, and raising the error of the first failing check otherwise. Row-level
+        checks are evaluated first.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> validate = plg.compile_checks(
+    ...     [
+    ...         partial(plg.accepted_range, items={"a": (0, 2)}),
+    ...         partial(plg.has_no_nulls),
+    ...     ]
+    ... )
+    >>> batch = pl.DataFrame({"a": [1, 2, 5]})
+    >>> batch.pipe(validate)
+    Traceback (most recent call last):
+    ...
+    pelage.types.PolarsAssertError: Details
+    shape: (1, 1)
+    ┌─────┐
+    │ a   │
+    │ --- │
+    │ i64 │
+    ╞═════╡
+    │ 5   │
+    └─────┘
+    Error with the DataFrame passed to the check function:
+    --> Some values are beyond the acceptable ranges defined
+    """
+    return CompiledValidator(checks)
@@ -0,0 +1,146 @@
+"""Attach checks to a LazyFrame, to run them during the collect of the caller."""
+
+from collections.abc import Callable
+from functools import partial
+
+import polars as pl
+
+from pelage.checks.accepted_range import accepted_range
+from pelage.checks.accepted_values import accepted_values
+from pelage.checks.custom_check import custom_check
+from pelage.checks.has_columns import has_columns
+from pelage.checks.has_dtypes import has_dtypes
+from pelage.checks.has_no_infs import has_no_infs
+from pelage.checks.has_no_nulls import has_no_nulls
+from pelage.checks.not_accepted_values import not_accepted_values
+from pelage.runner import Check, _check_arguments, _check_function
+from pelage.types import PolarsLazyOrDataFrame
+from pelage.utils import _has_sufficient_polars_version
+from pelage.violations import _VIOLATION_MASKS, _violation_mask
+
+# Checks looking at each row independently, that can be run batch by batch
+_ROW_LEVEL_CHECKS = {
+    accepted_range,
+    accepted_values,
+    custom_check,
+    has_columns,
+    has_dtypes,
+    has_no_infs,
+    has_no_nulls,
+    not_accepted_values,
+}
+
+# Older versions wrap the errors raised in `map_batches` into a `ComputeError`
+_MIN_POLARS_VERSION = "1.30.0"
+
+
+def _run_on_batch(
+    batch: pl.DataFrame,
+    check: Callable[..., pl.DataFrame],
+    args: tuple,
+    kwargs: dict,
+) -> pl.DataFrame:
+    check(batch, *args, **kwargs)
+    return batch
+
+
+def _required_columns(check: Check) -> list[str] | None:
+    """Columns read by a check, None when they are only known from the data"""
+    function = _check_function(check)
+    arguments = _check_arguments(check)
+    if function is has_columns:
+        names = arguments["names"]
+        return [names] if isinstance(names, str) else list(names)
+    if function is has_dtypes:
+        return list(arguments["items"])
+    if function in _VIOLATION_MASKS:
+        mask = _violation_mask(check)
+        # Selectors, e.g. by dtype, only resolve to columns against the schema
+        if not mask.meta.has_multiple_outputs():
+            return mask.meta.root_names()
+    return None
+
+
+def defer(
+    check: Callable[..., PolarsLazyOrDataFrame], *args, **kwargs
+) -> Callable[[PolarsLazyOrDataFrame], pl.LazyFrame]:
+    """Attach a check to the query plan, instead of running it right away.
+
+    Checks usually run their own query on the data, which is then read again by the
+    `collect` of the caller. A deferred check is evaluated by that `collect` (or
+    `sink_parquet`, ...) instead, and raises the usual `PolarsAssertError` from there:
+    when the result of the pipeline is consumed anyway, validating it costs no
+    additional pass over the data.
+
+    Row-level checks such as `accepted_range` or `has_no_nulls` are evaluated batch by
+    batch, and keep the query streamable. The other checks, e.g. `unique`, need all the
+    rows at once, hence the data is gathered in memory before running them. Columns
+    that are neither read by the check nor downstream are not read at all, when the
+    columns of the check are known from its arguments, e.g. not for dtype selectors.
+
+    Deferred checks need polars 1.30.0 or later: older versions turn the
+    `PolarsAssertError` into a `ComputeError`, hence `NotImplementedError` is raised.
+
+    Parameters
+    ----------
+    check : Callable
+        The pelage check function to defer.
+    *args, **kwargs
+        The arguments of the check, except the data.
+
+    Returns
+    -------
+    Callable[[PolarsLazyOrDataFrame], pl.LazyFrame]
+        A function to `pipe` the data to, returning a LazyFrame with the check attached.
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> lf = pl.LazyFrame({"a": [1, 2, 5]})
+    >>> deferred = lf.pipe(plg.defer(plg.accepted_range, {"a": (0, 2)}))
+    >>> deferred.filter(pl.col("a") < 2).collect()
+    Traceback (most recent call last):
+    ...
+    pelage.types.PolarsAssertError: Details
+    shape: (1, 1)
+    ┌─────┐
+    │ a   │
+    │ --- │
+    │ i64 │
+    ╞═════╡
+    │ 5   │
+    └─────┘
+    Error with the DataFrame passed to the check function:
+    --> Some values are beyond the acceptable ranges defined
+    """
+    if not _has_sufficient_polars_version(_MIN_POLARS_VERSION):
+        raise NotImplementedError(
+            f"defer needs polars >= {_MIN_POLARS_VERSION}, found {pl.__version__}"
+        )
+
+    required_columns = _required_columns(partial(check, *args, **kwargs))
+
+    def attach_check(data: PolarsLazyOrDataFrame) -> pl.LazyFrame:
+        lazy_data = data.lazy()
+        # Pushing filters or slices through the check would validate other rows than
+        # the ones given to it. Projections are pushed down when the columns read by
+        # the check are known: the check then gets them, and the ones read downstream.
+        checked = lazy_data.map_batches(
+            partial(_run_on_batch, check=check, args=args, kwargs=kwargs),
+            predicate_pushdown=False,
+            projection_pushdown=required_columns is not None,
+            slice_pushdown=False,
+            streamable=check in _ROW_LEVEL_CHECKS,
+        )
+        schema = lazy_data.collect_schema()
+        kept = [col for col in required_columns or [] if col in schema]
+        if not kept:
+            return checked
+        # Filter keeping every row, but reading the columns of the check after it, so
+        # that projection pushdown does not remove them from its input
+        return checked.filter(
+            pl.all_horizontal(pl.col(kept).is_null() | pl.col(kept).is_not_null())
+        )
+
+    return attach_check
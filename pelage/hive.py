@@ -0,0 +1,193 @@
+"""Run grouped checks partition by partition over hive-partitioned datasets."""
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import unquote
+
+import polars as pl
+
+from pelage.checks.at_least_one import at_least_one
+from pelage.checks.has_shape import has_shape
+from pelage.checks.not_constant import not_constant
+from pelage.checks.unique import unique
+from pelage.runner import (
+    Check,
+    CheckResult,
+    _check_arguments,
+    _check_function,
+    _check_name,
+    _run_check,
+)
+from pelage.types import PolarsAssertError
+from pelage.utils import _format_group_columns
+
+_DEFAULT_MAX_WORKERS = 8
+
+# Value written by writers for null partition values
+_HIVE_NULL = "__HIVE_DEFAULT_PARTITION__"
+
+# Grouped checks whose verdict on each group does not depend on the other groups
+_GROUP_WISE_CHECKS = {at_least_one, has_shape, not_constant, unique}
+
+
+def _partition_values(path: Path, root: Path) -> dict[str, str | None]:
+    values = {}
+    for part in path.relative_to(root).parent.parts:
+        if "=" in part:
+            key, value = part.split("=", 1)
+            values[key] = None if value == _HIVE_NULL else unquote(value)
+    return values
+
+
+def _parse_values(values: pl.Series) -> pl.Series:
+    """Partition values typed as polars would infer them, from the directory names"""
+    for parse in (
+        lambda: values.cast(pl.Int64),
+        lambda: values.cast(pl.Float64),
+        lambda: values.str.to_date(),
+        lambda: values.str.to_datetime(),
+    ):
+        try:
+            return parse()
+        except pl.exceptions.PolarsError:
+            continue
+    return values
+
+
+def _list_partitions(root: Path, filters: pl.Expr | None) -> pl.DataFrame:
+    """The files of the dataset, with the typed values of their partition columns.
+
+    Only the directory names are read: partitions ruled out by the filters are never
+    opened.
+    """
+    paths = sorted(path for path in root.rglob("*.parquet") if path.is_file())
+    if not paths:
+        raise ValueError(f"No parquet file found in {root}")
+
+    values = [_partition_values(path, root) for path in paths]
+    partitions = pl.DataFrame(
+        {
+            "path__": [str(path) for path in paths],
+            **{
+                col: _parse_values(
+                    pl.Series([value.get(col) for value in values], dtype=pl.String)
+                )
+                for col in values[0]
+            },
+        }
+    )
+    if filters is not None:
+        partitions = partitions.filter(filters)
+    return partitions
+
+
+def _combine_errors(errors: list[PolarsAssertError]) -> PolarsAssertError:
+    if len(errors) == 1:
+        return errors[0]
+    return PolarsAssertError(
+        pl.concat([error.df for error in errors], how="diagonal_relaxed"),
+        "\n".join(dict.fromkeys(error.supp_message for error in errors)),
+    )
+
+
+def validate_partitioned(
+    source: str | Path,
+    checks: Sequence[Check],
+    filters: pl.Expr | None = None,
+    max_workers: int = _DEFAULT_MAX_WORKERS,
+) -> list[CheckResult]:
+    """Run checks over a hive-partitioned parquet dataset, partition by partition.
+
+    When a check is grouped by a partition column of the dataset, e.g.
+    `group_by="date"` on files stored under `date=2024-01-01/` directories, no group
+    spans two partitions. `has_shape`, `not_constant`, `unique` and `at_least_one`
+    are then run on each partition separately, in a pool of threads, instead of a
+    hash `group_by` over the whole dataset. The other checks run once, on a scan of
+    all the selected files.
+
+    Parameters
+    ----------
+    source : Union[str, Path]
+        Root directory of the dataset, with `key=value` partition directories.
+    checks : Sequence[Callable]
+        Checks taking the data as only argument, e.g. built with `functools.partial`.
+    filters : Optional[pl.Expr], optional
+        Predicate on the partition columns selecting the partitions to check. The
+        files of the other partitions are not read, by default None
+    max_workers : int, optional
+        Maximum number of partitions checked at the same time, by default 8
+
+    Returns
+    -------
+    List[CheckResult]
+        The result of each check, in the order of `checks`. The errors of a check
+        failing on several partitions are concatenated.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from datetime import date
+    >>> from functools import partial
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> df = pl.DataFrame(
+    ...     {
+    ...         "date": [date(2024, 1, 1), date(2024, 1, 1), date(2024, 1, 2)],
+    ...         "id": [1, 2, 1],
+    ...     }
+    ... )
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     df.write_parquet(directory, partition_by="date")
+    ...     results = plg.validate_partitioned(
+    ...         directory,
+    ...         [partial(plg.unique, columns="id", group_by="date")],
+    ...         filters=pl.col("date") >= date(2024, 1, 2),
+    ...     )
+    >>> [result.status for result in results]
+    ['passed']
+    """
+    partitions = _list_partitions(Path(source), filters)
+    hive_schema = dict(partitions.drop("path__").schema)
+    paths = partitions.get_column("path__").to_list()
+
+    def scan(files: list[str]) -> pl.LazyFrame:
+        if not files:
+            # No partition selected, the checks see an empty frame
+            empty = pl.scan_parquet(next(Path(source).rglob("*.parquet"))).clear()
+            return empty.with_columns(
+                pl.lit(None, dtype).alias(col) for col, dtype in hive_schema.items()
+            )
+        return pl.scan_parquet(files, hive_partitioning=True, hive_schema=hive_schema)
+
+    tasks: list[tuple[int, Check, list[str]]] = []
+    for position, check in enumerate(checks):
+        group_columns = _format_group_columns(
+            _check_arguments(check).get("group_by")  # type: ignore
+        )
+        partition_columns = [
+            col for col in group_columns if isinstance(col, str) and col in hive_schema
+        ]
+        if _check_function(check) in _GROUP_WISE_CHECKS and partition_columns:
+            tasks += [
+                (position, check, files.to_list())
+                for files in partitions.group_by(partition_columns, maintain_order=True)
+                .agg("path__")
+                .get_column("path__")
+            ]
+        else:
+            tasks.append((position, check, paths))
+
+    errors: dict[int, list[PolarsAssertError]] = {}
+    with ThreadPoolExecutor(max_workers, thread_name_prefix="pelage") as executor:
+        results = executor.map(lambda task: _run_check(task[1], scan(task[2])), tasks)
+        for (position, _, _), result in zip(tasks, results, strict=True):
+            if result.error is not None:
+                errors.setdefault(position, []).append(result.error)
+
+    return [
+        CheckResult(_check_name(check), "failed", _combine_errors(errors[position]))
+        if position in errors
+        else CheckResult(_check_name(check), "passed")
+        for position, check in enumerate(checks)
+    ]
@@ -0,0 +1,195 @@
+"""Validate growing datasets, reading only the files added or changed since last run."""
+
+import hashlib
+import multiprocessing
+import pickle
+from collections.abc import Sequence
+from contextlib import nullcontext
+from functools import reduce
+from pathlib import Path
+from typing import Any
+
+from pelage.caching import _content_key
+from pelage.partials import (
+    PartialResult,
+    _partial_spec,
+    _run_second_passes,
+    _summarize_file,
+)
+from pelage.runner import Check, CheckResult
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def _file_signature(path: Path, content_hash: bool) -> tuple:
+    """Identify the version of a file, from its metadata or from its content"""
+    if not content_hash:
+        stat = path.stat()
+        return stat.st_size, stat.st_mtime_ns
+    digest = hashlib.blake2b()
+    with path.open("rb") as file:
+        while chunk := file.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return (digest.hexdigest(),)
+
+
+class ValidationState:
+    """Partial results of checks per file, kept between runs of `validate_incremental`.
+
+    A file is identified by its size and modification time, or by a hash of its
+    content when `content_hash` is set. The partial results of a file are kept as
+    long as it is unchanged, and the state can be persisted in a local file between
+    runs.
+
+    Parameters
+    ----------
+    files : Optional[Dict[str, Dict[str, Any]]], optional
+        Signature and partial results of each file, indexed by path, by default None
+    content_hash : bool, optional
+        Identify files by a hash of their content rather than by their size and
+        modification time, which survives copies but reads every file, by default
+        False
+    """
+
+    def __init__(
+        self, files: dict[str, dict[str, Any]] | None = None, content_hash: bool = False
+    ) -> None:
+        self.files = dict(files or {})
+        self.content_hash = content_hash
+
+    def signature(self, path: str | Path) -> tuple:
+        return _file_signature(Path(path), self.content_hash)
+
+    def summaries(self, path: str | Path, signature: tuple) -> dict[str, Any]:
+        """Summaries of the checks of a file, empty if it changed since recorded"""
+        entry = self.files.get(str(path))
+        if entry is None or entry["signature"] != signature:
+            return {}
+        return entry["summaries"]
+
+    def record(
+        self, path: str | Path, signature: tuple, summaries: dict[str, Any]
+    ) -> None:
+        self.files[str(path)] = {"signature": signature, "summaries": summaries}
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_bytes(
+            pickle.dumps({"files": self.files, "content_hash": self.content_hash})
+        )
+
+    @classmethod
+    def load(cls, path: str | Path, content_hash: bool = False) -> "ValidationState":
+        """Read a state saved with `save`, starts empty if the file does not exist.
+
+        The state is unpickled: only load files written by a trusted source.
+        """
+        if not Path(path).exists():
+            return cls(content_hash=content_hash)
+        return cls(**pickle.loads(Path(path).read_bytes()))
+
+
+def validate_incremental(
+    paths: Sequence[str | Path],
+    checks: Sequence[Check],
+    state: ValidationState,
+    processes: int | None = None,
+) -> list[CheckResult]:
+    """Validate a parquet dataset, only reading the files new or changed since the
+    partial results in `state` were recorded.
+
+    Files are summarized with `summarize_check` in worker processes, as in
+    `validate_dataset`, and their partial results are stored in `state`. The partial
+    results of the unchanged files are taken from `state`, so that checks over the
+    whole dataset, such as `unique_combination_of_columns` or
+    `maintains_relationships`, are updated without reading them again. Files absent
+    from `paths` are removed from `state`.
+
+    Checks are matched to the stored partial results by their arguments, reference
+    frames, Series and arrays included. Checks whose arguments cannot be identified
+    by their content, e.g. expressions calling Python functions, read every file.
+
+    Checks needing statistics of the whole data, such as `column_is_within_n_std`,
+    still read every file once the statistics are updated.
+
+    Parameters
+    ----------
+    paths : Sequence[Union[str, Path]]
+        The parquet files of the dataset.
+    checks : Sequence[Callable]
+        Checks taking the data as only argument, e.g. built with `functools.partial`.
+    state : ValidationState
+        Partial results of the previous runs, updated in place.
+    processes : Optional[int], optional
+        Number of worker processes, by default the number of CPUs
+
+    Returns
+    -------
+    List[CheckResult]
+        The result of each check over all the files, in the order of `checks`.
+    """
+    if not paths:
+        raise ValueError("At least one file is needed to validate a dataset")
+
+    keys = [_content_key(check) for check in checks]
+    # Signatures are taken before reading: a file changed meanwhile is read next time
+    signatures = {str(path): state.signature(path) for path in paths}
+    stored = {
+        path: state.summaries(path, signature) for path, signature in signatures.items()
+    }
+    # Checks without a content key cannot be matched to stored summaries
+    missing = {
+        path: [
+            position
+            for position, key in enumerate(keys)
+            if key is None or key not in summaries
+        ]
+        for path, summaries in stored.items()
+    }
+    tasks = [(path, positions) for path, positions in missing.items() if positions]
+    task_checks = [
+        (path, [checks[position] for position in positions])
+        for path, positions in tasks
+    ]
+
+    needs_workers = bool(tasks) or any(
+        _partial_spec(check).second_pass is not None for check in checks
+    )
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes) if needs_workers else nullcontext() as pool:
+        computed = pool.starmap(_summarize_file, task_checks) if tasks else []
+        fresh: dict[str, dict[int, Any]] = {}
+        for (path, positions), partial_results in zip(tasks, computed, strict=True):
+            fresh[path] = {
+                position: partial_result.summary
+                for position, partial_result in zip(
+                    positions, partial_results, strict=True
+                )
+            }
+            # Summaries of checks no longer given are dropped
+            stored[path] = {
+                key: fresh[path][position]
+                if position in fresh[path]
+                else stored[path][key]
+                for position, key in enumerate(keys)
+                if key is not None
+            }
+            state.record(path, signatures[path], stored[path])
+
+        def summary(path: str, position: int) -> Any:
+            if position in fresh.get(path, {}):
+                return fresh[path][position]
+            return stored[path][keys[position]]
+
+        merged = [
+            reduce(
+                PartialResult.merge,
+                [PartialResult(check, summary(str(path), position)) for path in paths],
+            )
+            for position, check in enumerate(checks)
+        ]
+        merged = _run_second_passes(pool, paths, merged)
+
+    # Files of the dataset no longer present are forgotten, new ones are only recorded
+    # once a summary was computed for them
+    state.files = {path: state.files[path] for path in stored if path in state.files}
+    return [partial_result.verdict() for partial_result in merged]
@@ -0,0 +1,760 @@
+"""Mergeable partial results of the checks, to validate a dataset part by part.
+
+Each check summarizes a part of the data (a file, a batch, ...) into a partial
+result: counts, null counts, bounded sets of values, sketches or per-group tables.
+Partial results of different parts merge into the partial result of their union, from
+which the verdict of the check on the whole data is computed. Parts can then be
+summarized in parallel, in separate processes or on separate machines.
+
+Most partials are small representative frames, on which the check itself gives the
+same verdict as on the whole data, e.g. at most two distinct values per column for
+`not_constant`. Error details may then show fewer rows than a single-pass run.
+
+Partials stay bounded whatever the size of the data, except for
+`mutually_exclusive_ranges`: any two rows may overlap, so its partial keeps the bounds
+of every row and grows with the data. `has_approx_cardinality` merges HyperLogLog
+registers, so its merged estimate may differ slightly from a single-pass run.
+"""
+
+import math
+import multiprocessing
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import partial, reduce
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from pelage.checks.accepted_range import accepted_range
+from pelage.checks.accepted_values import accepted_values
+from pelage.checks.at_least_one import at_least_one
+from pelage.checks.column_is_within_iqr import column_is_within_iqr
+from pelage.checks.column_is_within_n_std import column_is_within_n_std
+from pelage.checks.custom_check import custom_check
+from pelage.checks.has_approx_cardinality import (
+    _check_cardinalities,
+    has_approx_cardinality,
+)
+from pelage.checks.has_columns import has_columns
+from pelage.checks.has_dtypes import has_dtypes
+from pelage.checks.has_join_cardinality import (
+    _check_key_counts,
+    _count_keys,
+    has_join_cardinality,
+)
+from pelage.checks.has_mandatory_values import has_mandatory_values
+from pelage.checks.has_no_infs import has_no_infs
+from pelage.checks.has_no_nulls import has_no_nulls
+from pelage.checks.has_shape import _check_group_sizes, _check_shape, has_shape
+from pelage.checks.has_valid_foreign_keys import has_valid_foreign_keys
+from pelage.checks.is_monotonic import is_monotonic
+from pelage.checks.maintains_relationships import maintains_relationships
+from pelage.checks.mutually_exclusive_ranges import mutually_exclusive_ranges
+from pelage.checks.not_accepted_values import not_accepted_values
+from pelage.checks.not_constant import not_constant
+from pelage.checks.not_null_proportion import (
+    _check_null_proportions,
+    _null_counts,
+    not_null_proportion,
+)
+from pelage.checks.unique import unique
+from pelage.checks.unique_combination_of_columns import unique_combination_of_columns
+from pelage.runner import (
+    Check,
+    CheckResult,
+    _check_arguments,
+    _check_function,
+    _check_name,
+)
+from pelage.sketches import sketch_columns
+from pelage.types import PolarsAssertError, PolarsLazyOrDataFrame
+from pelage.utils import _format_group_columns, _sanitize_column_inputs
+
+# Index bits of the HyperLogLog registers of `has_approx_cardinality`: 2**14 registers
+# give estimates within about 1% of the exact count
+_HLL_PRECISION = 14
+_HLL_SEED = 0
+
+
+@dataclass(frozen=True)
+class _PartialSpec:
+    """How a check summarizes a part of the data, merges summaries and decides.
+
+    `second_pass`, when set, turns the merged summary into a row-level check to run on
+    every part, e.g. outliers can only be found once the mean of the whole data is
+    known.
+    """
+
+    summarize: Callable[[pl.LazyFrame], Any]
+    merge: Callable[[Any, Any], Any]
+    verdict: Callable[[Any], None]
+    second_pass: Callable[[Any], Check] | None = None
+
+
+def _resolve_columns(data: pl.LazyFrame, columns: Any) -> list[str]:
+    return data.select(_sanitize_column_inputs(columns)).collect_schema().names()
+
+
+def _local_spec(check: Check) -> _PartialSpec:
+    """Checks deciding on each row independently: the errors of the parts add up"""
+
+    def summarize(data: pl.LazyFrame) -> list[tuple[pl.DataFrame, str]]:
+        try:
+            check(data)
+        except PolarsAssertError as error:
+            # Errors are not sent as is, as exceptions lose their attributes on pickling
+            return [(error.df, error.supp_message)]
+        return []
+
+    def verdict(errors: list[tuple[pl.DataFrame, str]]) -> None:
+        if errors:
+            raise PolarsAssertError(
+                pl.concat([df for df, _ in errors], how="diagonal_relaxed"),
+                "\n".join(dict.fromkeys(message for _, message in errors)),
+            )
+
+    return _PartialSpec(summarize, lambda left, right: left + right, verdict)
+
+
+def _representative_spec(
+    check: Check,
+    represent: Callable[[pl.LazyFrame], pl.LazyFrame],
+    merge_parts: Callable[[pl.LazyFrame], pl.LazyFrame] | None = None,
+) -> _PartialSpec:
+    """Checks giving the same verdict on a small representative frame of the data.
+
+    The representative of the concatenation of two representatives is a
+    representative of the union of their parts, which keeps merged results small.
+    """
+    merge_parts = merge_parts or represent
+
+    def summarize(data: pl.LazyFrame) -> pl.DataFrame:
+        return represent(data).collect()
+
+    def merge(left: pl.DataFrame, right: pl.DataFrame) -> pl.DataFrame:
+        concatenated = pl.concat([left.lazy(), right.lazy()], how="vertical_relaxed")
+        return merge_parts(concatenated).collect()
+
+    return _PartialSpec(summarize, merge, lambda representative: check(representative))
+
+
+def _at_most_two_values(columns: list[str], group_columns: list[str]) -> Callable:
+    """Up to two distinct values per column and group, enough to tell constants"""
+
+    def represent(data: pl.LazyFrame) -> pl.LazyFrame:
+        if not group_columns:
+            data = data.with_columns(group__=pl.lit(0))
+        return (
+            data.group_by(group_columns or ["group__"])
+            .agg(pl.col(col).unique(maintain_order=True).head(2) for col in columns)
+            # A single distinct value is repeated, so that all lists have two items
+            .with_columns(pl.col(col).list.gather([0, -1]) for col in columns)
+            .explode(columns)
+            .drop([] if group_columns else ["group__"])
+        )
+
+    return represent
+
+
+def _first_occurrences(keys: list[list[str]]) -> Callable:
+    """Rows holding one of the first two occurrences of a value of any key"""
+
+    def represent(data: pl.LazyFrame) -> pl.LazyFrame:
+        return data.filter(
+            pl.any_horizontal(pl.int_range(pl.len()).over(key) < 2 for key in keys)
+        )
+
+    return represent
+
+
+def _first_non_null(columns: list[str], group_columns: list[str]) -> Callable:
+    """The first non-null value of each column, per group"""
+
+    def represent(data: pl.LazyFrame) -> pl.LazyFrame:
+        first_values = pl.col(columns).drop_nulls().first()
+        if group_columns:
+            return data.group_by(group_columns).agg(first_values)
+        return data.select(first_values)
+
+    return represent
+
+
+def _mandatory_values_present(
+    items: dict[str, list], group_columns: list[str]
+) -> Callable:
+    """The mandatory values found in each group, and every group"""
+
+    def represent(data: pl.LazyFrame) -> pl.LazyFrame:
+        parts = [data.select(group_columns).unique()] if group_columns else []
+        parts += [
+            data.select(*group_columns, col).filter(pl.col(col).is_in(values)).unique()
+            for col, values in items.items()
+        ]
+        return pl.concat(parts, how="diagonal")
+
+    return represent
+
+
+def _orphan_rows(references: dict[str, Any]) -> Callable:
+    """Rows with a foreign key missing from its reference table"""
+
+    def represent(data: pl.LazyFrame) -> pl.LazyFrame:
+        keys = data.select(references.keys())
+        orphans = []
+        for column, reference in references.items():
+            reference_df, reference_column = (
+                reference if isinstance(reference, tuple) else (reference, column)
+            )
+            orphans.append(
+                keys.filter(pl.col(column).is_not_null()).join(
+                    reference_df.lazy().select(pl.col(reference_column).alias(column)),
+                    on=column,
+                    how="anti",
+                )
+            )
+        return pl.concat(orphans)
+
+    return represent
+
+
+def _monotonic_boundaries(
+    column: str, decreasing: bool, strict: bool, group_columns: list[str]
+) -> Callable:
+    """First and last rows of each group, and the rows breaking the monotony"""
+    over = group_columns or [pl.lit(1)]
+
+    def is_monotonic_step(diff: pl.Expr) -> pl.Expr:
+        match decreasing, strict:
+            case False, False:
+                return diff >= 0
+            case False, True:
+                return diff > 0
+            case True, False:
+                return diff <= 0
+            case _:
+                return diff < 0
+
+    def represent(data: pl.LazyFrame) -> pl.LazyFrame:
+        diff = pl.col(column).diff()
+        breaks = is_monotonic_step(diff).not_().fill_null(False)
+        next_breaks = is_monotonic_step(diff.shift(-1)).not_().fill_null(False)
+        position = pl.int_range(pl.len())
+        return data.filter(
+            ((position == 0) | (position == pl.len() - 1) | breaks | next_breaks).over(
+                over
+            )
+        )
+
+    return represent
+
+
+def _shape_spec(
+    shape: tuple[int | None, int | None], group_by: Any | None
+) -> _PartialSpec:
+    """Number of rows, per group when grouped, along with the number of columns"""
+
+    def summarize(data: pl.LazyFrame) -> tuple[pl.DataFrame, int]:
+        counts = (
+            data.select(pl.len())
+            if group_by is None
+            else data.group_by(group_by).agg(pl.len())
+        )
+        return counts.collect(), len(data.collect_schema())
+
+    def merge(
+        left: tuple[pl.DataFrame, int], right: tuple[pl.DataFrame, int]
+    ) -> tuple[pl.DataFrame, int]:
+        counts = pl.concat([left[0], right[0]])
+        keys = [col for col in counts.columns if col != "len"]
+        if keys:
+            counts = counts.group_by(keys, maintain_order=True).agg(pl.col("len").sum())
+        else:
+            counts = counts.select(pl.col("len").sum())
+        return counts, left[1]
+
+    def verdict(summary: tuple[pl.DataFrame, int]) -> None:
+        counts, width = summary
+        if group_by is not None:
+            _check_group_sizes(counts, shape)
+        else:
+            _check_shape((counts.item(), width), shape)
+
+    return _PartialSpec(summarize, merge, verdict)
+
+
+def _summed_counts(
+    summarize: Callable[[pl.LazyFrame], pl.DataFrame],
+    keys: list[str],
+    verdict: Callable[[pl.DataFrame], None],
+) -> _PartialSpec:
+    """Count tables, summed over the parts for each value of the keys"""
+
+    def merge(left: pl.DataFrame, right: pl.DataFrame) -> pl.DataFrame:
+        return (
+            pl.concat([left, right])
+            .group_by(keys, maintain_order=True)
+            .agg(pl.exclude(keys).sum())
+            .select(left.columns)
+        )
+
+    return _PartialSpec(summarize, merge, verdict)
+
+
+def _hyperloglog_spec(items: dict[str, tuple[int | None, int | None]]) -> _PartialSpec:
+    """HyperLogLog registers of each column, merged by keeping the largest rank.
+
+    The high bits of the hash of a value select its register, and the position of the
+    lowest set bit among the others gives its rank. The summary holds at most
+    `2**_HLL_PRECISION` registers per column, whatever the number of distinct values.
+    """
+    n_registers = 2**_HLL_PRECISION
+    n_rank_bits = 64 - _HLL_PRECISION
+
+    def summarize(data: pl.LazyFrame) -> pl.DataFrame:
+        registers = []
+        for column in items:
+            hashed = pl.col(column).hash(seed=_HLL_SEED)
+            rank_bits = hashed % 2**n_rank_bits
+            # The lowest set bit is a power of two, whose logarithm is exact
+            lowest_set_bit = rank_bits & (~rank_bits + 1)
+            registers.append(
+                data.select(
+                    (hashed // 2**n_rank_bits).cast(pl.Int64).alias("register"),
+                    pl.when(rank_bits == 0)
+                    .then(n_rank_bits + 1)
+                    .otherwise(lowest_set_bit.log(2).cast(pl.Int64) + 1)
+                    .alias("rank"),
+                )
+                .group_by("register")
+                .agg(pl.col("rank").max())
+                .select(pl.lit(column).alias("column"), "register", "rank")
+            )
+        return pl.concat(pl.collect_all(registers))
+
+    def merge(left: pl.DataFrame, right: pl.DataFrame) -> pl.DataFrame:
+        return (
+            pl.concat([left, right])
+            .group_by("column", "register")
+            .agg(pl.col("rank").max())
+        )
+
+    def verdict(registers: pl.DataFrame) -> None:
+        alpha = 0.7213 / (1 + 1.079 / n_registers)
+        counts = pl.DataFrame({"column": list(items)}).join(
+            registers.group_by("column").agg(
+                (-math.log(2) * pl.col("rank")).exp().sum().alias("inverse_sum"),
+                pl.len().alias("n_filled"),
+            ),
+            on="column",
+            how="left",
+        )
+        # Registers never reached have a rank of 0
+        n_empty = n_registers - pl.col("n_filled").fill_null(0)
+        raw_estimate = (
+            alpha
+            * n_registers**2
+            / (pl.col("inverse_sum").fill_null(0) + n_empty.cast(pl.Float64))
+        )
+        # Linear counting is more accurate while many registers are empty
+        estimate = (
+            pl.when((raw_estimate <= 2.5 * n_registers) & (n_empty > 0))
+            .then(n_registers * (n_registers / n_empty.cast(pl.Float64)).log())
+            .otherwise(raw_estimate)
+        )
+        _check_cardinalities(
+            counts.lazy().select(
+                "column", estimate.round().cast(pl.Int64).alias("approx_n_unique")
+            ),
+            items,
+        )
+
+    return _PartialSpec(summarize, merge, verdict)
+
+
+def _n_std_spec(arguments: dict[str, Any]) -> _PartialSpec:
+    """Count, mean and sum of squared deviations of each column, merged exactly"""
+    group_columns = _format_group_columns(arguments.get("group_by"))
+    # Checks are built with `partial`, only items given as keyword are supported
+    items = [arguments["items"]]
+    keys = [*group_columns, "column"]
+
+    def summarize(data: pl.LazyFrame) -> pl.DataFrame:
+        columns = [
+            column
+            for col, _ in items
+            for column in _resolve_columns(data, col)
+            if column not in group_columns
+        ]
+        statistics = []
+        for column in columns:
+            value = pl.col(column).cast(pl.Float64)
+            aggregations = [
+                value.count().cast(pl.Int64).alias("n"),
+                value.mean().alias("mean"),
+                ((value - value.mean()) ** 2).sum().alias("m2"),
+            ]
+            statistics.append(
+                (
+                    data.group_by(group_columns).agg(aggregations)
+                    if group_columns
+                    else data.select(aggregations)
+                ).with_columns(column=pl.lit(column))
+            )
+        return pl.concat(pl.collect_all(statistics)).select(*keys, "n", "mean", "m2")
+
+    def merge(left: pl.DataFrame, right: pl.DataFrame) -> pl.DataFrame:
+        n = pl.col("n").sum()
+        mean = (pl.col("n") * pl.col("mean")).sum() / n
+        return (
+            pl.concat([left, right])
+            .group_by(keys, maintain_order=True)
+            .agg(
+                n.alias("n"),
+                mean.alias("mean"),
+                (pl.col("m2") + pl.col("n") * (pl.col("mean") - mean) ** 2)
+                .sum()
+                .alias("m2"),
+            )
+        )
+
+    def second_pass(statistics: pl.DataFrame) -> Check:
+        baseline = statistics.select(
+            *keys,
+            "mean",
+            pl.when(pl.col("n") > 1)
+            .then((pl.col("m2") / (pl.col("n") - 1)).sqrt())
+            .alias("std"),
+        )
+        if arguments.get("save_baseline") is not None:
+            baseline.write_parquet(arguments["save_baseline"])
+        return partial(
+            column_is_within_n_std,
+            items=arguments["items"],
+            group_by=arguments.get("group_by"),
+            load_baseline=baseline,
+        )
+
+    return _PartialSpec(summarize, merge, _requires_second_pass, second_pass)
+
+
+def _iqr_spec(arguments: dict[str, Any]) -> _PartialSpec:
+    """Quantile sketches of each column, merged exactly"""
+    # Checks are built with `partial`, only items given as keyword are supported
+    items = [arguments["items"]]
+    relative_accuracy = arguments.get("relative_accuracy", 0.01)
+
+    def summarize(data: pl.LazyFrame) -> dict:
+        columns = [column for col, _ in items for column in _resolve_columns(data, col)]
+        return sketch_columns(data, columns, relative_accuracy)
+
+    def merge(left: dict, right: dict) -> dict:
+        return {
+            column: left[column].merge(right[column]) if column in left else sketch
+            for column, sketch in right.items()
+        } | {column: sketch for column, sketch in left.items() if column not in right}
+
+    def second_pass(merged_sketches: dict) -> Check:
+        return partial(
+            column_is_within_iqr,
+            items=arguments["items"],
+            sketches=merged_sketches,
+            relative_accuracy=relative_accuracy,
+        )
+
+    return _PartialSpec(summarize, merge, _requires_second_pass, second_pass)
+
+
+def _requires_second_pass(_summary: Any) -> None:
+    raise ValueError(
+        "This check needs a second pass over the data, see `PartialResult.second_pass`"
+    )
+
+
+_LOCAL_CHECKS = {
+    accepted_range,
+    accepted_values,
+    custom_check,
+    has_columns,
+    has_dtypes,
+    has_no_infs,
+    has_no_nulls,
+    not_accepted_values,
+}
+
+
+def _partial_spec(check: Check) -> _PartialSpec:
+    function = _check_function(check)
+    arguments = _check_arguments(check)
+    group_columns = _format_group_columns(arguments.get("group_by"))
+
+    if function in _LOCAL_CHECKS:
+        return _local_spec(check)
+
+    if function is column_is_within_n_std:
+        if arguments.get("load_baseline") is not None:
+            return _local_spec(check)
+        return _n_std_spec(arguments)
+
+    if function is column_is_within_iqr:
+        if arguments.get("sketches"):
+            return _local_spec(check)
+        return _iqr_spec(arguments)
+
+    if function is has_shape:
+        return _shape_spec(arguments["shape"], arguments.get("group_by"))
+
+    if function is has_approx_cardinality:
+        return _hyperloglog_spec(arguments["items"])
+
+    if function is not_null_proportion:
+        return _summed_counts(
+            lambda data: _null_counts(data, arguments.get("group_by")).collect(),
+            [*group_columns, "column"],
+            lambda counts: _check_null_proportions(counts, arguments["items"]),
+        )
+
+    if function is has_join_cardinality:
+        on = arguments["on"]
+        keys = [on] if isinstance(on, str) else on
+        return _summed_counts(
+            lambda data: _count_keys(data, keys, "left_count").collect(),
+            keys,
+            lambda counts: _check_key_counts(
+                counts,
+                arguments["other_df"],
+                keys,
+                arguments.get("relationship", "m:1"),
+                arguments.get("top_n", 5),
+            ),
+        )
+
+    if function is is_monotonic and arguments.get("interval") is not None:
+        raise ValueError(
+            "is_monotonic with an interval cannot be split in mergeable parts"
+        )
+
+    represent = _representative(function, arguments, group_columns)
+    if represent is None:
+        raise ValueError(
+            f"The check {_check_name(check)} has no mergeable partial result"
+        )
+    if function is has_valid_foreign_keys:
+        # Orphan rows of the parts are orphan rows of the whole, no need to look again
+        return _representative_spec(check, represent, merge_parts=lambda data: data)
+    return _representative_spec(check, represent)
+
+
+def _representative(
+    function: Callable, arguments: dict[str, Any], group_columns: list[str]
+) -> Callable[[pl.LazyFrame], pl.LazyFrame] | None:
+    """Build the representative frames of a check, None if it has none"""
+    if function is not_constant:
+        return _column_dependent(
+            lambda columns: _at_most_two_values(columns, group_columns),
+            arguments.get("columns"),
+            group_columns,
+        )
+    if function is unique:
+        return _column_dependent(
+            lambda columns: _first_occurrences(
+                [[*group_columns, column] for column in columns]
+            ),
+            arguments.get("columns"),
+            group_columns,
+        )
+    if function is unique_combination_of_columns:
+        return _column_dependent(
+            lambda columns: _first_occurrences([columns]), arguments.get("columns"), []
+        )
+    if function is at_least_one:
+        return _column_dependent(
+            lambda columns: _first_non_null(columns, group_columns),
+            arguments.get("columns"),
+            group_columns,
+        )
+    if function is has_mandatory_values:
+        return _mandatory_values_present(arguments["items"], group_columns)
+    if function is maintains_relationships:
+        return lambda data: data.select(arguments["column"]).unique()
+    if function is mutually_exclusive_ranges:
+        # Not bounded: every row may overlap a row of another part
+        return lambda data: data.select(
+            *group_columns, arguments["low_bound"], arguments["high_bound"]
+        )
+    if function is has_valid_foreign_keys:
+        return _orphan_rows(arguments["references"])
+    if function is is_monotonic:
+        return _monotonic_boundaries(
+            arguments["column"],
+            arguments.get("decreasing", False),
+            arguments.get("strict", True),
+            group_columns,
+        )
+    return None
+
+
+def _column_dependent(
+    build: Callable[[list[str]], Callable],
+    columns: Any,
+    group_columns: list[str],
+) -> Callable:
+    """Representative built from the columns selected by the check, resolved on data"""
+
+    def represent(data: pl.LazyFrame) -> pl.LazyFrame:
+        selected = [
+            col for col in _resolve_columns(data, columns) if col not in group_columns
+        ]
+        return build(selected)(data)
+
+    return represent
+
+
+@dataclass(frozen=True)
+class PartialResult:
+    """Summary of a check over a part of the data, built with `summarize_check`.
+
+    Partial results of the same check merge into the partial result of the union of
+    their parts, in order: `first.merge(second)` summarizes the rows of `first`
+    followed by those of `second`. Partial results can be pickled, to be sent from
+    worker processes or other machines.
+
+    Attributes
+    ----------
+    check : Callable
+        The summarized check, e.g. built with `functools.partial`.
+    summary : Any
+        Counts, bounded sets of values, sketches or per-group tables, depending on
+        the check.
+    """
+
+    check: Check
+    summary: Any
+
+    def merge(self, other: "PartialResult") -> "PartialResult":
+        return PartialResult(
+            self.check, _partial_spec(self.check).merge(self.summary, other.summary)
+        )
+
+    def second_pass(self) -> Check | None:
+        """Row-level check to summarize on every part, once all the partial results
+        are merged, for checks needing statistics of the whole data first, e.g.
+        `column_is_within_n_std`. None for the other checks."""
+        spec = _partial_spec(self.check)
+        if spec.second_pass is None:
+            return None
+        return spec.second_pass(self.summary)
+
+    def verdict(self) -> CheckResult:
+        """Result of the check on the whole data summarized"""
+        try:
+            _partial_spec(self.check).verdict(self.summary)
+        except PolarsAssertError as error:
+            return CheckResult(_check_name(self.check), "failed", error)
+        return CheckResult(_check_name(self.check), "passed")
+
+
+def summarize_check(data: PolarsLazyOrDataFrame, check: Check) -> PartialResult:
+    """Summarize a part of the data into a mergeable partial result of the check.
+
+    Parameters
+    ----------
+    data : PolarsLazyOrDataFrame
+        Part of the data to check, e.g. one of the files of a dataset.
+    check : Callable
+        A pelage check with its arguments, e.g. built with `functools.partial`.
+
+    Returns
+    -------
+    PartialResult
+        The partial result, to merge with those of the other parts.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> check = partial(plg.unique, columns="a")
+    >>> first = plg.summarize_check(pl.DataFrame({"a": [1, 2]}), check)
+    >>> second = plg.summarize_check(pl.DataFrame({"a": [3, 1]}), check)
+    >>> first.verdict().status, second.verdict().status
+    ('passed', 'passed')
+    >>> first.merge(second).verdict().status
+    'failed'
+    """
+    return PartialResult(check, _partial_spec(check).summarize(data.lazy()))
+
+
+def _summarize_file(path: str | Path, checks: Sequence[Check]) -> list[PartialResult]:
+    data = pl.scan_parquet(path)
+    return [summarize_check(data, check) for check in checks]
+
+
+def validate_dataset(
+    paths: Sequence[str | Path],
+    checks: Sequence[Check],
+    processes: int | None = None,
+) -> list[CheckResult]:
+    """Validate a parquet dataset file by file, in parallel worker processes.
+
+    Each worker summarizes one file at a time into the partial results of all the
+    checks. The partial results are then merged, in the order of `paths`, into the
+    verdict the checks would give on the concatenation of all the files. Checks
+    needing statistics of the whole data, such as `column_is_within_n_std`, read the
+    files a second time once those statistics are merged.
+
+    Checks are sent to the workers: they must be picklable, e.g. built with
+    `functools.partial` from pelage functions, without lambda functions.
+
+    Parameters
+    ----------
+    paths : Sequence[Union[str, Path]]
+        The parquet files of the dataset.
+    checks : Sequence[Callable]
+        Checks taking the data as only argument, e.g. built with `functools.partial`.
+    processes : Optional[int], optional
+        Number of worker processes, by default the number of CPUs
+
+    Returns
+    -------
+    List[CheckResult]
+        The result of each check, in the order of `checks`.
+    """
+    if not paths:
+        raise ValueError("At least one file is needed to validate a dataset")
+
+    # Forking a process using polars threads can deadlock, workers are started afresh
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes) as pool:
+        per_file = pool.map(partial(_summarize_file, checks=checks), paths)
+        merged = [
+            reduce(PartialResult.merge, partial_results)
+            for partial_results in zip(*per_file, strict=True)
+        ]
+
+        merged = _run_second_passes(pool, paths, merged)
+
+    return [partial_result.verdict() for partial_result in merged]
+
+
+def _run_second_passes(
+    pool: Any, paths: Sequence[str | Path], merged: list[PartialResult]
+) -> list[PartialResult]:
+    """Replace the merged results needing a second pass by those of the second pass"""
+    second_passes = {
+        position: check
+        for position, partial_result in enumerate(merged)
+        if (check := partial_result.second_pass()) is not None
+    }
+    if not second_passes:
+        return merged
+
+    merged = list(merged)
+    per_file = pool.map(
+        partial(_summarize_file, checks=list(second_passes.values())), paths
+    )
+    for position, partial_results in zip(
+        second_passes, zip(*per_file, strict=True), strict=True
+    ):
+        merged[position] = reduce(PartialResult.merge, partial_results)
+    return merged
@@ -0,0 +1,549 @@
+"""Run several pelage checks on the same data and gather their results."""
+
+import contextlib
+import datetime
+import inspect
+import json
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from functools import partial, wraps
+from pathlib import Path
+from typing import Any, Literal
+
+import polars as pl
+
+from pelage.checks.accepted_range import accepted_range
+from pelage.checks.accepted_values import accepted_values
+from pelage.checks.at_least_one import at_least_one
+from pelage.checks.column_is_within_iqr import column_is_within_iqr
+from pelage.checks.column_is_within_n_std import column_is_within_n_std
+from pelage.checks.custom_check import custom_check
+from pelage.checks.has_approx_cardinality import has_approx_cardinality
+from pelage.checks.has_columns import has_columns
+from pelage.checks.has_dtypes import has_dtypes
+from pelage.checks.has_join_cardinality import has_join_cardinality
+from pelage.checks.has_mandatory_values import has_mandatory_values
+from pelage.checks.has_no_infs import has_no_infs
+from pelage.checks.has_no_nulls import has_no_nulls
+from pelage.checks.has_shape import has_shape
+from pelage.checks.has_valid_foreign_keys import has_valid_foreign_keys
+from pelage.checks.is_monotonic import is_monotonic
+from pelage.checks.maintains_relationships import maintains_relationships
+from pelage.checks.mutually_exclusive_ranges import mutually_exclusive_ranges
+from pelage.checks.not_accepted_values import not_accepted_values
+from pelage.checks.not_constant import not_constant
+from pelage.checks.not_null_proportion import not_null_proportion
+from pelage.checks.unique import unique
+from pelage.checks.unique_combination_of_columns import unique_combination_of_columns
+from pelage.types import PolarsAssertError, PolarsLazyOrDataFrame
+from pelage.utils import _to_polars
+
+Check = Callable[[PolarsLazyOrDataFrame], PolarsLazyOrDataFrame]
+CheckStatus = Literal["passed", "failed", "skipped"]
+
+# Relative cost per value of the checks: schema only, scans, hashing or sorting
+_CHECK_COSTS: dict[Callable, float] = {
+    has_columns: 0,
+    has_dtypes: 0,
+    has_shape: 1,
+    accepted_range: 1,
+    accepted_values: 1,
+    not_accepted_values: 1,
+    custom_check: 1,
+    has_no_nulls: 1,
+    has_no_infs: 1,
+    at_least_one: 1,
+    not_null_proportion: 1,
+    has_approx_cardinality: 1,
+    column_is_within_n_std: 2,
+    column_is_within_iqr: 2,
+    not_constant: 3,
+    has_mandatory_values: 3,
+    unique: 3,
+    unique_combination_of_columns: 3,
+    has_valid_foreign_keys: 3,
+    has_join_cardinality: 4,
+    maintains_relationships: 4,
+    is_monotonic: 4,
+    mutually_exclusive_ranges: 4,
+}
+_DEFAULT_CHECK_COST = 2
+# Order of magnitude of the time spent per value and unit of cost, in seconds
+_SECONDS_PER_VALUE = 1e-9
+# Number of rows assumed for LazyFrames, whose height is unknown before collecting
+_DEFAULT_N_ROWS = 1_000_000
+# Arguments of the checks that designate the columns they work on
+_COLUMN_ARGUMENTS = (
+    "columns",
+    "names",
+    "column",
+    "items",
+    "args",
+    "references",
+    "on",
+    "low_bound",
+    "high_bound",
+    "expression",
+)
+
+
+@dataclass
+class CheckResult:
+    """Outcome of a check run by one of the pelage runners.
+
+    Attributes
+    ----------
+    name : str
+        Name of the check function.
+    status : str
+        One of "passed", "failed" or "skipped".
+    error : PolarsAssertError, optional
+        The error raised by the check when it failed, by default None
+    duration : float, optional
+        Run time of the check in seconds, None when skipped or when the check was run
+        on several frames at once, by default None
+    """
+
+    name: str
+    status: CheckStatus
+    error: PolarsAssertError | None = None
+    duration: float | None = None
+
+
+def _check_function(check: Check) -> Callable:
+    """The pelage function behind a check, even when wrapped with `partial`"""
+    while isinstance(check, partial):
+        check = check.func
+    return check
+
+
+def _check_name(check: Check) -> str:
+    function = _check_function(check)
+    return getattr(function, "__name__", repr(function))
+
+
+def _bind_check(
+    check: Check, data: PolarsLazyOrDataFrame | None = None
+) -> inspect.BoundArguments | None:
+    """Arguments of the check function, including those given through `partial`"""
+    args: list = []
+    kwargs: dict = {}
+    while isinstance(check, partial):
+        args = [*check.args, *args]
+        kwargs = {**check.keywords, **kwargs}
+        check = check.func
+    try:
+        return inspect.signature(check).bind_partial(data, *args, **kwargs)
+    except (TypeError, ValueError):
+        return None
+
+
+def _check_arguments(check: Check) -> dict[str, Any]:
+    """Arguments given to the check function through `partial`, except the data"""
+    bound = _bind_check(check)
+    if bound is None:
+        return {}
+    return dict(list(bound.arguments.items())[1:])
+
+
+# Arguments whose repr identifies their value, the same in every process
+_REPR_KEYED_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    bool,
+    type(None),
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+)
+
+
+def _argument_key(value: Any, frame_key: Callable[[Any], str] | None) -> str:
+    """Representation of an argument stable across processes.
+
+    Expressions and selectors are serialized, as their repr is truncated and holds
+    their memory address. When `frame_key` is given, the key must identify the
+    content of the argument: frames, Series and arrays are represented with
+    `frame_key`, and a TypeError is raised for arguments without such a key.
+    """
+    identifies_content = frame_key is not None
+    if isinstance(value, pl.DataFrame | pl.LazyFrame):
+        return "<frame>" if frame_key is None else frame_key(value)
+    if isinstance(value, pl.Series) or hasattr(value, "__array__"):
+        if frame_key is None:
+            return f"<{type(value).__name__}>"
+        try:
+            series = value if isinstance(value, pl.Series) else pl.Series(value)
+        except (TypeError, ValueError) as error:
+            raise TypeError(f"No content key for {type(value).__name__}") from error
+        return frame_key(series.to_frame())
+    if isinstance(value, pl.Expr):
+        try:
+            return value.meta.serialize(format="json")
+        except Exception as error:
+            # e.g. expressions calling Python functions
+            if identifies_content:
+                raise TypeError("No content key for this expression") from error
+            return repr(value)
+    if isinstance(value, list | tuple):
+        keys = ", ".join(_argument_key(item, frame_key) for item in value)
+        return f"[{keys}]" if isinstance(value, list) else f"({keys})"
+    if isinstance(value, set | frozenset):
+        # The order of sets depends on the hash seed of the process
+        return f"{{{', '.join(sorted(_argument_key(v, frame_key) for v in value))}}}"
+    if isinstance(value, dict):
+        items = ", ".join(
+            f"{key!r}: {_argument_key(item, frame_key)}" for key, item in value.items()
+        )
+        return f"{{{items}}}"
+    is_dtype = isinstance(value, pl.DataType) or (
+        isinstance(value, type) and issubclass(value, pl.DataType)
+    )
+    if identifies_content and not (is_dtype or isinstance(value, _REPR_KEYED_TYPES)):
+        raise TypeError(f"No content key for {type(value).__name__}")
+    return repr(value)
+
+
+def _check_key(check: Check, frame_key: Callable[[Any], str] | None = None) -> str:
+    """Identify a check by its name and arguments, e.g. to store its run times"""
+    arguments = ", ".join(
+        f"{name}={_argument_key(value, frame_key)}"
+        for name, value in _check_arguments(check).items()
+    )
+    return f"{_check_name(check)}({arguments})"
+
+
+def _count_columns(check: Check, schema_width: int) -> int:
+    """Number of columns read by a check, all of them when it cannot be inferred"""
+    n_columns = 0
+    for name, value in _check_arguments(check).items():
+        if name not in _COLUMN_ARGUMENTS:
+            continue
+        if value is None:
+            return schema_width
+        if isinstance(value, pl.Expr):
+            root_names = set(value.meta.root_names())
+            if not root_names:
+                return schema_width
+            n_columns += len(root_names)
+        elif isinstance(value, list | dict) or name == "args":
+            n_columns += len(value)
+        else:
+            n_columns += 1
+    return min(n_columns, schema_width) if n_columns else schema_width
+
+
+def _estimate_cost(
+    check: Check,
+    data: PolarsLazyOrDataFrame | None = None,
+    history: "RuntimeHistory | None" = None,
+    n_rows: int | None = None,
+) -> float:
+    """Estimated run time of a check, in seconds.
+
+    The past run time of the check is used when available. Otherwise, the cost is the
+    number of values read, i.e. rows times columns, weighted by the kind of work done
+    by the check: none for schema checks, up to sorting for the most expensive.
+    """
+    if history is not None and (past_runtime := history.get(check)) is not None:
+        return past_runtime
+
+    unit_cost = _CHECK_COSTS.get(_check_function(check), _DEFAULT_CHECK_COST)
+    if data is None or unit_cost == 0:
+        return unit_cost
+
+    schema_width = len(data.collect_schema())
+    if n_rows is None:
+        n_rows = data.height if isinstance(data, pl.DataFrame) else _DEFAULT_N_ROWS
+    return unit_cost * _count_columns(check, schema_width) * n_rows * _SECONDS_PER_VALUE
+
+
+class RuntimeHistory:
+    """Past run times of checks, used by the runners to order checks by cost.
+
+    Run times are smoothed with an exponential moving average, and can be persisted in
+    a JSON file between runs.
+
+    Parameters
+    ----------
+    runtimes : Optional[Dict[str, float]], optional
+        Run times in seconds, indexed by the check name and arguments,
+        by default None
+    smoothing : float, optional
+        Weight of the latest run time in the average, by default 0.5
+    """
+
+    def __init__(
+        self, runtimes: dict[str, float] | None = None, smoothing: float = 0.5
+    ) -> None:
+        self.runtimes = dict(runtimes or {})
+        self.smoothing = smoothing
+
+    def get(self, check: Check) -> float | None:
+        return self.runtimes.get(_check_key(check))
+
+    def record(self, check: Check, duration: float) -> None:
+        key = _check_key(check)
+        previous = self.runtimes.get(key, duration)
+        self.runtimes[key] = self.smoothing * duration + (1 - self.smoothing) * previous
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.runtimes, indent=2))
+
+    @classmethod
+    def load(cls, path: str | Path, smoothing: float = 0.5) -> "RuntimeHistory":
+        """Read run times saved with `save`, starts empty if the file does not exist"""
+        if not Path(path).exists():
+            return cls(smoothing=smoothing)
+        return cls(json.loads(Path(path).read_text()), smoothing)
+
+
+def _order_by_cost(
+    checks: Sequence[Check],
+    data: PolarsLazyOrDataFrame,
+    history: RuntimeHistory | None,
+    n_rows: int | None,
+) -> list[int]:
+    """Positions of the checks, from the cheapest to the most expensive"""
+    costs = [_estimate_cost(check, data, history, n_rows) for check in checks]
+    return sorted(range(len(checks)), key=costs.__getitem__)
+
+
+def _run_check(check: Check, data: PolarsLazyOrDataFrame) -> CheckResult:
+    start = time.perf_counter()
+    try:
+        check(data)
+    except PolarsAssertError as error:
+        return CheckResult(
+            _check_name(check), "failed", error, time.perf_counter() - start
+        )
+    return CheckResult(_check_name(check), "passed", None, time.perf_counter() - start)
+
+
+# Time between two checks of the cancellation of a query running in the background
+_CANCELLATION_POLL_INTERVAL = 0.005
+
+
+class _CheckCancelledError(Exception):
+    """The query of a check was cancelled before it completed"""
+
+
+class _CancellableLazyFrame(pl.LazyFrame):
+    """LazyFrame whose queries run in the background, cancelled once `_cancelled` is
+    set. Frames derived from it, e.g. by `select` or `group_by(...).agg`, keep its
+    class, hence the queries a check builds from its data are cancellable, except
+    those combining frames with functions such as `pl.concat`."""
+
+    _cancelled: threading.Event
+
+    def collect(self, *args: Any, **kwargs: Any) -> Any:
+        if kwargs.get("background"):
+            return super().collect(*args, **kwargs)
+
+        query = super().collect(*args, background=True, **kwargs)
+        while (result := query.fetch()) is None:
+            if self._cancelled.wait(_CANCELLATION_POLL_INTERVAL):
+                query.cancel()
+                # The query stops at its next step, it must not be dropped before
+                with contextlib.suppress(pl.exceptions.ComputeError):
+                    query.fetch_blocking()
+                raise _CheckCancelledError
+        return result
+
+    def group_by(self, *args: Any, **kwargs: Any) -> Any:
+        return _CancellableGroupBy(super().group_by(*args, **kwargs), type(self))
+
+    def group_by_dynamic(self, *args: Any, **kwargs: Any) -> Any:
+        return _CancellableGroupBy(
+            super().group_by_dynamic(*args, **kwargs), type(self)
+        )
+
+    def rolling(self, *args: Any, **kwargs: Any) -> Any:
+        return _CancellableGroupBy(super().rolling(*args, **kwargs), type(self))
+
+
+class _CancellableGroupBy:
+    """Group by whose aggregated frames keep the class of the grouped frame"""
+
+    def __init__(self, group_by: Any, frame_class: type[_CancellableLazyFrame]):
+        self._group_by = group_by
+        self._frame_class = frame_class
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._group_by, name)
+        if not callable(attribute):
+            return attribute
+
+        @wraps(attribute)
+        def keep_frame_class(*args: Any, **kwargs: Any) -> Any:
+            result = attribute(*args, **kwargs)
+            if isinstance(result, pl.LazyFrame):
+                return self._frame_class._from_pyldf(result._ldf)
+            return result
+
+        return keep_frame_class
+
+
+def _cancellable(
+    data: PolarsLazyOrDataFrame, check: Callable, cancelled: threading.Event
+) -> PolarsLazyOrDataFrame:
+    """The data as a LazyFrame whose queries stop once `cancelled` is set.
+
+    The checks of pelage give the same verdict on DataFrames and LazyFrames, so
+    DataFrames are made lazy for them. Other callables may rely on the DataFrame API
+    and get DataFrames as is: their work cannot be cancelled.
+    """
+    if isinstance(data, pl.DataFrame) and _check_function(check) not in _CHECK_COSTS:
+        return data
+    frame_class = type(
+        "_CancellableLazyFrame", (_CancellableLazyFrame,), {"_cancelled": cancelled}
+    )
+    return frame_class._from_pyldf(data.lazy()._ldf)
+
+
+def validate_with_budget(
+    data: PolarsLazyOrDataFrame,
+    checks: Sequence[Check],
+    budget: float,
+    history: RuntimeHistory | None = None,
+) -> list[CheckResult]:
+    """Run checks from the cheapest to the most expensive, within a time budget.
+
+    Checks are run one after the other in a worker thread, their queries being
+    collected in the background. When the budget is exhausted, the query of the
+    running check is cancelled, and this check and the remaining ones are reported as
+    skipped: the function returns within the budget.
+
+    Parameters
+    ----------
+    data : PolarsLazyOrDataFrame
+        Polars DataFrame or LazyFrame containing data to check.
+    checks : Sequence[Callable]
+        Checks taking the data as only argument, e.g. built with `functools.partial`.
+    budget : float
+        Maximum duration of the validation, in seconds.
+    history : Optional[RuntimeHistory], optional
+        Past run times of the checks, used to estimate their cost and updated with the
+        new run times, by default None
+
+    Returns
+    -------
+    List[CheckResult]
+        The result of each check, in the order of `checks`.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> df = pl.DataFrame({"a": [1, 2, 2]})
+    >>> results = plg.validate_with_budget(
+    ...     df,
+    ...     [partial(plg.unique, columns="a"), partial(plg.has_columns, names="a")],
+    ...     budget=2.0,
+    ... )
+    >>> [(result.name, result.status) for result in results]
+    [('unique', 'failed'), ('has_columns', 'passed')]
+    """
+    deadline = time.monotonic() + budget
+    results: dict[int, CheckResult] = {}
+    data = _to_polars(data)
+
+    by_cost = _order_by_cost(checks, data, history, None)
+    cancelled = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pelage")
+    try:
+        for position in by_cost:
+            check = checks[position]
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            future = executor.submit(
+                _run_check, check, _cancellable(data, check, cancelled)
+            )
+            try:
+                results[position] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                cancelled.set()
+                break
+            if history is not None:
+                history.record(check, results[position].duration)  # type: ignore
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return [
+        results.get(position, CheckResult(_check_name(check), "skipped"))
+        for position, check in enumerate(checks)
+    ]
+
+
+def run_checks(
+    data: PolarsLazyOrDataFrame,
+    checks: Sequence[Check],
+    fail_fast: bool = False,
+    history: RuntimeHistory | None = None,
+    n_rows: int | None = None,
+) -> list[CheckResult]:
+    """Run checks from the cheapest to the most expensive, and gather their results.
+
+    The cost of each check is estimated from its past run times when a `history` is
+    given, otherwise from the number of columns it reads, the number of rows of the
+    data and the kind of work it does. Schema checks such as `has_columns` and
+    `has_dtypes` are always run first, as they do not read any data.
+
+    Parameters
+    ----------
+    data : PolarsLazyOrDataFrame
+        Polars DataFrame or LazyFrame containing data to check.
+    checks : Sequence[Callable]
+        Checks taking the data as only argument, e.g. built with `functools.partial`.
+    fail_fast : bool, optional
+        Stop at the first failing check, the remaining ones are skipped,
+        by default False
+    history : Optional[RuntimeHistory], optional
+        Past run times of the checks, used to estimate their cost and updated with the
+        new run times, by default None
+    n_rows : Optional[int], optional
+        Estimated number of rows of the data, useful for LazyFrames whose height is
+        unknown before collecting, by default None
+
+    Returns
+    -------
+    List[CheckResult]
+        The result of each check, in the order of `checks`.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> df = pl.DataFrame({"a": [1, 2, 2]})
+    >>> results = plg.run_checks(
+    ...     df,
+    ...     [partial(plg.unique, columns="a"), partial(plg.has_columns, names="b")],
+    ...     fail_fast=True,
+    ... )
+    >>> [(result.name, result.status) for result in results]
+    [('unique', 'skipped'), ('has_columns', 'failed')]
+    """
+    results: dict[int, CheckResult] = {}
+    data = _to_polars(data)
+
+    for position in _order_by_cost(checks, data, history, n_rows):
+        check = checks[position]
+        results[position] = result = _run_check(check, data)
+        if history is not None:
+            history.record(check, result.duration)  # type: ignore
+        if fail_fast and result.status == "failed":
+            break
+
+    return [
+        results.get(position, CheckResult(_check_name(check), "skipped"))
+        for position, check in enumerate(checks)
+    ]
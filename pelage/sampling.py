@@ -0,0 +1,122 @@
+"""Deterministic sampling of rows for the row-level checks of pelage."""
+
+import math
+
+import polars as pl
+
+from pelage.types import PolarsAssertError, PolarsLazyOrDataFrame
+
+# Fixed seed, so that the same rows are sampled from one run to the other
+_SAMPLING_SEED = 42
+# Quantile of the normal distribution for a 95% confidence interval
+_Z_95 = 1.959964
+
+
+def _sample_rows(
+    data: PolarsLazyOrDataFrame,
+    fraction: float,
+    stratify_by: str | list[str] | None = None,
+) -> pl.LazyFrame:
+    """Select a reproducible sample of rows, based on the hash of their position.
+
+    Without strata, each row is kept with the probability `fraction`. With strata,
+    the `ceil(fraction * stratum_size)` rows with the smallest hashes are kept in each
+    stratum, so that even the smallest strata are represented. The size of the stratum
+    of each row is stored in the column `stratum_size__`.
+    """
+    if not 0 < fraction <= 1:
+        raise ValueError(f"The sample fraction should be in ]0, 1]: {fraction}")
+
+    row_hash = pl.int_range(pl.len(), dtype=pl.UInt64).hash(_SAMPLING_SEED)
+
+    if stratify_by is None:
+        return (
+            data.lazy()
+            .with_columns(pl.len().alias("stratum_size__"))
+            .filter(row_hash / 2.0**64 < fraction)
+        )
+
+    return (
+        data.lazy()
+        .with_columns(
+            pl.len().over(stratify_by).alias("stratum_size__"),
+            row_hash.alias("row_hash__"),
+        )
+        .filter(
+            pl.col("row_hash__").rank("ordinal").over(stratify_by)
+            <= (fraction * pl.col("stratum_size__")).ceil()
+        )
+        .drop("row_hash__")
+    )
+
+
+def _wilson_interval(rate: float, n_samples: int) -> tuple[float, float]:
+    """95% confidence interval of a proportion estimated on `n_samples` rows."""
+    z2_n = _Z_95**2 / n_samples
+    center = (rate + z2_n / 2) / (1 + z2_n)
+    half_width = (
+        _Z_95
+        * math.sqrt(rate * (1 - rate) / n_samples + z2_n / (4 * n_samples))
+        / (1 + z2_n)
+    )
+    return max(center - half_width, 0.0), min(center + half_width, 1.0)
+
+
+def _check_sample(
+    data: PolarsLazyOrDataFrame,
+    violations: pl.Expr,
+    fraction: float,
+    stratify_by: str | list[str] | None,
+    message: str,
+) -> None:
+    """Evaluate the row-level `violations` on a sample of `data` only, and raise with
+    an estimate of the violation rate of the whole data when any is found."""
+    sampled_rows = _sample_rows(data, fraction, stratify_by).with_columns(
+        violations.fill_null(False).alias("violation__")
+    )
+
+    strata_counts = [
+        pl.col("stratum_size__").first().alias("stratum_size"),
+        pl.len().alias("n_samples"),
+        pl.col("violation__").sum().alias("n_violations"),
+    ]
+    strata = (
+        sampled_rows.select(strata_counts)
+        if stratify_by is None
+        else sampled_rows.group_by(stratify_by).agg(strata_counts)
+    )
+
+    strata, bad_rows = pl.collect_all(
+        [
+            strata,
+            sampled_rows.filter(pl.col("violation__")).drop(
+                "stratum_size__", "violation__"
+            ),
+        ]
+    )
+
+    if bad_rows.is_empty():
+        return
+
+    # Each stratum contributes to the estimate proportionally to its size
+    n_rows, n_samples, violation_rate = strata.select(
+        pl.col("stratum_size").sum(),
+        pl.col("n_samples").sum(),
+        (
+            (
+                pl.col("stratum_size") * pl.col("n_violations") / pl.col("n_samples")
+            ).sum()
+            / pl.col("stratum_size").sum()
+        ).alias("violation_rate"),
+    ).row(0)
+    low, high = _wilson_interval(violation_rate, n_samples)
+
+    raise PolarsAssertError(
+        df=bad_rows,
+        supp_message=(
+            f"{message}\n"
+            + f"Estimated violation rate: {violation_rate:.2%} "
+            + f"(95% confidence interval: {low:.2%} - {high:.2%}), "
+            + f"from a sample of {n_samples} rows out of {n_rows}"
+        ),
+    )
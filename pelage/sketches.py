@@ -0,0 +1,141 @@
+"""Mergeable sketches used by pelage checks to summarize large datasets."""
+
+import math
+from dataclasses import dataclass
+
+import polars as pl
+
+from pelage.types import PolarsLazyOrDataFrame
+
+_BINS_SCHEMA = {"sign": pl.Int8, "index": pl.Int64, "count": pl.UInt64}
+
+
+@dataclass(frozen=True)
+class QuantileSketch:
+    """Approximate quantiles of a numerical column, with a bounded relative error.
+
+    Values are counted in logarithmic buckets, as in the DDSketch algorithm: each
+    quantile estimate is within `relative_accuracy` of the exact value. The memory
+    footprint only depends on the range of magnitudes of the data, not on the number
+    of rows, and sketches computed on different batches or files can be merged into
+    the exact same sketch that would be obtained from the whole data.
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> from pelage.sketches import QuantileSketch
+    >>> first = QuantileSketch.from_data(pl.DataFrame({"a": [1, 2, 3]}), "a")
+    >>> second = QuantileSketch.from_data(pl.DataFrame({"a": [4, 5]}), "a")
+    >>> merged = first.merge(second)
+    >>> merged.count
+    5
+    >>> round(merged.quantile(0.5))  # within 1% of the exact median
+    3
+
+    Attributes
+    ----------
+    bins : pl.DataFrame
+        Count of values per bucket, with columns `sign`, `index` and `count`.
+    relative_accuracy : float, optional
+        Maximum relative error of the quantile estimates, by default 0.01
+    """
+
+    bins: pl.DataFrame
+    relative_accuracy: float = 0.01
+
+    @property
+    def gamma(self) -> float:
+        return (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+
+    @property
+    def count(self) -> int:
+        return int(self.bins.get_column("count").sum())
+
+    @classmethod
+    def from_data(
+        cls,
+        data: PolarsLazyOrDataFrame,
+        column: str,
+        relative_accuracy: float = 0.01,
+    ) -> "QuantileSketch":
+        """Build the sketch of one column, nulls and non finite values are ignored."""
+        return sketch_columns(data, [column], relative_accuracy)[column]
+
+    @classmethod
+    def empty(cls, relative_accuracy: float = 0.01) -> "QuantileSketch":
+        return cls(pl.DataFrame(schema=_BINS_SCHEMA), relative_accuracy)
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Combine two sketches, as if built from the concatenation of their data."""
+        if not math.isclose(self.relative_accuracy, other.relative_accuracy):
+            raise ValueError(
+                "Cannot merge sketches with different relative accuracies: "
+                + f"{self.relative_accuracy} and {other.relative_accuracy}"
+            )
+        bins = (
+            pl.concat([self.bins, other.bins])
+            .group_by("sign", "index")
+            .agg(pl.col("count").sum())
+        )
+        return QuantileSketch(bins, self.relative_accuracy)
+
+    def quantile(self, quantile: float) -> float | None:
+        """Estimate the value at the given quantile, None if the sketch is empty."""
+        if not 0 <= quantile <= 1:
+            raise ValueError(f"The quantile should be between 0 and 1: {quantile}")
+        if self.count == 0:
+            return None
+
+        rank = quantile * (self.count - 1)
+        sign, index = (
+            self.bins.sort(pl.col("sign"), pl.col("index") * pl.col("sign"))
+            .filter(pl.col("count").cum_sum() > rank)
+            .select("sign", "index")
+            .row(0)
+        )
+        return sign * 2 * self.gamma**index / (self.gamma + 1)
+
+
+def sketch_columns(
+    data: PolarsLazyOrDataFrame,
+    columns: list[str],
+    relative_accuracy: float = 0.01,
+) -> dict[str, QuantileSketch]:
+    """Build the sketches of several columns with a single scan of the data.
+
+    The columns are stacked in long format, and the values of all of them are
+    counted per bucket by the same `group_by`.
+    """
+    if not 0 < relative_accuracy < 1:
+        raise ValueError(
+            f"The relative accuracy should be between 0 and 1: {relative_accuracy}"
+        )
+    if not columns:
+        return {}
+    log_gamma = math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+
+    value = pl.col("value")
+    bins = (
+        data.lazy()
+        .select(pl.col(column).cast(pl.Float64) for column in dict.fromkeys(columns))
+        .unpivot(variable_name="column", value_name="value")
+        .filter(value.is_finite())
+        .group_by(
+            "column",
+            value.sign().cast(pl.Int8).alias("sign"),
+            pl.when(value != 0)
+            .then((value.abs().log() / log_gamma).ceil())
+            .otherwise(0)
+            .cast(pl.Int64)
+            .alias("index"),
+        )
+        .agg(pl.len().cast(pl.UInt64).alias("count"))
+        .collect()
+    )
+
+    return {
+        column: QuantileSketch(
+            bins.filter(pl.col("column") == column).drop("column"), relative_accuracy
+        )
+        for column in columns
+    }
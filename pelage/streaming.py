@@ -0,0 +1,396 @@
+"""Check data arriving batch by batch, carrying state between batches."""
+
+from collections.abc import Iterable, Iterator, Sequence
+from functools import partial
+from typing import Any
+
+import polars as pl
+
+from pelage.checks.is_monotonic import is_monotonic
+from pelage.checks.mutually_exclusive_ranges import mutually_exclusive_ranges
+from pelage.compiled import _SAMPLING_ARGUMENTS
+from pelage.partials import PartialResult, _partial_spec, summarize_check
+from pelage.runner import (
+    Check,
+    CheckResult,
+    _check_arguments,
+    _check_function,
+    _check_name,
+)
+from pelage.types import PolarsAssertError, PolarsLazyOrDataFrame
+from pelage.utils import _format_group_columns
+from pelage.violations import _VIOLATION_MASKS, _violation_mask
+
+# Streaming engine of polars producing the result of a LazyFrame batch by batch
+_HAS_COLLECT_BATCHES = hasattr(pl.LazyFrame, "collect_batches")
+
+# Flags the rows carried over from the previous batches, in error details
+_CARRIED = "_from_previous_batch"
+
+
+class _CarryingCheck:
+    """Check comparing each row to the previous one of its group, batches included.
+
+    The last row of each group is carried over to the next batch, hence the state
+    only grows with the number of groups, not with the number of rows.
+    """
+
+    def __init__(self, columns: list[str], group_by: str | list[str] | None) -> None:
+        self.group_columns = _format_group_columns(group_by)
+        self._columns = [*self.group_columns, *columns]
+        self.carry: pl.DataFrame | None = None
+
+    def reset(self) -> None:
+        """Forget the previous batches, to check a new stream"""
+        self.carry = None
+
+    def _with_carry(self, batch: pl.LazyFrame) -> pl.LazyFrame:
+        """The batch, preceded by the last row of each group of the previous batches"""
+        batch = batch.with_columns(pl.lit(False).alias(_CARRIED))
+        if self.carry is None:
+            return batch
+        return pl.concat(
+            [self.carry.lazy().with_columns(pl.lit(True).alias(_CARRIED)), batch],
+            how="diagonal_relaxed",
+        )
+
+    def _over(self, expression: pl.Expr) -> pl.Expr:
+        return expression.over(self.group_columns) if self.group_columns else expression
+
+    def _run(
+        self, batch: pl.LazyFrame, failures: pl.Expr, rows: pl.Expr
+    ) -> pl.DataFrame | None:
+        """Rows of the failing pairs, and update of the carry from this batch"""
+        combined = self._with_carry(batch).with_columns(failures.alias("failure__"))
+        last_rows = combined.select(self._columns)
+        last_rows = (
+            last_rows.group_by(self.group_columns, maintain_order=True).last()
+            if self.group_columns
+            else last_rows.last()
+        )
+        errors, self.carry = pl.collect_all(
+            [combined.filter(rows).drop("failure__"), last_rows]
+        )
+        return errors if errors.height else None
+
+
+class StreamingIsMonotonic(_CarryingCheck):
+    """Stateful `is_monotonic`, to check sorted data arriving in several batches.
+
+    Calling `is_monotonic` on each batch misses the breaks of monotony between the
+    last row of a batch and the first one of the next. The streaming version carries
+    the last value of each group from one batch to the next, so that checking all the
+    batches in order gives the same verdict as checking their concatenation.
+
+    Parameters
+    ----------
+    column : str
+        Name of the column that should be monotonic.
+    decreasing : bool, optional
+        Should the column be decreasing, by default False
+    strict : bool, optional
+        The series must be stricly increasing or decreasing, no consecutive equal values
+        are allowed, by default True
+    group_by : Optional[Union[str, List[str]]], optional
+        Columns whose groups are checked independently, by default None
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> check = plg.StreamingIsMonotonic("time")
+    >>> pl.DataFrame({"time": [1, 2, 3]}).pipe(check).shape
+    (3, 1)
+    >>> pl.DataFrame({"time": [3, 4]}).pipe(check)
+    Traceback (most recent call last):
+    ...
+    pelage.types.PolarsAssertError: Details
+    shape: (2, 2)
+    ┌──────┬──────────────────────┐
+    │ time ┆ _from_previous_batch │
+    │ ---  ┆ ---                  │
+    │ i64  ┆ bool                 │
+    ╞══════╪══════════════════════╡
+    │ 3    ┆ true                 │
+    │ 3    ┆ false                │
+    └──────┴──────────────────────┘
+    Error with the DataFrame passed to the check function:
+    --> Column "time" expected to be monotonic but is not, try .sort("time")
+    """
+
+    def __init__(
+        self,
+        column: str,
+        decreasing: bool = False,
+        strict: bool = True,
+        group_by: str | list[str] | None = None,
+    ) -> None:
+        super().__init__([column], group_by)
+        self.column = column
+        self.decreasing = decreasing
+        self.strict = strict
+
+    def _is_monotonic_step(self, previous: pl.Expr, current: pl.Expr) -> pl.Expr:
+        match self.decreasing, self.strict:
+            case False, False:
+                return current >= previous
+            case False, True:
+                return current > previous
+            case True, False:
+                return current <= previous
+            case _:
+                return current < previous
+
+    def __call__(self, batch: PolarsLazyOrDataFrame) -> PolarsLazyOrDataFrame:
+        value = pl.col(self.column)
+        # Nulls pass, as in `is_monotonic`
+        failures = self._over(
+            self._is_monotonic_step(value.shift(), value).not_().fill_null(False)
+        )
+        errors = self._run(
+            batch.lazy(),
+            failures,
+            pl.col("failure__") | self._over(pl.col("failure__").shift(-1)),
+        )
+        if errors is not None:
+            raise PolarsAssertError(
+                df=errors,
+                supp_message=f'Column "{self.column}" expected to be monotonic but is'
+                + f' not, try .sort("{self.column}")',
+            )
+        return batch
+
+
+class StreamingMutuallyExclusiveRanges(_CarryingCheck):
+    """Stateful `mutually_exclusive_ranges`, to check intervals arriving in several
+    batches.
+
+    Each batch is sorted by its bounds, and its first interval of each group is
+    compared to the last interval of the previous batches. Checking batches sorted by
+    their low bound, e.g. successive chunks of an event log, then gives the same
+    verdict as checking their concatenation, while only keeping one interval per
+    group between batches.
+
+    Parameters
+    ----------
+    low_bound : str
+        Name of column containing the lower bound of the interval
+    high_bound : str
+        Name of column containing the higher bound of the interval
+    group_by : Optional[Union[str, List[str]]], optional
+        Columns whose groups are checked independently, by default None
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> check = plg.StreamingMutuallyExclusiveRanges("start", "end")
+    >>> pl.DataFrame({"start": [1, 3], "end": [2, 5]}).pipe(check).shape
+    (2, 2)
+    >>> pl.DataFrame({"start": [4, 6], "end": [5, 7]}).pipe(check)
+    Traceback (most recent call last):
+    ...
+    pelage.types.PolarsAssertError: Details
+    shape: (2, 3)
+    ┌───────┬─────┬──────────────────────┐
+    │ start ┆ end ┆ _from_previous_batch │
+    │ ---   ┆ --- ┆ ---                  │
+    │ i64   ┆ i64 ┆ bool                 │
+    ╞═══════╪═════╪══════════════════════╡
+    │ 3     ┆ 5   ┆ true                 │
+    │ 4     ┆ 5   ┆ false                │
+    └───────┴─────┴──────────────────────┘
+    Error with the DataFrame passed to the check function:
+    --> There were overlapping intervals:
+    Batches were sorted by: ['start', 'end'],
+    Interval columns: low_bound='start', high_bound='end'
+    """
+
+    def __init__(
+        self,
+        low_bound: str,
+        high_bound: str,
+        group_by: str | list[str] | None = None,
+    ) -> None:
+        super().__init__([low_bound, high_bound], group_by)
+        self.low_bound = low_bound
+        self.high_bound = high_bound
+
+    def __call__(self, batch: PolarsLazyOrDataFrame) -> PolarsLazyOrDataFrame:
+        sorting_columns = [*self.group_columns, self.low_bound, self.high_bound]
+        is_overlapping_interval = self._over(
+            pl.col(self.low_bound) <= pl.col(self.high_bound).shift()
+        ).fill_null(False)
+        errors = self._run(
+            batch.lazy().sort(sorting_columns),
+            is_overlapping_interval,
+            pl.col("failure__") | self._over(pl.col("failure__").shift(-1)),
+        )
+        if errors is not None:
+            message = (
+                "There were overlapping intervals:\n"
+                + f"Batches were sorted by: {sorting_columns},\n"
+                + f"Interval columns: low_bound={self.low_bound!r}, "
+                + f"high_bound={self.high_bound!r}"
+            )
+            raise PolarsAssertError(df=errors, supp_message=message)
+        return batch
+
+
+def _iter_batches(batches: Any) -> Iterator[pl.DataFrame]:
+    """DataFrames from the batch sources supported by `validate_stream`"""
+    if isinstance(batches, pl.LazyFrame):
+        if not _HAS_COLLECT_BATCHES:
+            raise ValueError(
+                "Checking a LazyFrame batch by batch requires polars>=1.33.0"
+            )
+        yield from batches.collect_batches()
+    elif hasattr(batches, "next_batches"):
+        # Readers returned by `pl.read_csv_batched`
+        while (next_batches := batches.next_batches(1)) is not None:
+            yield from next_batches
+    else:
+        for batch in batches:
+            if isinstance(batch, pl.DataFrame):
+                yield batch
+            elif isinstance(batch, pl.LazyFrame):
+                yield batch.collect()
+            else:
+                # Arrow record batches, e.g. from a `pyarrow.RecordBatchReader`
+                yield pl.from_arrow(batch)  # type: ignore
+
+
+def _streaming_check(check: Check) -> _CarryingCheck | None:
+    """Stateful version of the checks comparing consecutive rows"""
+    function = _check_function(check)
+    arguments = _check_arguments(check)
+    if function is is_monotonic and arguments.get("interval") is None:
+        return StreamingIsMonotonic(
+            arguments["column"],
+            arguments.get("decreasing", False),
+            arguments.get("strict", True),
+            arguments.get("group_by"),
+        )
+    if function is mutually_exclusive_ranges:
+        return StreamingMutuallyExclusiveRanges(
+            arguments["low_bound"], arguments["high_bound"], arguments.get("group_by")
+        )
+    return None
+
+
+def validate_stream(
+    batches: Iterable[Any] | pl.LazyFrame,
+    checks: Sequence[Check],
+) -> list[CheckResult]:
+    """Run checks over data arriving as a sequence of batches, one batch at a time.
+
+    Only one batch is held in memory at a time, along with a summary per check:
+
+    - the expressions of the row-level checks (`accepted_values`, `has_no_nulls`,
+      ...) are built once, and evaluated together in a single query per batch, as in
+      `compile_checks`,
+    - `is_monotonic` and `mutually_exclusive_ranges` carry the last row of each group
+      to the next batch, as `StreamingIsMonotonic` does: batches must arrive in
+      order,
+    - the other checks, e.g. `unique` or `has_mandatory_values`, merge the partial
+      results of the batches, as `summarize_check` does, to decide on all the
+      batches at once.
+
+    Checks needing a second pass over the data, such as `column_is_within_n_std`
+    without a baseline, are not supported.
+
+    Parameters
+    ----------
+    batches : Union[Iterable, pl.LazyFrame]
+        The batches to check: an iterable of DataFrames, e.g. `df.iter_slices()`, a
+        reader returned by `pl.read_csv_batched`, an iterable of Arrow record
+        batches, e.g. a `pyarrow.RecordBatchReader`, or a LazyFrame run with the
+        streaming engine.
+    checks : Sequence[Callable]
+        Checks taking the data as only argument, e.g. built with `functools.partial`.
+
+    Returns
+    -------
+    List[CheckResult]
+        The result of each check over all the batches, in the order of `checks`.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> df = pl.DataFrame({"a": [1, 2, 3, 1], "b": [1, 2, None, 4]})
+    >>> results = plg.validate_stream(
+    ...     df.iter_slices(2),
+    ...     [partial(plg.unique, columns="a"), partial(plg.has_no_nulls, columns="a")],
+    ... )
+    >>> [result.status for result in results]
+    ['failed', 'passed']
+    """
+    row_level_checks: dict[int, Check] = {}
+    streaming_checks: dict[int, _CarryingCheck] = {}
+    global_checks: dict[int, Check] = {}
+    for position, check in enumerate(checks):
+        function = _check_function(check)
+        if function in _VIOLATION_MASKS:
+            # Every row is checked, sampling arguments are ignored
+            arguments = {
+                name: value
+                for name, value in _check_arguments(check).items()
+                if name not in _SAMPLING_ARGUMENTS
+            }
+            row_level_checks[position] = partial(function, **arguments)
+        elif (streaming_check := _streaming_check(check)) is not None:
+            streaming_checks[position] = streaming_check
+        elif _partial_spec(check).second_pass is not None:
+            raise ValueError(
+                f"The check {function.__name__} needs a second pass over the data, "
+                + "which a stream of batches does not allow"
+            )
+        else:
+            global_checks[position] = check
+    violation_flags = [
+        _violation_mask(check).any().alias(str(position))
+        for position, check in row_level_checks.items()
+    ]
+
+    merged: dict[int, PartialResult] = {}
+
+    def add(position: int, partial_result: PartialResult) -> None:
+        previous = merged.get(position)
+        merged[position] = (
+            partial_result if previous is None else previous.merge(partial_result)
+        )
+
+    errors: dict[int, list[PolarsAssertError]] = {}
+    for batch in _iter_batches(batches):
+        if violation_flags:
+            flags = batch.select(violation_flags).row(0, named=True)
+            for position, check in row_level_checks.items():
+                if flags[str(position)]:
+                    add(position, summarize_check(batch, check))
+
+        for position, streaming_check in streaming_checks.items():
+            try:
+                streaming_check(batch)
+            except PolarsAssertError as error:
+                errors.setdefault(position, []).append(error)
+
+        for position, check in global_checks.items():
+            add(position, summarize_check(batch, check))
+
+    results = []
+    for position, check in enumerate(checks):
+        if position in merged:
+            results.append(merged[position].verdict())
+        elif position in errors:
+            error = PolarsAssertError(
+                pl.concat(
+                    [error.df for error in errors[position]], how="diagonal_relaxed"
+                ),
+                errors[position][0].supp_message,
+            )
+            results.append(CheckResult(_check_name(check), "failed", error))
+        else:
+            results.append(CheckResult(_check_name(check), "passed"))
+    return results
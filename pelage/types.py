@@ -1,14 +1,41 @@
 """Module containing the type definitions for pelage."""
 
 from collections.abc import Iterable
-from typing import TypeVar
+from typing import TYPE_CHECKING, Protocol, TypeVar
 
 import polars as pl
 from polars._typing import ClosedInterval, IntoExpr, PolarsDataType
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow.dataset as pds
+
 # Use typevar to make sure that the input and return types are the same
 PolarsLazyOrDataFrame = TypeVar("PolarsLazyOrDataFrame", pl.DataFrame, pl.LazyFrame)
 
+
+class ArrowStreamExportable(Protocol):
+    """Objects implementing the Arrow PyCapsule stream interface, e.g. pyarrow Tables"""
+
+    def __arrow_c_stream__(self, requested_schema: object | None = None) -> object: ...
+
+
+class ArrowArrayExportable(Protocol):
+    """Objects implementing the Arrow PyCapsule array interface, e.g. RecordBatches"""
+
+    def __arrow_c_array__(
+        self, requested_schema: object | None = None
+    ) -> tuple[object, object]: ...
+
+
+ArrowExportable = ArrowStreamExportable | ArrowArrayExportable
+
+# Data accepted by the checks, which return it unchanged when they pass
+ArrowCompatibleFrame = TypeVar(
+    "ArrowCompatibleFrame",
+    bound="pl.DataFrame | pl.LazyFrame | pd.DataFrame | pds.Dataset | ArrowExportable",
+)
+
 PolarsColumnBounds = (
     tuple[IntoExpr, IntoExpr] | tuple[IntoExpr, IntoExpr, ClosedInterval]
 )
@@ -1,8 +1,15 @@
 """Utility functions for pelage."""
 
+import functools
+import sys
+from collections.abc import Callable
+from typing import Any, Concatenate, ParamSpec, Protocol, cast
+
 import polars as pl
 
-from pelage.types import PolarsColumnType
+from pelage.types import ArrowCompatibleFrame, PolarsColumnType, PolarsLazyOrDataFrame
+
+P = ParamSpec("P")
 
 
 def _has_sufficient_polars_version(version_number: str = "0.20.0") -> bool:
@@ -21,3 +28,96 @@ def _sanitize_column_inputs(
         return columns
     else:
         return pl.col(columns)
+
+
+# Margin below the row count under which an approximate distinct count is considered
+# as a certain duplication, far beyond the ~1% error of HyperLogLog estimates.
+_APPROX_N_UNIQUE_TOLERANCE = 0.05
+
+
+def _format_group_columns(group_by: str | list[str] | None) -> list[str]:
+    if group_by is None:
+        return []
+    return [group_by] if isinstance(group_by, str) else list(group_by)
+
+
+def _approx_duplicated_columns(
+    data: pl.DataFrame | pl.LazyFrame,
+    columns: pl.Expr,
+) -> pl.DataFrame:
+    """Columns whose approximate number of distinct values is clearly below the number
+    of rows, which means that they contain duplicates."""
+    return (
+        data.lazy()
+        .select(columns.approx_n_unique(), pl.len().alias("n_rows__"))
+        .unpivot(index="n_rows__", variable_name="column", value_name="approx_n_unique")
+        .filter(
+            pl.col("approx_n_unique")
+            < (1 - _APPROX_N_UNIQUE_TOLERANCE) * pl.col("n_rows__")
+        )
+        .select("column", pl.col("n_rows__").alias("n_rows"), "approx_n_unique")
+        .collect()
+    )
+
+
+def _to_polars(data: Any) -> Any:
+    """Polars view of Arrow-compatible data, without copy when possible.
+
+    pyarrow datasets are scanned lazily, pandas frames are converted, and objects
+    implementing the Arrow PyCapsule interface are imported without copying the
+    buffers. Optional dependencies are only looked up when already imported by the
+    caller. Other objects are returned unchanged.
+    """
+    if isinstance(data, pl.DataFrame | pl.LazyFrame):
+        return data
+
+    pyarrow_dataset = sys.modules.get("pyarrow.dataset")
+    if pyarrow_dataset is not None and isinstance(data, pyarrow_dataset.Dataset):
+        return pl.scan_pyarrow_dataset(data)
+
+    pandas = sys.modules.get("pandas")
+    if pandas is not None and isinstance(data, pandas.DataFrame):
+        return pl.from_pandas(data)
+
+    if hasattr(data, "__arrow_c_stream__") or hasattr(data, "__arrow_c_array__"):
+        # Polars imports the PyCapsule interface directly since 1.3.0
+        if _has_sufficient_polars_version("1.3.0"):
+            return pl.DataFrame(data)
+        try:
+            import pyarrow as pa
+        except ImportError as error:
+            raise ImportError(
+                "Arrow PyCapsule objects need polars >= 1.3.0, or pyarrow to be "
+                + f"installed, found polars {pl.__version__}"
+            ) from error
+        return pl.from_arrow(pa.table(data))
+
+    return data
+
+
+class _ArrowCompatibleCheck(Protocol[P]):
+    """A check taking any Arrow-compatible data, and returning it when it passes"""
+
+    def __call__(
+        self, data: ArrowCompatibleFrame, /, *args: P.args, **kwargs: P.kwargs
+    ) -> ArrowCompatibleFrame: ...
+
+
+def _accept_arrow_inputs(
+    check: Callable[Concatenate[PolarsLazyOrDataFrame, P], PolarsLazyOrDataFrame],
+) -> _ArrowCompatibleCheck[P]:
+    """Let a check take Arrow-compatible data, returning the original object.
+
+    The data is wrapped as a polars frame with `_to_polars` before running the check,
+    and the caller gets its own object back, e.g. a pyarrow Table or a pandas
+    DataFrame, when the check passes. The other parameters of the check keep their
+    types.
+    """
+
+    @functools.wraps(check)
+    def wrapper(data: Any, *args: P.args, **kwargs: P.kwargs) -> Any:
+        polars_data = _to_polars(data)
+        result = check(polars_data, *args, **kwargs)
+        return data if polars_data is not data else result
+
+    return cast(_ArrowCompatibleCheck[P], wrapper)
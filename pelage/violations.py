@@ -0,0 +1,278 @@
+"""Flag the rows violating row-level checks, instead of raising an error."""
+
+import inspect
+from collections.abc import Callable, Sequence
+from functools import reduce
+from pathlib import Path
+
+import polars as pl
+
+from pelage.checks.accepted_range import _out_of_range, accepted_range
+from pelage.checks.accepted_values import _improper_values, accepted_values
+from pelage.checks.custom_check import _unexpected_rows, custom_check
+from pelage.checks.has_no_infs import _rows_with_infs, has_no_infs
+from pelage.checks.has_no_nulls import _rows_with_nulls, has_no_nulls
+from pelage.checks.not_accepted_values import _forbidden_values, not_accepted_values
+from pelage.runner import Check, _check_arguments, _check_function, _check_name
+from pelage.types import PolarsAssertError, PolarsLazyOrDataFrame
+from pelage.utils import _has_sufficient_polars_version
+
+# Expression marking the rows that fail each check, and the argument it is built from
+_VIOLATION_MASKS: dict[Callable, tuple[Callable[..., pl.Expr], str]] = {
+    accepted_range: (_out_of_range, "items"),
+    accepted_values: (_improper_values, "items"),
+    custom_check: (_unexpected_rows, "expression"),
+    has_no_infs: (_rows_with_infs, "columns"),
+    has_no_nulls: (_rows_with_nulls, "columns"),
+    not_accepted_values: (_forbidden_values, "items"),
+}
+_MAX_RULES = 64
+# Sinks can be combined in a single query since they accept `lazy=True`
+_HAS_LAZY_SINKS = "lazy" in inspect.signature(pl.LazyFrame.sink_parquet).parameters
+# Polars < 1.3 panics on `concat_list` of literals over empty frames
+_HAS_EMPTY_CONCAT_LIST = _has_sufficient_polars_version("1.3.0")
+# Separator of the reasons joined as a string, absent from function names
+_REASONS_SEPARATOR = "\x1f"
+
+
+def _violation_mask(check: Check) -> pl.Expr:
+    """Boolean expression, true for the rows that would make the check fail"""
+    function = _check_function(check)
+    if function not in _VIOLATION_MASKS:
+        raise ValueError(
+            f"Only row-level checks can flag rows: {_check_name(check)} is not one of "
+            + f"{[check.__name__ for check in _VIOLATION_MASKS]}"
+        )
+    build_mask, argument = _VIOLATION_MASKS[function]
+    return build_mask(_check_arguments(check).get(argument)).fill_null(False)
+
+
+def _violation_bits(rules: Sequence[Check]) -> pl.Expr:
+    """Expression of the UInt64 bitmask of the rules violated by each row.
+
+    The bit `i` is set when the row fails the check `rules[i]`. See `flag_violations`.
+    """
+    if not 0 < len(rules) <= _MAX_RULES:
+        raise ValueError(
+            f"Between 1 and {_MAX_RULES} rules can be flagged, got {len(rules)}"
+        )
+    return reduce(
+        lambda bits, rule_bit: bits | rule_bit,
+        (
+            pl.when(_violation_mask(rule))
+            .then(pl.lit(1 << position, dtype=pl.UInt64))
+            .otherwise(pl.lit(0, dtype=pl.UInt64))
+            for position, rule in enumerate(rules)
+        ),
+    )
+
+
+def flag_violations(
+    data: PolarsLazyOrDataFrame,
+    rules: Sequence[Check],
+    name: str = "violations",
+) -> PolarsLazyOrDataFrame:
+    """Append a bitmask column of the rules violated by each row, instead of raising.
+
+    All the rules are evaluated in a single `with_columns`, and the bit `i` of the
+    UInt64 column is set when the row fails the check `rules[i]`. Rows can then be
+    filtered, counted or routed per rule with cheap integer operations, e.g.
+    `pl.col("violations") & (1 << i) != 0`, without running the checks again.
+
+    Supported checks are the row-level ones: `accepted_values`, `not_accepted_values`,
+    `accepted_range`, `has_no_nulls`, `has_no_infs` and `custom_check`. Their
+    sampling arguments are ignored, every row is flagged.
+
+    Parameters
+    ----------
+    data : PolarsLazyOrDataFrame
+        Polars DataFrame or LazyFrame containing data to check.
+    rules : Sequence[Callable]
+        Up to 64 row-level checks with their arguments, e.g. built with
+        `functools.partial`.
+    name : str, optional
+        Name of the bitmask column, by default "violations"
+
+    Returns
+    -------
+    PolarsLazyOrDataFrame
+        The data with the additional bitmask column.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> df = pl.DataFrame({"a": [1, 5, None], "b": ["x", "y", "z"]})
+    >>> df.pipe(
+    ...     plg.flag_violations,
+    ...     [
+    ...         partial(plg.accepted_range, items={"a": (0, 2)}),
+    ...         partial(plg.has_no_nulls, columns="a"),
+    ...         partial(plg.not_accepted_values, items={"b": ["y", "z"]}),
+    ...     ],
+    ... )
+    shape: (3, 3)
+    ┌──────┬─────┬────────────┐
+    │ a    ┆ b   ┆ violations │
+    │ ---  ┆ --- ┆ ---        │
+    │ i64  ┆ str ┆ u64        │
+    ╞══════╪═════╪════════════╡
+    │ 1    ┆ x   ┆ 0          │
+    │ 5    ┆ y   ┆ 5          │
+    │ null ┆ z   ┆ 6          │
+    └──────┴─────┴────────────┘
+    """
+    return data.with_columns(_violation_bits(rules).alias(name))
+
+
+def _violation_reasons(rules: Sequence[Check], name: str) -> pl.Expr:
+    """Names of the checks failed by each row, decoded from the bitmask column"""
+    reasons = [
+        pl.when(pl.col(name) & (1 << position) != 0).then(pl.lit(_check_name(rule)))
+        for position, rule in enumerate(rules)
+    ]
+    if not _HAS_EMPTY_CONCAT_LIST:
+        return pl.concat_str(
+            reasons, separator=_REASONS_SEPARATOR, ignore_nulls=True
+        ).str.split(_REASONS_SEPARATOR)
+    return pl.concat_list(reasons).list.drop_nulls()
+
+
+def _sink_parquet(data: pl.LazyFrame, path: str | Path) -> None:
+    try:
+        data.sink_parquet(path)
+    except pl.exceptions.InvalidOperationError:
+        # Plans that the engine of polars 1 cannot sink, e.g. with Python functions
+        data.collect().write_parquet(path)
+
+
+def validate_and_write(
+    data: PolarsLazyOrDataFrame,
+    rules: Sequence[Check],
+    path: str | Path,
+    quarantine_path: str | Path,
+    raise_on_failure: bool = True,
+    name: str = "violations",
+) -> pl.DataFrame:
+    """Validate the data while writing it: valid rows to `path`, others to quarantine.
+
+    The source is read once, with the streaming engine: both parquet files are
+    written by the same query, and memory stays bounded by the size of the batches.
+    Versions of polars whose sinks cannot be combined read the source once per file.
+    Quarantined rows keep their columns, along with the bitmask of the failed rules
+    computed as in `flag_violations`, and the list of their names in `reasons`.
+
+    Parameters
+    ----------
+    data : PolarsLazyOrDataFrame
+        Polars DataFrame or LazyFrame containing data to check and write.
+    rules : Sequence[Callable]
+        Up to 64 row-level checks with their arguments, e.g. built with
+        `functools.partial`.
+    path : Union[str, Path]
+        Parquet file receiving the rows passing all the rules.
+    quarantine_path : Union[str, Path]
+        Parquet file receiving the rows failing at least one rule.
+    raise_on_failure : bool, optional
+        Raise a PolarsAssertError once the files are written, when some rows were
+        quarantined, by default True
+    name : str, optional
+        Name of the bitmask column in the quarantine file, by default "violations"
+
+    Returns
+    -------
+    pl.DataFrame
+        The number of rows failing each rule.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from functools import partial
+    >>> from pathlib import Path
+    >>> import polars as pl
+    >>> import pelage as plg
+    >>> directory = Path(tempfile.mkdtemp())
+    >>> lf = pl.LazyFrame({"a": [1, 5, None]})
+    >>> plg.validate_and_write(
+    ...     lf,
+    ...     [
+    ...         partial(plg.accepted_range, items={"a": (0, 2)}),
+    ...         partial(plg.has_no_nulls, columns="a"),
+    ...     ],
+    ...     directory / "valid.parquet",
+    ...     directory / "quarantine.parquet",
+    ... )
+    Traceback (most recent call last):
+    ...
+    pelage.types.PolarsAssertError: Details
+    shape: (2, 2)
+    ┌────────────────┬──────────────┐
+    │ rule           ┆ n_violations │
+    │ ---            ┆ ---          │
+    │ str            ┆ u32          │
+    ╞════════════════╪══════════════╡
+    │ accepted_range ┆ 1            │
+    │ has_no_nulls   ┆ 1            │
+    └────────────────┴──────────────┘
+    Error with the DataFrame passed to the check function:
+    --> 2 rows failed validation and were written to quarantine
+    >>> pl.read_parquet(directory / "quarantine.parquet")
+    shape: (2, 3)
+    ┌──────┬────────────┬────────────────────┐
+    │ a    ┆ violations ┆ reasons            │
+    │ ---  ┆ ---        ┆ ---                │
+    │ i64  ┆ u64        ┆ list[str]          │
+    ╞══════╪════════════╪════════════════════╡
+    │ 5    ┆ 1          ┆ ["accepted_range"] │
+    │ null ┆ 2          ┆ ["has_no_nulls"]   │
+    └──────┴────────────┴────────────────────┘
+    """
+    # Cached so that both sinks share the scan, polars 1 not finding it on its own
+    flagged = data.lazy().with_columns(_violation_bits(rules).alias(name)).cache()
+    valid_rows = flagged.filter(pl.col(name) == 0).drop(name)
+    invalid_rows = flagged.filter(pl.col(name) != 0).with_columns(
+        _violation_reasons(rules, name).alias("reasons")
+    )
+
+    if _HAS_LAZY_SINKS:
+        pl.collect_all(
+            [
+                valid_rows.sink_parquet(path, lazy=True),
+                invalid_rows.sink_parquet(quarantine_path, lazy=True),
+            ]
+        )
+    else:
+        _sink_parquet(valid_rows, path)
+        _sink_parquet(invalid_rows, quarantine_path)
+
+    # The quarantine file is usually small, counting violations from it is cheap
+    n_invalid_rows, *n_violations = (
+        pl.scan_parquet(quarantine_path)
+        .select(
+            pl.len(),
+            *(
+                (pl.col(name) & (1 << position) != 0).sum().alias(str(position))
+                for position in range(len(rules))
+            ),
+        )
+        .collect()
+        .row(0)
+    )
+    report = pl.DataFrame(
+        {
+            "rule": [_check_name(rule) for rule in rules],
+            "n_violations": n_violations,
+        },
+        schema={"rule": pl.String, "n_violations": pl.UInt32},
+    )
+
+    if raise_on_failure and n_invalid_rows > 0:
+        raise PolarsAssertError(
+            df=report,
+            supp_message=(
+                f"{n_invalid_rows} rows failed validation and were written to "
+                + "quarantine"
+            ),
+        )
+    return report
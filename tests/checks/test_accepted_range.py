@@ -47,3 +47,19 @@ def test_accepted_range_errors_on_two_different_ranges(
 
     expected = pl.DataFrame({"a": [1, 3], "b": [1, 3]})
     testing.assert_frame_equal(err.value.df, expected)
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_accepted_range_on_sample_estimates_violation_rate(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame({"a": list(range(10_000))})
+    with pytest.raises(plg.PolarsAssertError) as err:
+        given_df.pipe(plg.accepted_range, {"a": (0, 8999)}, sample=0.1)
+
+    assert "Estimated violation rate" in str(err.value)
+    assert err.value.df.get_column("a").min() >= 9000
+    assert 50 < err.value.df.height < 150
+
+    when = given_df.pipe(plg.accepted_range, {"a": (0, 10_000)}, sample=0.1)
+    testing.assert_frame_equal(given_df, when)
@@ -42,3 +42,18 @@ def test_accepted_values_should_error_on_out_of_range_values(
 
     expected = pl.DataFrame({"a": [3]})
     testing.assert_frame_equal(err.value.df, expected)
+
+
+def test_accepted_values_on_stratified_sample_checks_every_group():
+    given_df = pl.DataFrame(
+        {"a": ["x"] * 999 + ["forbidden"], "group": ["g1"] * 999 + ["g2"]}
+    )
+    # A plain 1% sample would most likely miss the single row of group g2
+    with pytest.raises(plg.PolarsAssertError) as err:
+        given_df.pipe(
+            plg.accepted_values, {"a": ["x"]}, sample=0.01, stratify_by="group"
+        )
+    testing.assert_frame_equal(
+        err.value.df, pl.DataFrame({"a": ["forbidden"], "group": ["g2"]})
+    )
+    assert "Estimated violation rate: 0.10%" in str(err.value)
@@ -0,0 +1,56 @@
+import polars as pl
+import pytest
+from polars import testing
+
+import pelage as plg
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_column_is_within_iqr_accepts_tuple_args(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame({"a": [1, 2, 2, 1], "b": [1.0, 2.0, 3.0, 4.0]})
+    when = given_df.pipe(plg.column_is_within_iqr, ("a", 1.5), ("b", 1.5))
+    testing.assert_frame_equal(given_df, when)
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_column_is_within_iqr_shoud_error_on_outliers(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame({"a": list(range(0, 10)) + [50], "b": list(range(0, 11))})
+
+    with pytest.raises(plg.PolarsAssertError) as err:
+        given_df.pipe(plg.column_is_within_iqr, ("a", 1.5), ("b", 1.5))
+    testing.assert_frame_equal(err.value.df, pl.DataFrame({"a": [50]}))
+
+
+def test_column_is_within_iqr_is_robust_to_the_outliers_themselves():
+    # A single huge outlier inflates the std enough to hide itself
+    given_df = pl.DataFrame({"a": [10, 11, 12, 10, 11, 12, 10, 11, 12, 10_000]})
+    given_df.pipe(plg.column_is_within_n_std, ("a", 3))
+
+    with pytest.raises(plg.PolarsAssertError):
+        given_df.pipe(plg.column_is_within_iqr, ("a", 3))
+
+
+def test_column_is_within_iqr_accepts_precomputed_sketches():
+    reference = pl.DataFrame({"a": list(range(0, 100))})
+    batches = [reference.slice(0, 50), reference.slice(50)]
+    sketch = plg.QuantileSketch.from_data(batches[0], "a").merge(
+        plg.QuantileSketch.from_data(batches[1], "a")
+    )
+
+    # Within the fences of the whole data, but not of the batch itself
+    given_df = pl.DataFrame({"a": [0, 1, 1, 1, 1, 99]})
+    when = given_df.pipe(plg.column_is_within_iqr, ("a", 1.5), sketches={"a": sketch})
+    testing.assert_frame_equal(given_df, when)
+
+    with pytest.raises(plg.PolarsAssertError):
+        given_df.pipe(plg.column_is_within_iqr, ("a", 1.5))
+
+
+def test_column_is_within_iqr_should_ignore_empty_columns():
+    given_df = pl.DataFrame({"a": [None, None]}, schema={"a": pl.Float64})
+    when = given_df.pipe(plg.column_is_within_iqr, ("a", 1.5))
+    testing.assert_frame_equal(given_df, when)
@@ -43,3 +43,130 @@ def test_column_is_within_n_std_accepts_list_of_tuple_args(
 
     with pytest.raises(plg.PolarsAssertError):
         given_df.pipe(plg.column_is_within_n_std, ("b", 2), ("c", 2))
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_column_is_within_n_std_should_ignore_columns_without_statistics(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame({"a": [None, None]}, schema={"a": pl.Int64})
+    when = given_df.pipe(plg.column_is_within_n_std, ("a", 2))
+    testing.assert_frame_equal(given_df, when)
+
+
+def test_column_is_within_n_std_should_save_and_load_baseline(tmp_path):
+    baseline_path = tmp_path / "baseline.parquet"
+    reference_df = pl.DataFrame({"a": [1, 2, 2, 1], "b": [0.5, 0.5, 1.5, 1.5]})
+    reference_df.pipe(
+        plg.column_is_within_n_std, ("a", 2), ("b", 2), save_baseline=baseline_path
+    )
+
+    expected_baseline = pl.DataFrame(
+        {"column": ["a", "b"], "mean": [1.5, 1.0], "std": [0.57735, 0.57735]}
+    )
+    given_baseline = pl.read_parquet(baseline_path).with_columns(pl.col("std").round(5))
+    testing.assert_frame_equal(given_baseline, expected_baseline)
+
+    new_batch = pl.LazyFrame({"a": [1, 3, 3, 3], "b": [1.0, 1.0, 1.0, 1.0]})
+    when = new_batch.pipe(
+        plg.column_is_within_n_std, ("b", 2), load_baseline=baseline_path
+    )
+    testing.assert_frame_equal(new_batch, when)
+
+    with pytest.raises(plg.PolarsAssertError) as err:
+        new_batch.pipe(
+            plg.column_is_within_n_std, ("a", 2), load_baseline=baseline_path
+        )
+    testing.assert_frame_equal(err.value.df, pl.DataFrame({"a": [3, 3, 3]}))
+
+
+def test_column_is_within_n_std_computes_columns_missing_from_baseline(tmp_path):
+    baseline_path = tmp_path / "baseline.parquet"
+    pl.DataFrame({"column": ["a"], "mean": [0.0], "std": [1.0]}).write_parquet(
+        baseline_path
+    )
+    given_df = pl.DataFrame({"a": [1, 0, -1], "b": [100, 101, 102]})
+
+    when = given_df.pipe(
+        plg.column_is_within_n_std, ("a", 2), ("b", 2), load_baseline=baseline_path
+    )
+    testing.assert_frame_equal(given_df, when)
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_column_is_within_n_std_accepts_group_by(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame(
+        {
+            "a": [1, 2, 1, 2, 1000, 1001, 1000, 1001],
+            "group": ["A", "A", "A", "A", "B", "B", "B", "B"],
+        }
+    )
+    when = given_df.pipe(plg.column_is_within_n_std, ("a", 2), group_by="group")
+    testing.assert_frame_equal(given_df, when)
+
+    # Without groups, the two populations are far from the global mean
+    with pytest.raises(plg.PolarsAssertError):
+        given_df.pipe(plg.column_is_within_n_std, ("a", 0.5))
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_column_is_within_n_std_skips_group_columns_matched_by_selectors(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame(
+        {
+            "a": [1, 2, 1, 2, 1000, 1001, 1000, 1001],
+            "g": [1, 1, 1, 1, 2, 2, 2, 2],
+        }
+    )
+    when = given_df.pipe(plg.column_is_within_n_std, (pl.Int64, 1.5), group_by="g")
+    testing.assert_frame_equal(given_df, when)
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_column_is_within_n_std_should_error_on_outliers_per_group(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame(
+        {
+            "a": list(range(10)) + [5000] + list(range(10)),
+            "group": ["A"] * 11 + ["B"] * 10,
+            "sub_group": [1] * 21,
+        }
+    )
+    with pytest.raises(plg.PolarsAssertError) as err:
+        given_df.pipe(
+            plg.column_is_within_n_std, ("a", 2), group_by=["group", "sub_group"]
+        )
+
+    expected = pl.DataFrame({"group": ["A"], "sub_group": [1], "a": [5000]})
+    testing.assert_frame_equal(err.value.df, expected)
+
+
+def test_column_is_within_n_std_should_save_and_load_grouped_baseline(tmp_path):
+    baseline_path = tmp_path / "baseline.parquet"
+    reference_df = pl.DataFrame(
+        {"a": [1, 2, 1, 2, 10, 20, 10, 20], "group": ["A"] * 4 + ["B"] * 4}
+    )
+    reference_df.pipe(
+        plg.column_is_within_n_std,
+        ("a", 2),
+        group_by="group",
+        save_baseline=baseline_path,
+    )
+    assert pl.read_parquet(baseline_path).columns == ["group", "column", "mean", "std"]
+
+    new_batch = pl.DataFrame({"a": [15, 15, 1], "group": ["B", "A", "C"]})
+    with pytest.raises(plg.PolarsAssertError) as err:
+        new_batch.pipe(
+            plg.column_is_within_n_std,
+            ("a", 2),
+            group_by="group",
+            load_baseline=baseline_path,
+        )
+
+    # Group C is absent from the baseline, it is not checked
+    expected = pl.DataFrame({"group": ["A"], "a": [15]})
+    testing.assert_frame_equal(err.value.df, expected)
@@ -47,3 +47,13 @@ def test_custom_checks_should_select_only_affected_columns(
         given_df.pipe(plg.custom_check, pl.col("b").max().over("a") <= 3)
 
     assert {"a", "b"} == set(err.value.df.columns)
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_custom_check_accepts_sample(frame: type[pl.DataFrame | pl.LazyFrame]):
+    given_df = frame({"a": list(range(1000))})
+    when = given_df.pipe(plg.custom_check, pl.col("a") < 1000, sample=0.2)
+    testing.assert_frame_equal(given_df, when)
+
+    with pytest.raises(plg.PolarsAssertError):
+        given_df.pipe(plg.custom_check, pl.col("a") < 0, sample=0.2)
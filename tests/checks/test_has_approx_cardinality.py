@@ -0,0 +1,34 @@
+import polars as pl
+import pytest
+from polars import testing
+
+import pelage as plg
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_has_approx_cardinality(frame: type[pl.DataFrame | pl.LazyFrame]):
+    given_df = frame({"a": list(range(1000)), "b": ["x", "y"] * 500})
+    when = given_df.pipe(plg.has_approx_cardinality, {"a": (900, 1100), "b": (None, 2)})
+    testing.assert_frame_equal(given_df, when)
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_has_approx_cardinality_should_error_beyond_bounds(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame({"a": list(range(1000)), "b": ["x", "y"] * 500})
+    with pytest.raises(plg.PolarsAssertError) as err:
+        given_df.pipe(plg.has_approx_cardinality, {"a": (2000, None), "b": (None, 1)})
+    assert err.value.df.get_column("column").sort().to_list() == ["a", "b"]
+
+
+def test_has_approx_cardinality_counts_null_as_a_value():
+    given_df = pl.DataFrame({"a": [1, None]})
+    when = given_df.pipe(plg.has_approx_cardinality, {"a": (2, 2)})
+    testing.assert_frame_equal(given_df, when)
+
+
+def test_has_approx_cardinality_should_error_without_bounds():
+    given_df = pl.DataFrame({"a": [1, 2]})
+    with pytest.raises(ValueError):
+        given_df.pipe(plg.has_approx_cardinality, {"a": (None, None)})
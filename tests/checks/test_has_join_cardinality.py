@@ -0,0 +1,78 @@
+import polars as pl
+import pytest
+from polars import testing
+
+import pelage as plg
+
+
+@pytest.mark.parametrize(
+    "first_frame,second_frame",
+    [
+        (pl.DataFrame, pl.DataFrame),
+        (pl.LazyFrame, pl.LazyFrame),
+        (pl.DataFrame, pl.LazyFrame),
+        (pl.LazyFrame, pl.DataFrame),
+    ],
+)
+def test_has_join_cardinality_many_to_one(
+    first_frame: type[pl.DataFrame | pl.LazyFrame],
+    second_frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = first_frame({"key": [1, 1, 2]})
+    other_df = second_frame({"key": [1, 2, 3]})
+    when = given_df.pipe(plg.has_join_cardinality, other_df, "key", "m:1")
+    testing.assert_frame_equal(given_df, when)
+
+
+@pytest.mark.parametrize(
+    "relationship,should_fail",
+    [("1:1", True), ("1:m", False), ("m:1", True)],
+)
+def test_has_join_cardinality_respects_relationship_sides(
+    relationship: str, should_fail: bool
+):
+    given_df = pl.DataFrame({"key": [1, 2]})
+    other_df = pl.DataFrame({"key": [1, 1, 2]})
+    if should_fail:
+        with pytest.raises(plg.PolarsAssertError):
+            given_df.pipe(plg.has_join_cardinality, other_df, "key", relationship)
+    else:
+        when = given_df.pipe(plg.has_join_cardinality, other_df, "key", relationship)
+        testing.assert_frame_equal(given_df, when)
+
+
+def test_has_join_cardinality_accepts_multiple_keys():
+    given_df = pl.DataFrame({"a": [1, 1], "b": ["x", "y"]})
+    other_df = pl.DataFrame({"a": [1, 1], "b": ["x", "y"]})
+    when = given_df.pipe(plg.has_join_cardinality, other_df, ["a", "b"], "1:1")
+    testing.assert_frame_equal(given_df, when)
+
+
+def test_has_join_cardinality_ignores_null_keys():
+    given_df = pl.DataFrame({"key": [1, None, None]})
+    other_df = pl.DataFrame({"key": [1, None]})
+    when = given_df.pipe(plg.has_join_cardinality, other_df, "key", "1:1")
+    testing.assert_frame_equal(given_df, when)
+
+
+def test_has_join_cardinality_reports_worst_keys_and_estimate():
+    given_df = pl.LazyFrame({"key": [1, 1, 1, 2, 2, 3]})
+    other_df = pl.LazyFrame({"key": [1, 1, 2, 2, 2, 4]})
+
+    with pytest.raises(plg.PolarsAssertError) as err:
+        given_df.pipe(plg.has_join_cardinality, other_df, "key", top_n=1)
+
+    expected = pl.DataFrame(
+        {"key": [1], "left_count": [3], "right_count": [2], "fan_out": [6]}
+    )
+    testing.assert_frame_equal(err.value.df, expected, check_dtypes=False)
+    assert "maximum fan-out: 6" in str(err.value)
+    assert "Estimated inner join size: 12 rows" in str(err.value)
+
+
+def test_has_join_cardinality_should_error_on_unknown_relationship():
+    given_df = pl.DataFrame({"key": [1]})
+    with pytest.raises(ValueError):
+        given_df.pipe(plg.has_join_cardinality, given_df, "key", "n:1")
+    with pytest.raises(ValueError):
+        given_df.pipe(plg.has_join_cardinality, given_df, "key", "m:m")
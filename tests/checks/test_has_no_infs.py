@@ -29,3 +29,10 @@ def test_has_no_infs_throws_error_on_inf_values(
         given_df.pipe(plg.has_no_infs)
     expected = pl.DataFrame({"a": [float("inf")]})
     testing.assert_frame_equal(err.value.df, expected)
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_has_no_infs_accepts_sample(frame: type[pl.DataFrame | pl.LazyFrame]):
+    given_df = frame({"a": [1.0, float("inf")] * 500})
+    with pytest.raises(plg.PolarsAssertError):
+        given_df.pipe(plg.has_no_infs, sample=0.1)
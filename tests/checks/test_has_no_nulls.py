@@ -39,3 +39,14 @@ def test_has_no_nulls_indicates_columns_with_nulls_in_error_message(
     with pytest.raises(plg.PolarsAssertError) as err:
         given_df.pipe(plg.has_no_nulls)
     testing.assert_frame_equal(err.value.df, expected)
+
+
+def test_has_no_nulls_on_sample_reports_sampled_rows():
+    given_df = pl.DataFrame({"a": [None] * 1000, "b": list(range(1000))})
+    with pytest.raises(plg.PolarsAssertError) as err:
+        given_df.pipe(plg.has_no_nulls, sample=0.05)
+    assert "Estimated violation rate: 100.00%" in str(err.value)
+    assert err.value.df.columns == ["a", "b"]
+
+    when = given_df.pipe(plg.has_no_nulls, "b", sample=0.05)
+    testing.assert_frame_equal(given_df, when)
@@ -0,0 +1,123 @@
+import polars as pl
+import pytest
+from polars import testing
+
+import pelage as plg
+
+
+@pytest.mark.parametrize(
+    "fact_frame,dim_frame",
+    [
+        (pl.DataFrame, pl.DataFrame),
+        (pl.LazyFrame, pl.LazyFrame),
+        (pl.DataFrame, pl.LazyFrame),
+        (pl.LazyFrame, pl.DataFrame),
+    ],
+)
+def test_has_valid_foreign_keys(
+    fact_frame: type[pl.DataFrame | pl.LazyFrame],
+    dim_frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = fact_frame({"store": [1, 2, 2], "product": ["a", "b", "a"]})
+    stores = dim_frame({"store": [1, 2, 3]})
+    products = dim_frame({"product": ["a", "b"]})
+
+    when = given_df.pipe(
+        plg.has_valid_foreign_keys, {"store": stores, "product": products}
+    )
+    testing.assert_frame_equal(given_df, when)
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_has_valid_foreign_keys_should_ignore_null_keys(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame({"store": [1, None]})
+    when = given_df.pipe(
+        plg.has_valid_foreign_keys, {"store": pl.DataFrame({"store": [1]})}
+    )
+    testing.assert_frame_equal(given_df, when)
+
+
+def test_has_valid_foreign_keys_accepts_renamed_reference_column():
+    given_df = pl.DataFrame({"store": [1, 2]})
+    stores = pl.DataFrame({"id": [1, 2]})
+    when = given_df.pipe(plg.has_valid_foreign_keys, {"store": (stores, "id")})
+    testing.assert_frame_equal(given_df, when)
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_has_valid_foreign_keys_should_report_orphans_per_key(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame({"store": [1, 4, 4, 5], "product": ["a", "b", "a", "a"]})
+    references = {
+        "store": pl.DataFrame({"store": [1, 2]}),
+        "product": pl.DataFrame({"product": ["a", "b"]}),
+    }
+
+    with pytest.raises(plg.PolarsAssertError) as err:
+        given_df.pipe(plg.has_valid_foreign_keys, references)
+
+    expected = pl.DataFrame(
+        {"column": ["store"], "orphan_count": [3], "orphan_sample": [["4", "5"]]}
+    )
+    testing.assert_frame_equal(err.value.df, expected, check_dtypes=False)
+    assert "['store']" in str(err.value)
+
+
+def test_has_valid_foreign_keys_should_limit_orphan_sample_size():
+    given_df = pl.DataFrame({"store": [3, 4, 5, 6]})
+    references = {"store": pl.DataFrame({"store": [1, 2]})}
+
+    with pytest.raises(plg.PolarsAssertError) as err:
+        given_df.pipe(plg.has_valid_foreign_keys, references, sample_size=2)
+
+    assert err.value.df.get_column("orphan_count").item() == 4
+    assert err.value.df.get_column("orphan_sample").item().to_list() == ["3", "4"]
+
+
+def test_has_valid_foreign_keys_should_scan_the_fact_table_once():
+    plugins = pytest.importorskip("polars.io.plugins")
+    facts = pl.DataFrame({"store": [1, 2], "product": ["a", "b"], "price": [1, 2]})
+    scans = []
+
+    def scan_facts(with_columns, *_):
+        scans.append(with_columns)
+        yield facts if with_columns is None else facts.select(with_columns)
+
+    given_df = plugins.register_io_source(scan_facts, schema=facts.schema)
+    with pytest.raises(plg.PolarsAssertError):
+        given_df.pipe(
+            plg.has_valid_foreign_keys,
+            {
+                "store": pl.DataFrame({"store": [1, 2]}),
+                "product": pl.DataFrame({"product": ["a"]}),
+            },
+        )
+    assert len(scans) == 1
+
+
+def test_has_valid_foreign_keys_accepts_no_references():
+    given_df = pl.DataFrame({"store": [1, 2]})
+    when = given_df.pipe(plg.has_valid_foreign_keys, {})
+    testing.assert_frame_equal(given_df, when)
+
+
+def test_has_valid_foreign_keys_should_count_rows_of_orphan_keys():
+    given_df = pl.DataFrame(
+        {"store": [None, None], "product": ["c", "c"]},
+        schema={"store": pl.Int64, "product": pl.String},
+    )
+    references = {
+        "store": pl.DataFrame({"store": [1]}),
+        "product": pl.DataFrame({"product": ["a"]}),
+    }
+
+    with pytest.raises(plg.PolarsAssertError) as err:
+        given_df.pipe(plg.has_valid_foreign_keys, references)
+
+    expected = pl.DataFrame(
+        {"column": ["product"], "orphan_count": [2], "orphan_sample": [["c"]]}
+    )
+    testing.assert_frame_equal(err.value.df, expected, check_dtypes=False)
@@ -35,6 +35,16 @@ def test_not_null_proportion_accept_group_by_option():
     testing.assert_frame_equal(given_df, when)
 
 
+def test_not_null_proportion_accept_group_by_expression():
+    given_df = pl.DataFrame({"a": [1, None, None, 1], "group": ["A", "A", "B", "B"]})
+    when = given_df.pipe(plg.not_null_proportion, {"a": 0.5}, group_by=pl.col("group"))
+    testing.assert_frame_equal(given_df, when)
+
+    with pytest.raises(plg.PolarsAssertError) as error:
+        given_df.pipe(plg.not_null_proportion, {"a": 1}, group_by=pl.col("group"))
+    assert error.value.df.columns[0] == "group"
+
+
 @pytest.mark.parametrize(
     "given_df",
     [
@@ -42,3 +42,26 @@ def test_unique_should_should_throw_error_on_duplicated_values_per_group():
     given_df = pl.DataFrame({"a": [1, 1], "group": ["g1", "g1"]})
     with pytest.raises(plg.PolarsAssertError):
         given_df.pipe(plg.unique, ["a"], group_by="group")
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_unique_with_approx_precheck_should_fail_fast_on_duplicates(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame({"a": [1, 1, 2, 2], "b": [1, 2, 3, 4]})
+    with pytest.raises(plg.PolarsAssertError) as err:
+        given_df.pipe(plg.unique, approx_precheck=True)
+    assert "estimated with approx_n_unique" in str(err.value)
+    assert err.value.df.get_column("column").to_list() == ["a"]
+
+
+def test_unique_with_approx_precheck_should_run_exact_check_otherwise():
+    given_df = pl.DataFrame({"a": list(range(1000))})
+    when = given_df.pipe(plg.unique, "a", approx_precheck=True)
+    testing.assert_frame_equal(given_df, when)
+
+    # A single duplicate is within the estimation error, found by the exact check
+    given_df = pl.DataFrame({"a": [*range(1000), 0]})
+    with pytest.raises(plg.PolarsAssertError) as err:
+        given_df.pipe(plg.unique, "a", approx_precheck=True)
+    testing.assert_frame_equal(err.value.df, pl.DataFrame({"a": [0, 0]}))
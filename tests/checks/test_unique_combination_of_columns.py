@@ -71,3 +71,22 @@ def test_unique_combination_of_columns_error_message_format(
     base_message = "Some combinations of columns are not unique."
 
     assert base_message in str(err.value)
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_unique_combination_of_columns_approx_precheck_should_fail_fast(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame({"a": ["x", "x", "y", "y"], "b": [1, 1, 2, 2]})
+    with pytest.raises(plg.PolarsAssertError) as err:
+        given_df.pipe(plg.unique_combination_of_columns, ["a", "b"], True)
+    assert "estimated with approx_n_unique" in str(err.value)
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_unique_combination_of_columns_approx_precheck_should_pass_unique_rows(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame({"a": ["x", "x", "y", "y"], "b": [1, 2, 1, 2]})
+    when = given_df.pipe(plg.unique_combination_of_columns, approx_precheck=True)
+    testing.assert_frame_equal(given_df, when)
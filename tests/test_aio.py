@@ -0,0 +1,63 @@
+import asyncio
+import inspect
+import os
+import time
+
+import polars as pl
+import pytest
+
+import pelage as plg
+from pelage import aio
+
+
+def test_every_check_has_an_async_version():
+    check_modules = {
+        file.removesuffix(".py")
+        for file in os.listdir(
+            os.path.dirname(inspect.getfile(inspect.unwrap(plg.unique)))
+        )
+        if file.endswith(".py") and file != "__init__.py"
+    }
+    for name in check_modules:
+        assert inspect.iscoroutinefunction(getattr(aio, name))
+        assert f"await aio.{name}(df, " in getattr(aio, name).__doc__
+
+
+def test_async_check_returns_the_data():
+    df = pl.DataFrame({"a": [1, 2]})
+    assert asyncio.run(aio.unique(df, "a")) is df
+
+
+def test_async_check_raises_the_error_of_the_check():
+    with pytest.raises(plg.PolarsAssertError):
+        asyncio.run(aio.has_no_nulls(pl.LazyFrame({"a": [None]})))
+
+
+def test_async_checks_run_concurrently():
+    async def main() -> list:
+        return await asyncio.gather(
+            *(
+                aio.accepted_range(pl.DataFrame({"a": [i]}), {"a": (0, 10)})
+                for i in range(5)
+            )
+        )
+
+    assert [df.item() for df in asyncio.run(main())] == list(range(5))
+
+
+def test_cancelling_the_task_cancels_the_query():
+    given_df = pl.LazyFrame({"a": range(3_000_000)})
+    for _ in range(30):
+        given_df = given_df.sort("a").with_columns(pl.col("a").shuffle(seed=1))
+
+    async def main() -> None:
+        task = asyncio.create_task(aio.custom_check(given_df, pl.col("a") >= 0))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    # The query takes seconds, the event loop waits for its worker thread on closing
+    start = time.monotonic()
+    asyncio.run(main())
+    assert time.monotonic() - start < 1.5
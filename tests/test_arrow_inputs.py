@@ -0,0 +1,89 @@
+import importlib.util
+import inspect
+from functools import partial
+
+import polars as pl
+import pytest
+
+import pelage as plg
+from pelage.utils import _has_sufficient_polars_version
+
+# Polars < 1.3 neither exports nor imports the PyCapsule interface, pyarrow does
+requires_capsules = pytest.mark.skipif(
+    not _has_sufficient_polars_version("1.3.0")
+    and importlib.util.find_spec("pyarrow") is None,
+    reason="requires polars >= 1.3.0 or pyarrow",
+)
+
+
+class ArrowStream:
+    """Minimal third-party object only exposing the Arrow PyCapsule interface"""
+
+    def __init__(self, df: pl.DataFrame) -> None:
+        self.df = df
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        if not hasattr(self.df, "__arrow_c_stream__"):
+            return self.df.to_arrow().__arrow_c_stream__(requested_schema)
+        return self.df.__arrow_c_stream__(requested_schema)
+
+
+@requires_capsules
+def test_checks_return_the_original_object():
+    data = ArrowStream(pl.DataFrame({"a": [1, 2, 3]}))
+
+    assert plg.unique(data, "a") is data
+    assert plg.has_columns(data, "a") is data
+
+
+@requires_capsules
+def test_checks_fail_on_arrow_objects():
+    data = ArrowStream(pl.DataFrame({"a": [1, 1, 3]}))
+
+    with pytest.raises(plg.PolarsAssertError):
+        plg.unique(data, "a")
+
+
+def test_polars_frames_are_returned_unchanged():
+    df = pl.DataFrame({"a": [1, 2]})
+
+    assert plg.has_no_nulls(df) is df
+    assert isinstance(plg.has_no_nulls(df.lazy()), pl.LazyFrame)
+
+
+def test_checks_keep_their_signature():
+    parameters = inspect.signature(plg.has_shape).parameters
+    assert list(parameters) == ["data", "shape", "group_by"]
+    assert plg.has_shape.__name__ == "has_shape"
+
+
+@requires_capsules
+def test_run_checks_accepts_arrow_objects():
+    data = ArrowStream(pl.DataFrame({"a": [1, 1]}))
+
+    results = plg.run_checks(
+        data,
+        [partial(plg.unique, columns="a"), partial(plg.has_no_nulls)],
+    )
+
+    assert [result.status for result in results] == ["failed", "passed"]
+
+
+def test_checks_accept_pandas_frames():
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    data = pd.DataFrame({"a": [1, 2, None]})
+
+    assert plg.has_columns(data, "a") is data
+    with pytest.raises(plg.PolarsAssertError):
+        plg.has_no_nulls(data)
+
+
+def test_checks_scan_pyarrow_datasets(tmp_path):
+    ds = pytest.importorskip("pyarrow.dataset")
+    pl.DataFrame({"a": [1, 2, 2]}).write_parquet(tmp_path / "data.parquet")
+    data = ds.dataset(tmp_path / "data.parquet")
+
+    assert plg.has_shape(data, (3, 1)) is data
+    with pytest.raises(plg.PolarsAssertError):
+        plg.unique(data, "a")
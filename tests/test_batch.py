@@ -0,0 +1,130 @@
+from functools import partial
+
+import polars as pl
+import pytest
+
+import pelage as plg
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_validate_many_returns_results_per_frame(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    frames = [frame({"a": [i, i + (i % 2)]}) for i in range(20)]
+    checks = [partial(plg.unique, columns="a"), partial(plg.has_no_nulls)]
+
+    results = plg.validate_many(frames, checks, max_workers=4)
+
+    assert list(results) == list(range(20))
+    assert [results[i][0].status for i in range(4)] == [
+        "failed",
+        "passed",
+        "failed",
+        "passed",
+    ]
+    assert all(result[1].status == "passed" for result in results.values())
+
+
+def test_validate_many_keeps_frame_identifiers():
+    frames = {"x": pl.DataFrame({"a": [None]}), "y": pl.DataFrame({"a": [1]})}
+    results = plg.validate_many(
+        frames,
+        [partial(plg.has_no_nulls), partial(plg.unique, columns="a")],
+        fail_fast=True,
+    )
+    assert [result.status for result in results["x"]] == ["failed", "skipped"]
+    assert [result.status for result in results["y"]] == ["passed", "passed"]
+
+
+def test_validate_concatenated_maps_failures_back_to_frames():
+    frames = {
+        "x": pl.DataFrame({"a": [1, 2], "b": [1.0, 2.0]}),
+        "y": pl.DataFrame({"a": [1, 1], "b": [1.0, None]}),
+        "z": pl.DataFrame({"a": [3, 4], "b": [5.0, 1.0]}),
+    }
+    checks = [
+        partial(plg.unique, columns="a"),
+        partial(plg.has_no_nulls),
+        partial(plg.accepted_range, items={"b": (0, 3)}),
+        partial(plg.has_shape, shape=(2, None)),
+        partial(plg.has_columns, names=["a", "b"]),
+        partial(plg.is_monotonic, column="b"),
+    ]
+
+    results = plg.validate_concatenated(frames, checks)
+
+    statuses = {key: [r.status for r in res] for key, res in results.items()}
+    assert statuses == {
+        "x": ["passed", "passed", "passed", "passed", "passed", "passed"],
+        "y": ["failed", "failed", "passed", "passed", "passed", "passed"],
+        "z": ["passed", "passed", "failed", "passed", "passed", "failed"],
+    }
+    assert results["z"][2].error.df.equals(  # type: ignore
+        pl.DataFrame({"a": [3], "b": [5.0]})
+    )
+    assert "source_id" not in results["y"][0].error.df.columns  # type: ignore
+
+
+def test_validate_concatenated_matches_frame_by_frame_results():
+    frames = [pl.DataFrame({"a": [i % 3, i % 5, 1]}) for i in range(50)]
+    checks = [
+        partial(plg.unique, columns="a"),
+        partial(plg.not_constant, columns="a"),
+        partial(plg.accepted_values, items={"a": [0, 1, 2]}),
+        partial(
+            plg.maintains_relationships,
+            other_df=pl.DataFrame({"a": [0, 1]}),
+            column="a",
+        ),
+    ]
+
+    concatenated = plg.validate_concatenated(frames, checks)
+    one_by_one = plg.validate_many(frames, checks)
+
+    for key, results in one_by_one.items():
+        assert [r.status for r in concatenated[key]] == [r.status for r in results]
+
+
+def test_validate_concatenated_excludes_source_column_by_default():
+    frames = [
+        pl.DataFrame({"a": [1, 2], "b": [1, 2]}),
+        pl.DataFrame({"a": [1, 2], "b": [3, 3]}),
+        pl.DataFrame({"a": [None, None], "b": [4, 5]}),
+    ]
+    checks = [
+        partial(plg.unique),
+        partial(plg.not_constant),
+        partial(plg.at_least_one),
+        partial(plg.unique, group_by="b"),
+    ]
+
+    concatenated = plg.validate_concatenated(frames, checks)
+    one_by_one = plg.validate_many(frames, checks)
+
+    for key, results in one_by_one.items():
+        assert [r.status for r in concatenated[key]] == [r.status for r in results]
+
+
+def test_validate_concatenated_matches_frame_by_frame_shapes():
+    schema = {"a": pl.Int64, "b": pl.Int64}
+    frames = [
+        pl.DataFrame({"a": [1, 2], "b": [3, 4]}),
+        pl.DataFrame({"a": [1, None, 3], "b": [3, 4, 5]}),
+        pl.DataFrame(schema=schema),
+        pl.DataFrame({"a": [None, None], "b": [4, 5]}, schema=schema),
+    ]
+    checks = [
+        partial(plg.has_shape, shape=(None, 2)),
+        partial(plg.has_shape, shape=(2, 2)),
+        partial(plg.has_shape, shape=(2, None)),
+        partial(plg.has_shape, shape=(3, 1)),
+        partial(plg.has_shape, shape=(1, None), group_by="b"),
+        partial(plg.at_least_one),
+        partial(plg.not_constant, columns="b"),
+    ]
+
+    concatenated = plg.validate_concatenated(frames, checks)
+    one_by_one = plg.validate_many(frames, checks)
+
+    for key, results in one_by_one.items():
+        assert [r.status for r in concatenated[key]] == [r.status for r in results]
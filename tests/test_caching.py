@@ -0,0 +1,164 @@
+import polars as pl
+import pytest
+
+import pelage as plg
+
+
+def _counting_plan(calls: list) -> pl.LazyFrame:
+    def count_call(series: pl.Series) -> pl.Series:
+        calls.append(1)
+        return series
+
+    return pl.LazyFrame({"a": [1, 2, 3]}).with_columns(
+        pl.col("a").map_batches(count_call, return_dtype=pl.Int64)
+    )
+
+
+def test_materialize_runs_upstream_plan_once():
+    calls: list = []
+    result = (
+        _counting_plan(calls)
+        .pipe(plg.materialize)
+        .pipe(plg.has_no_nulls)
+        .pipe(plg.unique, "a")
+        .collect()
+    )
+    assert len(calls) == 1
+    assert result.equals(pl.DataFrame({"a": [1, 2, 3]}))
+
+
+def test_materialize_moves_results_above_size_limit_to_disk(tmp_path):
+    calls: list = []
+    materialized = _counting_plan(calls).pipe(
+        plg.materialize, max_bytes=1, directory=tmp_path
+    )
+    result = materialized.pipe(plg.has_no_nulls).pipe(plg.unique, "a").collect()
+    assert len(calls) == 1
+    assert result.equals(pl.DataFrame({"a": [1, 2, 3]}))
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # The file lives as long as the frame scanning it
+    del materialized
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_materialize_returns_dataframes_unchanged():
+    df = pl.DataFrame({"a": [1]})
+    assert plg.materialize(df) is df
+
+
+def test_spill_runs_upstream_plan_once_and_cleans_up(tmp_path):
+    calls: list = []
+    with plg.spill(_counting_plan(calls), directory=tmp_path) as spilled:
+        result = spilled.pipe(plg.has_no_nulls).pipe(plg.unique, "a").collect()
+        assert len(list(tmp_path.iterdir())) == 1
+
+    assert len(calls) == 1
+    assert result.equals(pl.DataFrame({"a": [1, 2, 3]}))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spill_warns_when_collecting_in_memory(tmp_path, monkeypatch):
+    sink_ipc = pl.LazyFrame.sink_ipc
+    sinks: list = []
+
+    # Only the first sink fails, DataFrame.write_ipc may sink a LazyFrame itself
+    def unsupported_sink(*args, **kwargs):
+        sinks.append(1)
+        if len(sinks) == 1:
+            raise pl.exceptions.InvalidOperationError("not supported")
+        return sink_ipc(*args, **kwargs)
+
+    monkeypatch.setattr(pl.LazyFrame, "sink_ipc", unsupported_sink)
+    with (
+        pytest.warns(UserWarning, match="collected in memory"),
+        plg.spill(pl.LazyFrame({"a": [1, 2]}), directory=tmp_path) as spilled,
+    ):
+        assert spilled.collect().equals(pl.DataFrame({"a": [1, 2]}))
+
+
+def test_fingerprint_depends_on_the_content():
+    df = pl.DataFrame({"a": [1, 2, None], "b": ["x", "y", "z"]})
+
+    assert plg.fingerprint(df) == plg.fingerprint(df.clone())
+    assert plg.fingerprint(df) == plg.fingerprint(df.lazy())
+    assert plg.fingerprint(df) != plg.fingerprint(df.reverse())
+    assert plg.fingerprint(df) != plg.fingerprint(df.head(2))
+    assert plg.fingerprint(df) != plg.fingerprint(df.rename({"b": "c"}))
+    assert plg.fingerprint(df) != plg.fingerprint(df.with_columns(pl.col("a") + 1))
+    assert plg.fingerprint(df) != plg.fingerprint(
+        df.with_columns(pl.col("a").cast(pl.Int32))
+    )
+
+
+def test_verdict_cache_does_not_run_checks_again():
+    calls = []
+
+    def counted_unique(data, columns):
+        calls.append(columns)
+        return plg.unique(data, columns)
+
+    cache = plg.VerdictCache()
+    df = pl.DataFrame({"a": [1, 1], "b": [1, 2]})
+
+    assert df.pipe(cache(counted_unique, columns="b")) is df
+    assert df.clone().pipe(cache(counted_unique, columns="b")).equals(df)
+    for _ in range(2):
+        with pytest.raises(plg.PolarsAssertError) as error:
+            df.pipe(cache(counted_unique, columns="a"))
+        assert error.value.df.height == 2
+
+    assert calls == ["b", "a"]
+    assert len(cache) == 2
+
+
+def test_verdict_cache_keys_reference_frames_by_content():
+    cache = plg.VerdictCache(maxsize=1)
+    df = pl.DataFrame({"a": [1, 2]})
+
+    df.pipe(cache(plg.has_valid_foreign_keys, {"a": pl.DataFrame({"a": [1, 2]})}))
+    with pytest.raises(plg.PolarsAssertError):
+        df.pipe(cache(plg.has_valid_foreign_keys, {"a": pl.DataFrame({"a": [1]})}))
+    assert len(cache) == 1
+
+
+def test_verdict_cache_hits_checks_built_again_with_expressions():
+    cache = plg.VerdictCache()
+    df = pl.DataFrame({"a": [1, 2]})
+
+    for _ in range(10):
+        df.pipe(cache(plg.custom_check, pl.col("a") >= 0))
+        df.pipe(cache(plg.custom_check, expression=pl.col("a") < 10))
+    assert len(cache) == 2
+
+
+def test_verdict_cache_keys_series_by_content():
+    cache = plg.VerdictCache()
+    df = pl.DataFrame({"a": [50]})
+    accepted = pl.Series(range(100))
+
+    df.pipe(cache(plg.accepted_values, {"a": accepted}))
+    with pytest.raises(plg.PolarsAssertError):
+        df.pipe(cache(plg.accepted_values, {"a": accepted.set(accepted == 50, -1)}))
+    assert len(cache) == 2
+
+
+def test_verdict_cache_runs_checks_without_content_key():
+    class Limit:
+        def __init__(self, value: int) -> None:
+            self.value = value
+
+    calls = []
+
+    def below(data, limit):
+        calls.append(limit.value)
+        return plg.custom_check(data, pl.col("a") < limit.value)
+
+    cache = plg.VerdictCache()
+    df = pl.DataFrame({"a": [1, 2]})
+    df.pipe(cache(below, limit=Limit(3)))
+    with pytest.raises(plg.PolarsAssertError):
+        df.pipe(cache(below, limit=Limit(2)))
+
+    assert calls == [3, 2]
+    assert len(cache) == 0
@@ -0,0 +1,49 @@
+from functools import partial
+
+import polars as pl
+import pytest
+
+import pelage as plg
+
+CHECKS = [
+    partial(plg.accepted_range, items={"a": (0, 2)}),
+    partial(plg.accepted_values, items={"b": ["x", "y"]}),
+    partial(plg.has_no_nulls),
+    partial(plg.unique, columns="a"),
+]
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_compiled_validator_returns_valid_batches(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    validate = plg.compile_checks(CHECKS)
+    batch = frame({"a": [1, 2], "b": ["x", "y"]})
+    assert batch.pipe(validate) is batch
+
+
+@pytest.mark.parametrize(
+    "batch",
+    [
+        pl.DataFrame({"a": [1, 5], "b": ["x", "y"]}),
+        pl.DataFrame({"a": [1, 2], "b": ["x", "z"]}),
+        pl.DataFrame({"a": [1, 2], "b": ["x", None]}),
+        pl.DataFrame({"a": [1, 1], "b": ["x", "y"]}),
+    ],
+)
+def test_compiled_validator_raises_the_error_of_the_check(batch: pl.DataFrame):
+    validate = plg.compile_checks(CHECKS)
+
+    with pytest.raises(plg.PolarsAssertError) as compiled_error:
+        validate(batch)
+    with pytest.raises(plg.PolarsAssertError) as check_error:
+        for check in CHECKS:
+            check(batch)
+
+    assert str(compiled_error.value) == str(check_error.value)
+
+
+def test_compiled_validator_checks_every_row_of_sampled_checks():
+    validate = plg.compile_checks([partial(plg.has_no_nulls, sample=0.01)])
+    with pytest.raises(plg.PolarsAssertError):
+        validate(pl.DataFrame({"a": [1] * 999 + [None]}))
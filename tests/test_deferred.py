@@ -0,0 +1,78 @@
+import polars as pl
+import pytest
+
+import pelage as plg
+from pelage.utils import _has_sufficient_polars_version
+
+requires_recent_polars = pytest.mark.skipif(
+    not _has_sufficient_polars_version("1.30.0"),
+    reason="errors of map_batches reach the caller since polars 1.30.0",
+)
+
+
+@requires_recent_polars
+def test_defer_does_not_run_check_before_collect():
+    lf = pl.LazyFrame({"a": [1, 2, 5]})
+    deferred = lf.pipe(plg.defer(plg.accepted_range, {"a": (0, 2)}))
+
+    with pytest.raises(plg.PolarsAssertError):
+        deferred.collect()
+
+
+@requires_recent_polars
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_defer_returns_data_when_check_passes(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame({"a": [1, 2, 3]})
+    result = given_df.pipe(plg.defer(plg.unique, "a")).collect()
+    assert result.equals(pl.DataFrame({"a": [1, 2, 3]}))
+
+
+@requires_recent_polars
+def test_defer_validates_rows_filtered_out_afterwards():
+    lf = pl.LazyFrame({"a": [1, 1, 2]})
+    deferred = lf.pipe(plg.defer(plg.unique, "a")).filter(pl.col("a") == 2)
+
+    with pytest.raises(plg.PolarsAssertError):
+        deferred.collect()
+
+
+@requires_recent_polars
+def test_defer_raises_during_sink(tmp_path):
+    lf = pl.LazyFrame({"a": [1, None]})
+    deferred = lf.pipe(plg.defer(plg.has_no_nulls))
+
+    with pytest.raises(plg.PolarsAssertError):
+        deferred.sink_parquet(tmp_path / "result.parquet")
+
+
+@pytest.mark.skipif(
+    _has_sufficient_polars_version("1.30.0"), reason="requires polars < 1.30.0"
+)
+def test_defer_needs_recent_polars():
+    with pytest.raises(NotImplementedError, match="polars >= 1.30.0"):
+        plg.defer(plg.has_no_nulls)
+
+
+@requires_recent_polars
+def test_defer_only_reads_columns_of_the_check_and_downstream():
+    plugins = pytest.importorskip("polars.io.plugins")
+    data = pl.DataFrame({"a": [1, 5], "b": [1, 2], "c": [0, 0]})
+    scans = []
+
+    def scan_data(with_columns, *_):
+        scans.append(with_columns)
+        yield data if with_columns is None else data.select(with_columns)
+
+    source = plugins.register_io_source(scan_data, schema=data.schema)
+    deferred = source.pipe(plg.defer(plg.accepted_range, {"a": (0, 2)}))
+
+    with pytest.raises(plg.PolarsAssertError):
+        deferred.select("b").collect()
+    assert sorted(scans[-1]) == ["a", "b"]
+
+    # Other checks, or checks selecting columns by dtype, still read every column
+    deferred = source.pipe(plg.defer(plg.has_no_nulls, pl.Int64))
+    assert deferred.select("b").collect().columns == ["b"]
+    assert scans[-1] is None or sorted(scans[-1]) == ["a", "b", "c"]
@@ -0,0 +1,88 @@
+from datetime import date
+from functools import partial
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+import pelage as plg
+
+
+@pytest.fixture
+def dataset(tmp_path: Path) -> Path:
+    pl.DataFrame(
+        {
+            "date": [date(2024, 1, 1)] * 3 + [date(2024, 1, 2)] * 2,
+            "id": [1, 2, 2, 1, 3],
+            "value": [1, 1, 1, 1, 2],
+        }
+    ).write_parquet(tmp_path, partition_by="date")
+    return tmp_path
+
+
+def test_validate_partitioned_runs_grouped_checks_per_partition(dataset: Path):
+    checks = [
+        partial(plg.unique, columns="id", group_by="date"),
+        partial(plg.not_constant, columns="value", group_by="date"),
+        partial(plg.has_shape, shape=(2, None), group_by="date"),
+        partial(plg.at_least_one, columns="id", group_by="date"),
+        partial(plg.unique, columns="id"),
+    ]
+
+    results = plg.validate_partitioned(dataset, checks, max_workers=2)
+
+    assert [result.status for result in results] == [
+        "failed",
+        "failed",
+        "failed",
+        "passed",
+        "failed",
+    ]
+    assert results[0].error is not None
+    assert results[0].error.df.get_column("date").to_list() == [date(2024, 1, 1)] * 2
+
+
+def test_validate_partitioned_combines_errors_of_partitions(dataset: Path):
+    results = plg.validate_partitioned(
+        dataset, [partial(plg.has_shape, shape=(4, None), group_by="date")]
+    )
+
+    assert results[0].error is not None
+    assert results[0].error.df.sort("date").to_dict(as_series=False) == {
+        "date": [date(2024, 1, 1), date(2024, 1, 2)],
+        "len": [3, 2],
+    }
+
+
+def test_validate_partitioned_does_not_read_filtered_partitions(dataset: Path):
+    for path in (dataset / "date=2024-01-01").glob("*.parquet"):
+        path.write_bytes(b"not a parquet file")
+
+    results = plg.validate_partitioned(
+        dataset,
+        [
+            partial(plg.unique, columns="id", group_by="date"),
+            partial(plg.has_shape, shape=(2, 3)),
+        ],
+        filters=pl.col("date") == date(2024, 1, 2),
+    )
+
+    assert [result.status for result in results] == ["passed", "passed"]
+
+
+def test_validate_partitioned_without_selected_partitions(dataset: Path):
+    results = plg.validate_partitioned(
+        dataset,
+        [
+            partial(plg.unique, columns="id", group_by="date"),
+            partial(plg.has_shape, shape=(0, 3)),
+        ],
+        filters=pl.col("date") > date(2024, 1, 2),
+    )
+
+    assert [result.status for result in results] == ["passed", "passed"]
+
+
+def test_validate_partitioned_needs_parquet_files(tmp_path: Path):
+    with pytest.raises(ValueError, match="No parquet file"):
+        plg.validate_partitioned(tmp_path, [partial(plg.has_no_nulls)])
@@ -0,0 +1,122 @@
+import os
+from functools import partial
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+import pelage as plg
+
+
+def _write(path: Path, ids: list[int]) -> Path:
+    pl.DataFrame({"id": ids, "value": [float(i) for i in ids]}).write_parquet(path)
+    return path
+
+
+def _corrupt_keeping_signature(path: Path) -> None:
+    stat = path.stat()
+    path.write_bytes(b"x" * stat.st_size)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def test_validate_incremental_only_reads_new_files(tmp_path: Path):
+    first = _write(tmp_path / "first.parquet", [1, 2])
+    second = _write(tmp_path / "second.parquet", [3, 4])
+    checks = [
+        partial(plg.unique_combination_of_columns, columns=["id"]),
+        partial(
+            plg.maintains_relationships,
+            other_df=pl.DataFrame({"id": [1, 2, 3, 4, 5]}),
+            column="id",
+        ),
+        partial(plg.has_no_nulls),
+    ]
+    state = plg.ValidationState()
+
+    results = plg.validate_incremental([first, second], checks, state, processes=1)
+    assert [result.status for result in results] == ["passed", "failed", "passed"]
+
+    _corrupt_keeping_signature(first)
+    _corrupt_keeping_signature(second)
+    third = _write(tmp_path / "third.parquet", [5, 1])
+    results = plg.validate_incremental(
+        [first, second, third], checks, state, processes=1
+    )
+    assert [result.status for result in results] == ["failed", "passed", "passed"]
+
+
+def test_validate_incremental_reads_changed_files_again(tmp_path: Path):
+    first = _write(tmp_path / "first.parquet", [1, 2])
+    second = _write(tmp_path / "second.parquet", [3, 4])
+    checks = [partial(plg.unique, columns="id")]
+    state = plg.ValidationState(content_hash=True)
+
+    results = plg.validate_incremental([first, second], checks, state, processes=1)
+    assert results[0].status == "passed"
+
+    _write(second, [3, 1])
+    results = plg.validate_incremental([first, second], checks, state, processes=1)
+    assert results[0].status == "failed"
+
+    results = plg.validate_incremental([second], checks, state, processes=1)
+    assert results[0].status == "passed"
+    assert list(state.files) == [str(second)]
+
+
+def test_validate_incremental_keeps_summaries_of_current_checks(tmp_path: Path):
+    path = _write(tmp_path / "data.parquet", [1, 2])
+    state = plg.ValidationState()
+
+    for bound in [0, 1, 1]:
+        checks = [partial(plg.custom_check, expression=pl.col("id") >= bound)]
+        results = plg.validate_incremental([path], checks, state, processes=1)
+        assert [result.status for result in results] == ["passed"]
+        assert len(state.files[str(path)]["summaries"]) == 1
+
+    # The same checks, built again, are not read again from unchanged files
+    _corrupt_keeping_signature(path)
+    checks = [partial(plg.custom_check, expression=pl.col("id") >= 1)]
+    results = plg.validate_incremental([path], checks, state, processes=1)
+    assert [result.status for result in results] == ["passed"]
+
+
+def test_validate_incremental_keys_series_by_content(tmp_path: Path):
+    path = _write(tmp_path / "data.parquet", [50])
+    accepted = pl.Series(range(100))
+    state = plg.ValidationState()
+
+    for values, status in [
+        (accepted, "passed"),
+        (accepted.set(accepted == 50, -1), "failed"),
+    ]:
+        checks = [partial(plg.accepted_values, items={"id": values})]
+        results = plg.validate_incremental([path], checks, state, processes=1)
+        assert [result.status for result in results] == [status]
+
+
+def test_validation_state_round_trip(tmp_path: Path):
+    first = _write(tmp_path / "first.parquet", [1, 2])
+    checks = [partial(plg.column_is_within_n_std, items=("value", 3))]
+    state_path = tmp_path / "state.pkl"
+
+    state = plg.ValidationState.load(state_path)
+    assert state.files == {}
+    results = plg.validate_incremental([first], checks, state, processes=1)
+    assert results[0].status == "passed"
+    state.save(state_path)
+
+    loaded = plg.ValidationState.load(state_path)
+    assert list(loaded.files) == [str(first)]
+    assert loaded.summaries(first, loaded.signature(first))
+
+
+def test_validate_incremental_accepts_no_checks(tmp_path: Path):
+    first = _write(tmp_path / "first.parquet", [1, 2])
+    state = plg.ValidationState()
+    assert plg.validate_incremental([first], [], state, processes=1) == []
+    assert state.files == {}
+
+
+def test_validate_incremental_needs_files():
+    with pytest.raises(ValueError, match="At least one file"):
+        plg.validate_incremental([], [], plg.ValidationState())
@@ -0,0 +1,156 @@
+from functools import partial, reduce
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+import pelage as plg
+
+
+def _merged_status(check, parts: list[pl.DataFrame]) -> str:
+    merged = reduce(
+        plg.PartialResult.merge, [plg.summarize_check(part, check) for part in parts]
+    )
+    second_pass = merged.second_pass()
+    if second_pass is not None:
+        merged = reduce(
+            plg.PartialResult.merge,
+            [plg.summarize_check(part, second_pass) for part in parts],
+        )
+    return merged.verdict().status
+
+
+def _status(check, data: pl.DataFrame) -> str:
+    try:
+        check(data)
+    except plg.PolarsAssertError:
+        return "failed"
+    return "passed"
+
+
+@pytest.fixture
+def data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "group": ["x", "y", "x", "y", "x", "y", "x", "y"],
+            "a": [1, 2, None, 3, 1, 2, 3, None],
+            "b": [1, 2, 3, 4, 5, 6, 4, 8],
+            "low": [0, 2, 4, 6, 8, 10, 12, 14],
+            "high": [1, 3, 5, 7, 9, 11, 13, 16],
+            "c": [1, 1, 1, 1, 1, 1, 1, 1],
+            "v": [0.1, -0.3, 0.2, 0.0, 5.0, 0.1, -0.2, 0.3],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "check",
+    [
+        partial(plg.unique, columns="a"),
+        partial(plg.unique, columns="b", group_by="group"),
+        partial(plg.unique_combination_of_columns, columns=["group", "b"]),
+        partial(plg.not_constant, columns="c"),
+        partial(plg.not_constant, columns="a", group_by="group"),
+        partial(plg.at_least_one, columns="a", group_by="group"),
+        partial(plg.has_shape, shape=(8, 7)),
+        partial(plg.has_shape, shape=(4, None), group_by="group"),
+        partial(plg.has_mandatory_values, items={"a": [1, 2, 3]}, group_by="group"),
+        partial(plg.has_no_nulls, columns="a"),
+        partial(plg.accepted_range, items={"b": (1, 6)}),
+        partial(plg.not_null_proportion, items={"a": 0.8}),
+        partial(plg.not_null_proportion, items={"a": (0.5, 1)}, group_by="group"),
+        partial(
+            plg.maintains_relationships,
+            other_df=pl.DataFrame({"a": [1, 2, 3]}),
+            column="a",
+        ),
+        partial(plg.mutually_exclusive_ranges, low_bound="low", high_bound="high"),
+        partial(
+            plg.has_valid_foreign_keys,
+            references={"a": pl.DataFrame({"a": [1, 2]})},
+        ),
+        partial(
+            plg.has_join_cardinality,
+            other_df=pl.DataFrame({"a": [1, 2, 3]}),
+            on="a",
+            relationship="1:1",
+        ),
+        partial(plg.is_monotonic, column="b"),
+        partial(plg.is_monotonic, column="low", group_by="group"),
+        partial(plg.has_approx_cardinality, items={"a": (4, 4)}),
+        partial(plg.column_is_within_n_std, items=("v", 2)),
+        partial(plg.column_is_within_iqr, items=("v", 1.5)),
+    ],
+)
+def test_merged_partial_results_give_the_single_pass_verdict(check, data):
+    parts = [data.slice(0, 3), data.slice(3, 0), data.slice(3, 2), data.slice(5)]
+
+    assert _merged_status(check, parts) == _status(check, data)
+
+
+def test_merged_partial_results_fail_when_parts_pass():
+    check = partial(plg.unique, columns="a")
+    first = plg.summarize_check(pl.DataFrame({"a": [1, 2]}), check)
+    second = plg.summarize_check(pl.LazyFrame({"a": [2, 3]}), check)
+
+    assert first.verdict().status == "passed"
+    assert second.verdict().status == "passed"
+    result = first.merge(second).verdict()
+    assert result.status == "failed"
+    assert isinstance(result.error, plg.PolarsAssertError)
+
+
+def test_approx_cardinality_partials_stay_bounded():
+    check = partial(plg.has_approx_cardinality, items={"a": (90_000, 110_000)})
+    parts = [pl.DataFrame({"a": range(start, start + 50_000)}) for start in (0, 50_000)]
+    partial_results = [plg.summarize_check(part, check) for part in parts]
+
+    assert all(result.verdict().status == "failed" for result in partial_results)
+    merged = reduce(plg.PartialResult.merge, partial_results)
+    assert merged.verdict().status == "passed"
+    assert merged.summary.height <= 2**14
+
+
+def test_statistics_checks_need_a_second_pass():
+    check = partial(plg.column_is_within_n_std, items=("a", 2))
+    partial_result = plg.summarize_check(pl.DataFrame({"a": [1.0, 2.0]}), check)
+
+    with pytest.raises(ValueError, match="second pass"):
+        partial_result.verdict()
+    assert partial_result.second_pass() is not None
+
+
+def test_summarize_check_rejects_interval_monotony():
+    check = partial(plg.is_monotonic, column="a", interval=1)
+
+    with pytest.raises(ValueError, match="mergeable"):
+        plg.summarize_check(pl.DataFrame({"a": [1, 2]}), check)
+
+
+def test_validate_dataset_merges_files(tmp_path: Path, data: pl.DataFrame):
+    paths = [tmp_path / f"part_{position}.parquet" for position in range(3)]
+    for path, part in zip(paths, [data[:3], data[3:5], data[5:]], strict=True):
+        part.write_parquet(path)
+    checks = [
+        partial(plg.unique, columns="a"),
+        partial(plg.has_shape, shape=(8, None)),
+        partial(plg.column_is_within_n_std, items=("v", 2)),
+        partial(plg.column_is_within_n_std, items=("b", 1), group_by="group"),
+    ]
+
+    results = plg.validate_dataset(paths, checks, processes=2)
+
+    assert [result.name for result in results] == [
+        "unique",
+        "has_shape",
+        "column_is_within_n_std",
+        "column_is_within_n_std",
+    ]
+    assert [result.status for result in results] == [
+        _status(check, data) for check in checks
+    ]
+
+
+def test_validate_dataset_needs_files():
+    with pytest.raises(ValueError, match="At least one file"):
+        plg.validate_dataset([], [partial(plg.has_no_nulls)])
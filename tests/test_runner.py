@@ -0,0 +1,183 @@
+import threading
+import time
+from functools import partial
+
+import polars as pl
+import pytest
+
+import pelage as plg
+from pelage import runner
+
+
+def _slow_check(data, duration: float):
+    time.sleep(duration)
+    return data
+
+
+def test_check_name_unwraps_partial_functions():
+    check = partial(partial(plg.unique, columns="a"), group_by="b")
+    assert runner._check_name(check) == "unique"
+    assert runner._check_name(_slow_check) == "_slow_check"
+
+
+def test_estimate_cost_puts_schema_checks_first():
+    checks = [
+        partial(plg.unique, columns="a"),
+        partial(plg.has_no_nulls),
+        partial(plg.has_columns, names="a"),
+    ]
+    ordered = sorted(checks, key=runner._estimate_cost)
+    assert [runner._check_name(check) for check in ordered] == [
+        "has_columns",
+        "has_no_nulls",
+        "unique",
+    ]
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_validate_with_budget_reports_passed_and_failed_checks(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame({"a": [1, 1], "b": [1, None]})
+    results = plg.validate_with_budget(
+        given_df,
+        [
+            partial(plg.has_no_nulls, columns="b"),
+            partial(plg.has_columns, names=["a", "b"]),
+            partial(plg.unique, columns="a"),
+        ],
+        budget=10,
+    )
+
+    assert [(result.name, result.status) for result in results] == [
+        ("has_no_nulls", "failed"),
+        ("has_columns", "passed"),
+        ("unique", "failed"),
+    ]
+    assert isinstance(results[0].error, plg.PolarsAssertError)
+    assert all(result.duration is not None for result in results)
+
+
+def test_validate_with_budget_skips_checks_beyond_deadline():
+    given_df = pl.DataFrame({"a": [1, 2]})
+    start = time.monotonic()
+    results = plg.validate_with_budget(
+        given_df,
+        [
+            partial(_slow_check, duration=2),
+            partial(plg.unique, columns="a"),
+            partial(plg.has_columns, names="a"),
+        ],
+        budget=0.3,
+    )
+    assert time.monotonic() - start < 1
+
+    # Cheap checks run first, the slow one is abandoned, unique is never started
+    assert [(result.name, result.status) for result in results] == [
+        ("_slow_check", "skipped"),
+        ("unique", "skipped"),
+        ("has_columns", "passed"),
+    ]
+
+
+def _shuffling_check(data):
+    for _ in range(30):
+        data = data.sort("a").with_columns(pl.col("a").shuffle(seed=1))
+    data.select(pl.len()).collect()
+    return data
+
+
+def test_validate_with_budget_cancels_queries_beyond_deadline():
+    given_df = pl.LazyFrame({"a": range(3_000_000)})
+    threads_before = set(threading.enumerate())
+    results = plg.validate_with_budget(given_df, [_shuffling_check], budget=0.2)
+    assert results[0].status == "skipped"
+
+    # The query takes seconds, the worker thread only stops once it is cancelled
+    time.sleep(1)
+    assert set(threading.enumerate()) <= threads_before
+
+
+def test_validate_with_budget_propagates_unexpected_errors():
+    given_df = pl.DataFrame({"a": [1, 2]})
+    with pytest.raises(ValueError):
+        plg.validate_with_budget(
+            given_df, [partial(plg.has_shape, shape=(None, None))], budget=10
+        )
+
+
+def test_estimate_cost_scales_with_columns_read():
+    given_df = pl.DataFrame({"a": [1] * 10, "b": [1] * 10, "c": [1] * 10})
+    one_column = runner._estimate_cost(partial(plg.has_no_nulls, columns="a"), given_df)
+    all_columns = runner._estimate_cost(partial(plg.has_no_nulls), given_df)
+    assert all_columns == pytest.approx(3 * one_column)
+
+
+def test_estimate_cost_prefers_past_runtimes():
+    history = plg.RuntimeHistory()
+    check = partial(plg.has_columns, names="a")
+    history.record(check, 12.0)
+    assert runner._estimate_cost(check, pl.DataFrame({"a": [1]}), history) == 12.0
+
+
+def test_runtime_history_round_trip(tmp_path):
+    path = tmp_path / "runtimes.json"
+    assert plg.RuntimeHistory.load(path).runtimes == {}
+
+    history = plg.RuntimeHistory(smoothing=0.5)
+    check = partial(plg.unique, columns="a")
+    history.record(check, 2.0)
+    history.record(check, 4.0)
+    history.save(path)
+
+    assert plg.RuntimeHistory.load(path).get(check) == 3.0
+    assert plg.RuntimeHistory.load(path).get(partial(plg.unique, columns="b")) is None
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_run_checks_fail_fast_skips_remaining_checks(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame({"a": [1, 1], "b": [1, None]})
+    checks = [
+        partial(plg.unique, columns="a"),
+        partial(plg.has_no_nulls, columns="b"),
+        partial(plg.has_columns, names=["a", "b"]),
+    ]
+
+    results = plg.run_checks(given_df, checks, fail_fast=True)
+    assert [(result.name, result.status) for result in results] == [
+        ("unique", "skipped"),
+        ("has_no_nulls", "failed"),
+        ("has_columns", "passed"),
+    ]
+
+    results = plg.run_checks(given_df, checks)
+    assert [result.status for result in results] == ["failed", "failed", "passed"]
+
+
+def test_check_key_serializes_expressions():
+    def build_check(bound: int):
+        long_condition = pl.all_horizontal(
+            pl.col(f"column_{i}") >= bound for i in range(20)
+        )
+        return partial(plg.custom_check, expression=long_condition)
+
+    assert runner._check_key(build_check(0)) == runner._check_key(build_check(0))
+    assert runner._check_key(build_check(0)) != runner._check_key(build_check(1))
+    assert "0x" not in runner._check_key(build_check(0))
+    assert runner._check_key(
+        partial(plg.unique, columns=[pl.col("a")], group_by=pl.col("b"))
+    ) == runner._check_key(
+        partial(plg.unique, columns=[pl.col("a")], group_by=pl.col("b"))
+    )
+
+
+def test_run_checks_orders_by_recorded_runtimes():
+    given_df = pl.DataFrame({"a": [1, 1]})
+    checks = [partial(plg.unique, columns="a"), partial(plg.has_no_nulls)]
+    history = plg.RuntimeHistory({runner._check_key(checks[1]): 1e6})
+
+    results = plg.run_checks(given_df, checks, fail_fast=True, history=history)
+    assert [result.status for result in results] == ["failed", "skipped"]
+    assert history.get(checks[0]) is not None
@@ -0,0 +1,43 @@
+import polars as pl
+import pytest
+from polars import testing
+
+from pelage import sampling
+
+
+@pytest.mark.parametrize("stratify_by", [None, "group"])
+def test_sample_rows_is_reproducible(stratify_by: str | None):
+    given_df = pl.DataFrame({"a": list(range(1000)), "group": ["x", "y"] * 500})
+    first = sampling._sample_rows(given_df, 0.1, stratify_by).collect()
+    second = sampling._sample_rows(given_df.lazy(), 0.1, stratify_by).collect()
+    testing.assert_frame_equal(first, second)
+
+
+def test_sample_rows_keeps_roughly_the_requested_fraction():
+    given_df = pl.DataFrame({"a": list(range(10_000))})
+    sampled = sampling._sample_rows(given_df, 0.1).collect()
+    assert 800 < sampled.height < 1200
+    assert sampled.get_column("stratum_size__").unique().to_list() == [10_000]
+
+
+def test_sample_rows_keeps_at_least_one_row_per_stratum():
+    given_df = pl.DataFrame({"a": list(range(1001)), "group": ["x"] * 1000 + ["y"]})
+    sampled = sampling._sample_rows(given_df, 0.01, "group").collect()
+    given = dict(sampled.group_by("group").len().iter_rows())
+    assert given == {"x": 10, "y": 1}
+
+
+@pytest.mark.parametrize("fraction", [0, -0.1, 1.5])
+def test_sample_rows_should_error_on_invalid_fraction(fraction: float):
+    with pytest.raises(ValueError):
+        sampling._sample_rows(pl.DataFrame({"a": [1]}), fraction)
+
+
+def test_wilson_interval_contains_the_rate():
+    low, high = sampling._wilson_interval(0.1, 1000)
+    assert low == pytest.approx(0.0829, abs=1e-4)
+    assert high == pytest.approx(0.1202, abs=1e-4)
+
+    low, high = sampling._wilson_interval(0.0, 10)
+    assert low == 0
+    assert 0 < high < 0.35
@@ -0,0 +1,76 @@
+import polars as pl
+import pytest
+from polars import testing
+
+from pelage.sketches import QuantileSketch, sketch_columns
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+@pytest.mark.parametrize("quantile", [0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0])
+def test_quantile_sketch_is_within_relative_accuracy(
+    frame: type[pl.DataFrame | pl.LazyFrame], quantile: float
+):
+    values = [(-1) ** i * i**1.5 for i in range(1, 2001)]
+    given_df = frame({"a": values})
+
+    sketch = QuantileSketch.from_data(given_df, "a", relative_accuracy=0.01)
+    expected = pl.Series(values).quantile(quantile, "lower")
+
+    assert sketch.count == 2000
+    assert sketch.quantile(quantile) == pytest.approx(expected, rel=0.01)
+
+
+def test_quantile_sketch_ignores_nulls_and_non_finite_values():
+    given_df = pl.DataFrame({"a": [0.0, None, float("inf"), float("nan"), 2.0]})
+    sketch = QuantileSketch.from_data(given_df, "a")
+    assert sketch.count == 2
+    assert sketch.quantile(0) == 0
+    assert sketch.quantile(1) == pytest.approx(2.0, rel=0.01)
+
+
+def test_quantile_sketch_of_empty_column_has_no_quantiles():
+    given_df = pl.DataFrame({"a": [None]}, schema={"a": pl.Float64})
+    sketch = QuantileSketch.from_data(given_df, "a")
+    assert sketch.quantile(0.5) is None
+    assert QuantileSketch.empty().quantile(0.5) is None
+
+
+def test_merged_sketches_are_identical_to_single_pass_sketch():
+    given_df = pl.DataFrame({"a": list(range(-50, 1000))})
+    batches = [given_df.slice(0, 300), given_df.slice(300, 500), given_df.slice(800)]
+
+    merged = QuantileSketch.empty()
+    for batch in batches:
+        merged = merged.merge(QuantileSketch.from_data(batch, "a"))
+
+    single_pass = QuantileSketch.from_data(given_df, "a")
+    testing.assert_frame_equal(
+        merged.bins, single_pass.bins, check_row_order=False, check_dtypes=False
+    )
+
+
+def test_quantile_sketch_merge_requires_same_accuracy():
+    with pytest.raises(ValueError):
+        QuantileSketch.empty(0.01).merge(QuantileSketch.empty(0.02))
+
+
+def test_sketch_columns_builds_one_sketch_per_column():
+    given_df = pl.LazyFrame({"a": [1, 2, 3], "b": [10.0, 20.0, None]})
+    sketches = sketch_columns(given_df, ["a", "b"])
+    assert {col: sketch.count for col, sketch in sketches.items()} == {"a": 3, "b": 2}
+
+
+def test_sketch_columns_scans_the_data_once():
+    plugins = pytest.importorskip("polars.io.plugins")
+    given_df = pl.DataFrame({"a": [1, 2, 3], "b": [10.0, 20.0, None], "c": [0, 0, 0]})
+    scans = []
+
+    def scan_data(with_columns, *_):
+        scans.append(with_columns)
+        yield given_df if with_columns is None else given_df.select(with_columns)
+
+    sketches = sketch_columns(
+        plugins.register_io_source(scan_data, schema=given_df.schema), ["a", "b"]
+    )
+    assert {col: sketch.count for col, sketch in sketches.items()} == {"a": 3, "b": 2}
+    assert len(scans) == 1
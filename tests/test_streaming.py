@@ -0,0 +1,114 @@
+from functools import partial
+
+import polars as pl
+import pytest
+
+import pelage as plg
+
+
+def _batches(df: pl.DataFrame, size: int) -> list[pl.DataFrame]:
+    return list(df.iter_slices(size))
+
+
+def test_streaming_is_monotonic_finds_breaks_between_batches():
+    check = plg.StreamingIsMonotonic("time")
+    first, second = _batches(pl.DataFrame({"time": [1, 2, 3, 2, 4]}), 3)
+
+    assert first.pipe(plg.is_monotonic, "time").equals(first)
+    assert second.pipe(plg.is_monotonic, "time").equals(second)
+    assert check(first) is first
+    with pytest.raises(plg.PolarsAssertError) as error:
+        check(second)
+    assert error.value.df.to_dict(as_series=False) == {
+        "time": [3, 2],
+        "_from_previous_batch": [True, False],
+    }
+
+
+def test_streaming_is_monotonic_carries_one_value_per_group():
+    check = plg.StreamingIsMonotonic("time", strict=False, group_by="group")
+    batches = [
+        pl.DataFrame({"group": ["a", "b", "a"], "time": [1, 5, 2]}),
+        pl.LazyFrame({"group": ["a", "a"], "time": [2, 3]}),
+        pl.DataFrame({"group": ["b"], "time": [6]}),
+    ]
+
+    for batch in batches:
+        check(batch)
+    assert check.carry is not None
+    assert check.carry.to_dict(as_series=False) == {
+        "group": ["a", "b"],
+        "time": [3, 6],
+    }
+
+    with pytest.raises(plg.PolarsAssertError):
+        check(pl.DataFrame({"group": ["b"], "time": [4]}))
+    check.reset()
+    check(pl.DataFrame({"group": ["b"], "time": [4]}))
+
+
+def test_streaming_mutually_exclusive_ranges_finds_overlaps_between_batches():
+    check = plg.StreamingMutuallyExclusiveRanges("start", "end", group_by="group")
+    check(pl.DataFrame({"group": ["a", "b"], "start": [1, 1], "end": [4, 2]}))
+    check(pl.DataFrame({"group": ["b"], "start": [3], "end": [5]}))
+
+    with pytest.raises(plg.PolarsAssertError) as error:
+        check(pl.DataFrame({"group": ["a", "b"], "start": [4, 6], "end": [5, 7]}))
+    assert error.value.df.to_dict(as_series=False) == {
+        "group": ["a", "a"],
+        "start": [1, 4],
+        "end": [4, 5],
+        "_from_previous_batch": [True, False],
+    }
+
+
+def test_validate_stream_combines_batches_for_global_checks():
+    df = pl.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 2],
+            "time": [1, 2, 3, 2, 5],
+            "category": ["a", "a", "b", None, "a"],
+        }
+    )
+    checks = [
+        partial(plg.unique, columns="id"),
+        partial(plg.has_mandatory_values, items={"category": ["a", "b"]}),
+        partial(plg.has_no_nulls, columns="category"),
+        partial(plg.accepted_range, items={"id": (1, 4)}, sample=0.1),
+        partial(plg.is_monotonic, column="time"),
+        partial(plg.has_shape, shape=(5, None)),
+    ]
+
+    results = plg.validate_stream(df.iter_slices(2), checks)
+
+    assert [result.status for result in results] == [
+        "failed",
+        "passed",
+        "failed",
+        "passed",
+        "failed",
+        "passed",
+    ]
+    assert results[2].error is not None
+    assert results[2].error.df.height == 1
+
+
+@pytest.mark.skipif(
+    not hasattr(pl.LazyFrame, "collect_batches"), reason="requires collect_batches"
+)
+def test_validate_stream_runs_lazyframes_with_the_streaming_engine():
+    lf = pl.LazyFrame({"a": range(100)})
+
+    results = plg.validate_stream(
+        lf, [partial(plg.unique, columns="a"), partial(plg.has_shape, shape=(100, 1))]
+    )
+
+    assert [result.status for result in results] == ["passed", "passed"]
+
+
+def test_validate_stream_rejects_checks_needing_a_second_pass():
+    with pytest.raises(ValueError, match="second pass"):
+        plg.validate_stream(
+            [pl.DataFrame({"a": [1.0]})],
+            [partial(plg.column_is_within_n_std, items=("a", 2))],
+        )
@@ -0,0 +1,129 @@
+from functools import partial
+
+import polars as pl
+import pytest
+
+import pelage as plg
+from pelage.violations import _HAS_LAZY_SINKS
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pl.LazyFrame])
+def test_flag_violations_sets_one_bit_per_rule(
+    frame: type[pl.DataFrame | pl.LazyFrame],
+):
+    given_df = frame(
+        {
+            "a": [1.0, 5.0, float("inf"), None],
+            "b": ["x", "y", "x", "z"],
+        }
+    )
+    rules = [
+        partial(plg.accepted_values, items={"b": ["x", "y"]}),
+        partial(plg.not_accepted_values, items={"b": ["y"]}),
+        partial(plg.accepted_range, items={"a": (0, 2)}),
+        partial(plg.has_no_nulls, columns="a"),
+        partial(plg.has_no_infs, columns="a"),
+        partial(plg.custom_check, expression=pl.col("b") != "x"),
+    ]
+
+    result = given_df.pipe(plg.flag_violations, rules, name="bits")
+
+    assert result.lazy().collect().get_column("bits").to_list() == [
+        0b100000,
+        0b000110,
+        0b110100,
+        0b001001,
+    ]
+    assert result.lazy().collect_schema()["bits"] == pl.UInt64
+
+
+def test_flag_violations_can_be_filtered_per_rule():
+    given_df = pl.DataFrame({"a": [1, None, 3]})
+    rules = [
+        partial(plg.has_no_nulls, columns="a"),
+        partial(plg.accepted_values, items={"a": [1, 2]}),
+    ]
+    flagged = given_df.pipe(plg.flag_violations, rules)
+
+    assert flagged.filter(pl.col("violations") & 2 != 0).get_column("a").to_list() == [
+        3
+    ]
+
+
+def test_flag_violations_rejects_non_row_level_checks():
+    with pytest.raises(ValueError, match="row-level"):
+        plg.flag_violations(
+            pl.DataFrame({"a": [1]}), [partial(plg.unique, columns="a")]
+        )
+
+
+def test_flag_violations_rejects_more_than_64_rules():
+    rules = [partial(plg.has_no_nulls, columns="a")] * 65
+    with pytest.raises(ValueError, match="64"):
+        plg.flag_violations(pl.DataFrame({"a": [1]}), rules)
+
+
+def _counting_source(calls: list) -> pl.LazyFrame:
+    def count_call(series: pl.Series) -> pl.Series:
+        calls.append(1)
+        return series
+
+    return pl.LazyFrame({"a": [1, 2, 5, None]}).with_columns(
+        pl.col("a").map_batches(count_call, return_dtype=pl.Int64)
+    )
+
+
+@pytest.mark.skipif(not _HAS_LAZY_SINKS, reason="requires sinks with lazy=True")
+def test_validate_and_write_splits_rows_in_a_single_pass(tmp_path):
+    calls: list = []
+    rules = [
+        partial(plg.accepted_range, items={"a": (0, 2)}),
+        partial(plg.has_no_nulls, columns="a"),
+    ]
+
+    report = plg.validate_and_write(
+        _counting_source(calls),
+        rules,
+        tmp_path / "valid.parquet",
+        tmp_path / "quarantine.parquet",
+        raise_on_failure=False,
+    )
+
+    assert len(calls) == 1
+    assert report.to_dict(as_series=False) == {
+        "rule": ["accepted_range", "has_no_nulls"],
+        "n_violations": [1, 1],
+    }
+    assert pl.read_parquet(tmp_path / "valid.parquet").equals(
+        pl.DataFrame({"a": [1, 2]})
+    )
+    quarantine = pl.read_parquet(tmp_path / "quarantine.parquet")
+    assert quarantine.get_column("reasons").to_list() == [
+        ["accepted_range"],
+        ["has_no_nulls"],
+    ]
+
+
+def test_validate_and_write_raises_after_writing(tmp_path):
+    with pytest.raises(plg.PolarsAssertError, match="1 rows failed"):
+        plg.validate_and_write(
+            pl.DataFrame({"a": [1, None]}),
+            [partial(plg.has_no_nulls)],
+            tmp_path / "valid.parquet",
+            tmp_path / "quarantine.parquet",
+        )
+    assert pl.read_parquet(tmp_path / "valid.parquet").height == 1
+    assert pl.read_parquet(tmp_path / "quarantine.parquet").get_column(
+        "reasons"
+    ).to_list() == [["has_no_nulls"]]
+
+
+def test_validate_and_write_passes_on_valid_data(tmp_path):
+    report = plg.validate_and_write(
+        pl.DataFrame({"a": [1, 2]}),
+        [partial(plg.has_no_nulls)],
+        tmp_path / "valid.parquet",
+        tmp_path / "quarantine.parquet",
+    )
+    assert report.get_column("n_violations").to_list() == [0]
+    assert pl.read_parquet(tmp_path / "quarantine.parquet").is_empty()